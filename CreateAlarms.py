@@ -8,11 +8,9 @@
 #####################################################################################################################################################
 # Dependencies
 #####################################################################################################################################################
-import os, re, sys
+import os, re, sys, time, io, hashlib, itertools, copy
 import xml.etree.ElementTree as et
-from PyQt5.QtCore import *
-from PyQt5.QtGui import *
-from PyQt5.QtWidgets import *
+import xml.parsers.expat as expat
 import pickle
 
 #####################################################################################################################################################
@@ -38,6 +36,9 @@ DEFAULT_GUI_COLOR = {"WindowBorderStandard": "#111111",
 gSizeRatio = 1
 gAdjustedGuiSize = {}
 
+# Default user settings, settings saved with different keys are replaced by them
+DEFAULT_USER_DATA = {"Configuration": "", "Enable": False, "Debug": False, "UpdateTmx": True, "UpdateMpConfig": True, "UpdateProgram": True, "TmxName": "Alarms", "MpConfigName": "AlarmsCfg", "MpLink": "gAlarmXCore", "ProgramName": "Alarms", "MaxNesting": 15, "AlarmKeyword": {"Error": "Error", "Warning": "Warning", "Info": "Info"}, "AlarmTable": False, "AlarmNames": False, "PackedFlags": False, "ChangeGuard": False, "TimeSlices": 1, "ErrorsEveryCycle": True, "ShardFiles": False, "SeverityProgram": {"Error": "", "Warning": "", "Info": ""}}
+
 MODE_PREBUILD = 0
 MODE_CONFIGURATION = 1
 MODE_ERROR = 2
@@ -46,6 +47,31 @@ LANGUAGE_ST = 1
 EXTENSIONS = [".c", ".st"]
 PERMITTED_TYPES_OF_ARRAY_CONSTANTS = ["USINT", "SINT", "UINT", "INT", "UDINT", "DINT"]
 
+# Project file indexes (one per indexed directory), created once per run by GetFileIndex
+gFileIndexes = {}
+
+# Files written in the current run
+gUpdatedFiles = []
+
+# Data cached between runs, each cache has data loaded from the previous run and data collected in the current run
+	# index: Directory listings used by file indexes, reused for directories that have not been modified
+	# hash: Content hashes of files, reused for files that have not been modified
+	# parse: Parsed global .var and .typ files, reused for files with unchanged content hash
+	# fingerprint: Fingerprint of all inputs and generated files of the last successful run and programs with generated alarms
+gCaches = {"index": {"Previous": {}, "Current": {}}, "hash": {"Previous": {}, "Current": {}}, "parse": {"Previous": {}, "Current": {}}, "fingerprint": {"Previous": {}, "Current": {}}}
+
+# Cached data are invalidated when the script version or the version of their format changes
+CACHE_VERSION = 1
+
+# Files are read and copied in chunks of this size
+FILE_CHUNK_SIZE = 1048576
+
+# Directories and files modified less than 2 s before they were read are read again in the next run (FAT and network drives have 2 s time resolution)
+TIME_RESOLUTION = 2000000000
+
+# Number of alarm instances above which the user is warned before the files are generated
+WARNING_ALARM_INSTANCES = 1000000
+
 # Validity ranges
 RANGE_UDINT = [0, 4294967295]
 RANGE_REAL = [-3.4E38, 3.4E38]
@@ -105,6 +131,9 @@ PATTERN_MEMBER = r"([a-zA-Z0-9_]{1,32}).*?ARRAY\[([a-zA-Z0-9_-]+)..([a-zA-Z0-9_-
 	# 2. Value
 PATTERN_PAIR = r"([a-zA-Z0-9.]+)[ ]*?=[ ]*?([a-zA-Z0-9.:-]+|\"[^;]+\")"
 
+# Pattern for XML tag (attribute values may contain character >)
+PATTERN_TAG = rb"<[^\"'>]*(?:(?:\"[^\"]*\"|'[^']*')[^\"'>]*)*>"
+
 # Patterns for global variables and constants parsing
 	# Matches VAR sections, returns 3 groups:
 	# 1. VAR RETAIN section
@@ -132,6 +161,14 @@ PATTERN_CONSTANT = r"([a-zA-Z0-9_]+)\s{0,}:\s{0,}([a-zA-Z0-9_]+)\s{0,}:=\s{0,}([
 	# 1. Inner constant name
 PATTERN_CONSTANT_VALUE = r"([a-zA-Z][a-zA-Z0-9_]{0,})"
 
+# Syntax of generated alarm set/reset code, indexed by program language
+	# Statements: Lines of each statement kind, every line is indented to the depth of the statement
+	# Expressions: Format of each expression kind
+SYNTAX_STATEMENTS = [{"For": ["for ({0} = {1}; {0} <= {2}; {0}++)", "{{"], "If": ["if ({0})", "{{"], "ElseIf": ["}}", "else if ({0})", "{{"], "Else": ["}}", "else", "{{"], "EndIf": ["}}"], "EndFor": ["}}"], "Call": ["{0}({1});"], "Assign": ["{0}\t= {1};"], "Access": ["{0} = (BOOL*){1};"], "Result": ["{0}\t= {1}({2});"], "Declare": ["void {0}(void);"], "Action": ["{0}();"]},
+					 {"For": ["FOR {0} := {1} TO {2} DO"], "If": ["IF {0} THEN"], "ElseIf": ["ELSIF {0} THEN"], "Else": ["ELSE"], "EndIf": ["END_IF"], "EndFor": ["END_FOR"], "Call": ["{0}({1});"], "Assign": ["{0}\t:= {1};"], "Access": ["{0} ACCESS {1};"], "Result": ["{0}\t:= {1}({2});"], "Declare": [], "Action": ["{0};"]}]
+SYNTAX_EXPRESSIONS = [{"Var": "{0}", "Link": "&{0}", "Adr": "(UDINT)&{0}", "AdrString": "(UDINT)\"{0}\"", "String": "\"{0}\"", "SizeOf": "sizeof({0})", "False": "0", "True": "1", "Deref": "*{0}", "Not": "!{0}", "NotEqual": "{0} != {1}", "Equal": "{0} == {1}", "Greater": "{0} > {1}", "Less": "{0} < {1}", "NotZero": "{0} != 0", "Differs": "brsmemcmp((UDINT)&{0}, (UDINT)&{1}, sizeof({0})) != 0", "Masked": "({0} & {1}) != 0", "SetBits": "{0} | {1}", "ClearBits": "{0} & ~{1}", "Xor": "{0} ^ {1}", "ShiftLeft": "{0} << 1"},
+					  {"Var": "{0}", "Link": "{0}", "Adr": "ADR({0})", "AdrString": "ADR('{0}')", "String": "'{0}'", "SizeOf": "SIZEOF({0})", "False": "FALSE", "True": "TRUE", "Deref": "{0}", "Not": "NOT {0}", "NotEqual": "({0} <> {1})", "Equal": "({0} = {1})", "Greater": "({0} > {1})", "Less": "({0} < {1})", "NotZero": "{0} <> 0", "Differs": "brsmemcmp(ADR({0}), ADR({1}), SIZEOF({0})) <> 0", "Masked": "({0} AND {1}) <> 0", "SetBits": "{0} OR {1}", "ClearBits": "{0} AND NOT {1}", "Xor": "{0} XOR {1}", "ShiftLeft": "SHL({0}, 1)"}]
+
 #####################################################################################################################################################
 # Class definitions
 #####################################################################################################################################################
@@ -151,1884 +188,2828 @@ class Node(object):
 	def find(self, key):
 		return next(iter([node for node in self.children if node.key == key]), None)
 
-# Main GUI window
-class MainWindow(QWidget):
-	# Initialization of the window
-	def __init__(Self):
-		super(MainWindow, Self).__init__()
-
-		# Window functions
-		Self.CreateGlobalWidgets()
-		Self.CreateFormWidgets()
-		Self.CreateActions()
+# Copies parts of source file to target file, whitespace at the end of the last copied line is held back until something else is written
+class FileCopier(object):
+	def __init__(Self, Source, Target):
+		Self.Source = Source
+		Self.Target = Target
+		Self.Position = 0
+		Self.Indentation = b""
+		Self.LineStart = True
+
+		# New lines use the same line ending as the first line of the source file
+		FirstLines = Source.peek(FILE_CHUNK_SIZE)
+		LineEnd = FirstLines.find(b"\n")
+		if LineEnd == -1:
+			Self.Newline = os.linesep.encode()
+		elif FirstLines[LineEnd - 1:LineEnd] == b"\r":
+			Self.Newline = b"\r\n"
+		else:
+			Self.Newline = b"\n"
+
+	# Write data after the held back whitespace
+	def Write(Self, Data):
+		Self.Target.write(Self.Indentation + Data)
+		Self.Indentation = b""
+		if Data:
+			Self.LineStart = Data.endswith(b"\n")
+
+	# Write lines in front of the held back whitespace
+	def WriteLines(Self, Data):
+		if Data:
+			if not Self.LineStart:
+				Data = Self.Newline + Data
+			Self.Target.write(Data)
+			Self.LineStart = True
+
+	# Copy source file up to offset (or to its end if offset is None)
+	def CopyTo(Self, Offset):
+		while (Offset == None) or (Self.Position < Offset):
+			Data = Self.Source.read(FILE_CHUNK_SIZE if Offset == None else min(Offset - Self.Position, FILE_CHUNK_SIZE))
+			if Data == b"":
+				break
+			Self.Position += len(Data)
+			LineEnd = Data.rfind(b"\n") + 1
+			if (Data[LineEnd:].strip() == b"") and ((LineEnd > 0) or Self.LineStart):
+				if LineEnd > 0:
+					Self.Write(Data[:LineEnd])
+				Self.Indentation += Data[LineEnd:]
+			else:
+				Self.Write(Data)
 
-		# Show window
-		ShowAdjusted(Self)
+	# Skip source file up to offset
+	def SkipTo(Self, Offset):
+		while Self.Position < Offset:
+			Data = Self.Source.read(min(Offset - Self.Position, FILE_CHUNK_SIZE))
+			if Data == b"":
+				break
+			Self.Position += len(Data)
 
-	# Global widgets of the window
-	def CreateGlobalWidgets(Self):
-		# Set frameless window
-		Self.setWindowFlags(Self.windowFlags() | Qt.FramelessWindowHint)
-		Self.setWindowTitle(WINDOW_TITLE)
+	# Read tag starting at the current position without copying it
+	def ReadTag(Self):
+		Match = re.match(PATTERN_TAG, Self.Source.peek(FILE_CHUNK_SIZE))
+		if Match:
+			Tag = Self.Source.read(Match.end())
+		else:
+			# Tag continues behind the read buffer
+			Tag = b""
+			Quote = None
+			while Quote or not Tag.endswith(b">"):
+				Char = Self.Source.read(1)
+				if Char == b"":
+					break
+				if Quote:
+					if Char == Quote:
+						Quote = None
+				elif Char in (b"\"", b"'"):
+					Quote = Char
+				Tag += Char
+		Self.Position += len(Tag)
+		return Tag
+
+	# Skip whitespace up to the end of the current line, held back whitespace is dropped together with the line
+	def SkipLineEnd(Self):
+		while Self.Source.peek(1)[:1] in (b" ", b"\t", b"\r"):
+			Self.Position += len(Self.Source.read(1))
+		if Self.Source.peek(1)[:1] == b"\n":
+			Self.Position += len(Self.Source.read(1))
+			Self.Indentation = b""
 
-		# Create title bar
-		Self.TitleBar = TitleBar(Self, WINDOW_TITLE, DEFAULT_GUI_COLOR["WindowBorderStandard"], True, True, True)
-		Self.setContentsMargins(0, Self.TitleBar.height(), 0, 0)
+#####################################################################################################################################################
+# Global functions
+#####################################################################################################################################################
+# Terminates the script
+def TerminateScript():
+	# Ouput window message
+	print("--------------------------------- End of the script CreateAlarms ---------------------------------")
+	sys.exit()
 
-		# Create bottom button bar
-		Self.BottomBar = BottomBar(Self)
-		
-		# Create info dialog to inform the user
-		Self.InfoD = InfoDialog()
+# Debug printing
+def DebugPrint(Message, Data):
+	if UserData["Debug"]: print(">> " + Message + " >> " + str(Data) + "\n")
 
-		# Adjust window size
-		Self.resize(800, Self.TitleBar.height())
-		Self.setMaximumSize(1920, 1080)
+# Finds file in directory and subdirectories, returns path to the FIRST found file and terminates script if file does not found and termination is required
+# If *.extension FileName input (i.e. *.var) is specified, returns list of all occurrences of this extension
+def FindFilePath(SourcePath, FileName, Terminate):
+	FileIndex, Prefix = GetFileIndex(SourcePath)
+	if "*" in FileName:
+		FilePath = [Path for Path in FileIndex["Extensions"].get(FileName[1:], []) if Path.startswith(Prefix)]
+	else:
+		FilePath = next((Path for Path in FileIndex["Names"].get(FileName, []) if Path.startswith(Prefix)), "")
+	if (FilePath == "" or FilePath == []) and Terminate:
+		print("Error: File " + FileName + " does not exist.")
+		TerminateScript()
+	return FilePath
 
-		# Set window styles
-		Style = """
-		QWidget {
-			background-color: >>Background<<;
-			color: >>ColorInput<<;
-			font: >>Font<<px ">>StandardFont<<";
-		}
+# Returns file index containing SourcePath and prefix of paths belonging to SourcePath (subdirectories of already indexed directories are not indexed again)
+def GetFileIndex(SourcePath):
+	if SourcePath in gFileIndexes:
+		return gFileIndexes[SourcePath], ""
+	for IndexedPath in gFileIndexes:
+		if SourcePath.startswith(os.path.join(IndexedPath, "")):
+			return gFileIndexes[IndexedPath], os.path.join(SourcePath, "")
+	gFileIndexes[SourcePath] = CreateFileIndex(SourcePath)
+	return gFileIndexes[SourcePath], ""
+
+# Walks through directory and subdirectories in one pass and indexes all files by name and extension
+def CreateFileIndex(SourcePath):
+	"""
+	Creates index of all files in SourcePath, paths are in the same order as os.walk returns them.
 
-		QGroupBox {
-			border: 2px solid >>WindowBorderStandard<<;
-			border-top: 0px;
-		}
+	FileIndex {
+		Names: {FileName: [FilePath]}
+		Extensions: {Extension: [FilePath]}
+	}
+	"""
+	FileIndex = {"Names": {}, "Extensions": {}}
+	DirPaths = [SourcePath]
+	while DirPaths:
+		DirPath = DirPaths.pop()
+		FileNames, SubDirNames = ListDirectory(DirPath)
+		for FileName in FileNames:
+			FilePath = os.path.join(DirPath, FileName)
+			FileIndex["Names"].setdefault(FileName, []).append(FilePath)
+			FileIndex["Extensions"].setdefault(os.path.splitext(FileName)[1], []).append(FilePath)
+		# Subdirectories are walked in the order of their appearance
+		DirPaths += [os.path.join(DirPath, SubDirName) for SubDirName in reversed(SubDirNames)]
+	return FileIndex
+
+# Returns names of files and subdirectories in directory, listing of the previous run is used if the directory has not been modified since then
+def ListDirectory(DirPath):
+	try:
+		ModificationTime = os.stat(DirPath).st_mtime_ns
+	except OSError:
+		return [], []
+	Listing = gCaches["index"]["Previous"].get(DirPath)
+	if (Listing == None) or (Listing[0] != ModificationTime):
+		FileNames = []
+		SubDirNames = []
+		try:
+			Entries = list(os.scandir(DirPath))
+		except OSError:
+			Entries = []
+		for Entry in Entries:
+			try:
+				IsDirectory = Entry.is_dir()
+			except OSError:
+				IsDirectory = False
+			if IsDirectory:
+				# Symbolic links to directories are not followed (same as os.walk)
+				if not Entry.is_symlink():
+					SubDirNames.append(Entry.name)
+			else:
+				FileNames.append(Entry.name)
+		if time.time_ns() - ModificationTime < TIME_RESOLUTION:
+			ModificationTime = None
+		Listing = (ModificationTime, FileNames, SubDirNames)
+	gCaches["index"]["Current"][DirPath] = Listing
+	return Listing[1], Listing[2]
+
+# Loads cached data stored next to the user data, returns empty dictionary if the cache does not exist or belongs to another version
+def LoadCache(Extension):
+	try:
+		with open(UserDataPath + "." + Extension, "rb") as CacheFile:
+			Cache = pickle.load(CacheFile)
+		if (Cache["Version"] == (SCRIPT_VERSION, CACHE_VERSION)) and (Cache["ProjectPath"] == ProjectPath):
+			return Cache["Data"]
+	except:
+		pass
+	return {}
+
+# Loads all caches from the previous run
+def LoadCaches():
+	for Extension in gCaches:
+		gCaches[Extension]["Previous"] = LoadCache(Extension)
+		gCaches[Extension]["Current"] = {}
+
+# Stores all caches changed in the current run
+def SaveCaches():
+	for Extension in gCaches:
+		if gCaches[Extension]["Current"] != gCaches[Extension]["Previous"]:
+			SaveCache(Extension, gCaches[Extension]["Current"])
+
+# Stores cached data next to the user data
+def SaveCache(Extension, Data):
+	try:
+		with open(UserDataPath + "." + Extension, "wb") as CacheFile:
+			pickle.dump({"Version": (SCRIPT_VERSION, CACHE_VERSION), "ProjectPath": ProjectPath, "Data": Data}, CacheFile, pickle.HIGHEST_PROTOCOL)
+	except OSError:
+		print("Warning: Cache file " + UserDataPath + "." + Extension + " cannot be written.")
+
+# Encodes text the same way as a file opened in text mode does
+def EncodeText(Text, Encoding = None) -> bytes:
+	Buffer = io.BytesIO()
+	TextBuffer = io.TextIOWrapper(Buffer, encoding = Encoding)
+	TextBuffer.write(Text)
+	TextBuffer.flush()
+	TextBuffer.detach()
+	return Buffer.getvalue()
+
+# Replaces file by temporary file if their contents differ, otherwise the temporary file is removed and the file keeps its modification time
+def ReplaceFile(FilePath, TempPath):
+	Changed = os.path.getsize(FilePath) != os.path.getsize(TempPath)
+	if not Changed:
+		with open(FilePath, "rb") as File, open(TempPath, "rb") as TempFile:
+			for Chunk in iter(lambda: File.read(FILE_CHUNK_SIZE), b""):
+				if Chunk != TempFile.read(len(Chunk)):
+					Changed = True
+					break
+	if Changed:
+		os.replace(TempPath, FilePath)
+		gUpdatedFiles.append(FilePath)
+	else:
+		os.remove(TempPath)
+	return Changed
 
-		QTabWidget::pane {
-			border-top: 2px solid #222222;
-			background: rgb(245, 245, 245);
-		}
+# Writes data to file only if they differ from the current content of the file, so that unchanged files keep their modification time
+def WriteFile(FilePath, Data: bytes):
+	try:
+		with open(FilePath, "rb") as File:
+			if File.read() == Data:
+				return False
+	except OSError:
+		pass
+	with open(FilePath, "wb") as File:
+		File.write(Data)
+	gUpdatedFiles.append(FilePath)
+	return True
 
-		QTabBar::disabled {
-			color: #555555;
-		}
+# Checks if file exists and terminates script if not
+def IsFile(FilePath):
+	if not os.path.isfile(FilePath):
+		print("Error: File " + os.path.basename(FilePath) + " does not exist.")
+		TerminateScript()
+	return True
 
-		QTabBar::tab::disabled {
-			background-color: #3d3d3d;
-		}
+# Checks if directory exists and terminates script if not
+def IsDir(DirPath):
+	if not os.path.isdir(DirPath):
+		print("Error: Directory " + DirPath + " does not exist.")
+		TerminateScript()
+	return True
 
-		QTabBar::tab {
-			background-color: #353535;
-			padding: 10px;
-			margin-right: 4px;
-			margin-bottom: 4px;
-			border-radius: 12px;
-		}
+# Get project info (project name, project path, path to logical)
+def GetProjectInfo():
+	CurrentPath = os.path.dirname(os.path.abspath(__file__))
+	if (CurrentPath.find("Logical") == -1):
+		print("Error: Directory 'Logical' does not exist.")
+		ProjectName = ProjectPath = LogicalPath = ""
+	else:
+		# Get project path
+		ProjectPath = CurrentPath[:CurrentPath.find("Logical") - 1]
 
-		QTabBar::tab:selected {
-			background: #222222;
-			color: #dddddd;
-			margin-bottom: 0px;
-			border-bottom-left-radius: 0px;
-			border-bottom-right-radius: 0px;
-		}
+		# Get project name
+		ProjectName = os.path.basename(ProjectPath)
 
-		QTabBar::tab:last {
-			font: ReplaceFontSizepx "Bahnschrift SemiLight SemiConde";
-			background-color: transparent;
-			border-style: none;
-			color: #888888;
-		}
+		# Get logical path
+		LogicalPath = CurrentPath[:CurrentPath.find("Logical") + 7]
 
-		QToolTip {
-			background-color: #eedd22;
-			color: #111111;
-			font: >>TooltipFont<<px ">>StandardFont<<";
-			border: solid black 1px;
-		}
+	return ProjectName, ProjectPath, LogicalPath
 
-		QLabel {
-			background-color: >>BackgroundOutput<<;
-			color: >>ColorOutput<<;
-			padding: 5px;
-			border-radius: 8px;
-		}
+# Walk through all variables and data types and create list of alarms
+def GetAlarms(VarPaths, TypePaths):
+	"""
+	Gets Alarm list from all variables and types
 
-		QLineEdit {
-			background-color: >>BackgroundInput<<;
-			color: >>ColorInput<<;
-			border-radius: 8px;
-			padding-left: 10px;
-			height: >>WidgetHeight<<px;
-		}
+	Alarms [{
+		Variable: ""
+		Array: [Start, End]
+		Path: [{
+			Name: ""
+			Type: ""
+			Array: [Start, End]
+			Description2: ""
+			ParentType: ""
+		}]
+		Severity: ""
+		Members: 0
+		Properties: [{
+				Key: ""
+				Value: ""
+				Valid: False/True
+				Tag: ""
+		}]
+	}]
+	"""
 
-		QLineEdit:hover {
-			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #373737, stop:0.505682 #373737, stop:1 #282828);
-			color: >>ColorInput<<;
-		}
+	# Get all global variables, constants and types
+	GlobalVars, GlobalConsts = GetGlobalVars(VarPaths)
+	GlobalTypes = GetGlobalTypes(TypePaths, GlobalConsts)
 
-		QPlainTextEdit {
-			background-color: >>BackgroundInput<<;
-			color: >>ColorInput<<;
-			border-radius: 8px;
-			padding-left: 10px;
-			padding-top: 10px;
-		}
+	# Look for all types with Error/Warning/Info in name
+	AlarmTypes = set()
+	for GlobalType in GlobalTypes:
+		if (UserData["AlarmKeyword"]["Error"] in GlobalType["ParentType"]) or (UserData["AlarmKeyword"]["Warning"] in GlobalType["ParentType"]) or (UserData["AlarmKeyword"]["Info"] in GlobalType["ParentType"]):
+			AlarmTypes.add(GlobalType["ParentType"])
+	
+	# Generate all alarm paths
+	TypeGraph = GetTypeGraph(GlobalTypes)
+	AlarmPaths = GetPaths(AlarmTypes, GlobalTypes, TypeGraph)
 
-		QPlainTextEdit:hover {
-			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #373737, stop:0.505682 #373737, stop:1 #282828);
-			color: >>ColorInput<<;
-		}
+	# Add global variables to alarm paths
+	AlarmPaths = AddVarsToPaths(GlobalVars, GlobalTypes, AlarmPaths)
 
-		QPushButton {
-			background-color: >>BackgroundInput<<;
-			color: >>ColorInput<<;
-			width: >>ButtonWidth<<px;
-			height: >>WidgetHeight<<px;
-			border-style: solid;
-			border-radius: 8px;
-		}
+	# Create alarm list
+	Alarms = CreateAlarms(GlobalTypes, AlarmPaths)
 
-		QPushButton:hover {
-			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #373737, stop:0.505682 #373737, stop:1 #282828);
-			color: >>ColorInput<<;
-		}
+	# Alarm paths print
+	if UserData["Debug"]:
+		print("Paths to alarms:")
+		for Index, Alarm in enumerate(Alarms):
+			print(str(Index + 1) + ": " + str(PathToAlarm(Alarm)))
+		print("\n")
 
-		QPushButton:pressed {
-			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #2d2d2d, stop:0.505682 #282828, stop:1 #2d2d2d);
-			color: #ffffff;
-		}
+	# Parse properties of alarms
+	Alarms = ParseProperties(Alarms)
+	Alarms = SortByCode(Alarms)
 
-		QPushButton:checked {
-			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #095209, stop:1 #0e780e);
-			color:#ffffff;
-		}
+	DebugPrint("Alarms", Alarms)
 
-		QPushButton:checked:hover {
-			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #084209, stop:1 #0c660e);
-		}
+	return Alarms
 
-		QPushButton:checked:pressed {
-			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #083108, stop:1 #0d570d);
-		}
+# Get all global paths excluding private files and files from Libraries
+def GetGlobalPaths(Extension):
+	# Get path to all .Extension files
+	GlobalPaths = FindFilePath(LogicalPath, "*." + Extension, True)
 
-		QCheckBox {
-			background-color: transparent;
-			border-style: none;
-		}
+	# Remove undesirable Extension files
+	PathsToRemove = []
+	for GlobalPath in GlobalPaths:
+		FileName = os.path.basename(GlobalPath)
+		DirName = os.path.dirname(GlobalPath)
 
-		QCheckBox::indicator {
-			background-color: >>BackgroundInput<<;
-			top: 2px;
-			width: >>WidgetHeight<<px;
-			height: >>WidgetHeight<<px;
-			border-radius: 8px;
-			margin-bottom: 4px;
-		}
+		# Remove all "Libraries" files
+		if "Libraries" in GlobalPath:
+			PathsToRemove.append(GlobalPath)
 
-		QCheckBox::indicator:hover {
-			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #373737, stop:0.505682 #373737, stop:1 #282828);
-		}
+		# Remove all Private files
+		elif os.path.isfile(os.path.join(DirName, "Package.pkg")):
+			PkgPath = os.path.join(DirName, "Package.pkg")
+			PkgFile = open(PkgPath, "r")
+			for Line in PkgFile:
+				if (FileName in Line) and ("Private=\"true\"" in Line):
+					PathsToRemove.append(GlobalPath)
+		else:
+			PathsToRemove.append(GlobalPath)
 
-		QCheckBox::indicator:pressed {
-			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #2d2d2d, stop:0.505682 #282828, stop:1 #2d2d2d);
-		}
+	# Files keep order of the project, so that the order of generated alarms does not change between runs
+	PathsToRemove = set(PathsToRemove)
+	GlobalPaths = [GlobalPath for GlobalPath in GlobalPaths if GlobalPath not in PathsToRemove]
+	DebugPrint("All valid ." + Extension + " files", GlobalPaths)
 
-		QCheckBox::indicator:checked {
-			background-color: >>ColorCheckBox<<;
-		}
+	return GlobalPaths
 
-		QCheckBox::indicator:checked:hover {
-			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #084209, stop:1 #0c660e);
-		}
+# Get all global variables from VarPaths
+def GetGlobalVars(VarPaths):
+	"""
+	Parses variables and constants from all valid global .var files.
 
-		QCheckBox::indicator:checked:pressed {
-			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #083108, stop:1 #0d570d);
-		}
+	GlobalVars [{
+		Name: ""
+		Type: ""
+		Array: [Start, End]
+	}]
 
-		QComboBox {
-			background-color: >>BackgroundInput<<;
-			color: >>ColorInput<<;
-			height: >>WidgetHeight<<px;
-			border: none;
-			border-radius: 8px;
-			padding-left: 10px;
-		}
+	GlobalConsts [{
+		Name: ""
+		Type: ""
+		Value: ""
+	}]
+	"""
+	GlobalVars = []
+	GlobalConsts = []
+	for VarPath in VarPaths:
+		Vars, Consts = ParseCachedFile(VarPath, ParseVarFile)
+		for Name, Type, Array in Vars:
+			GlobalVars.append({"Name": Name, "Type": Type, "Array": list(Array) if Array != "" else ""})
+		for Name, Type, Value in Consts:
+			GlobalConsts.append({"Name": Name, "Type": Type, "Value": Value})
+	
+	GlobalConsts = GetConstsValue(GlobalConsts)
+	GlobalVars = ReplaceConstsByNums(GlobalVars, GlobalConsts)
+	DebugPrint("Global constants", GlobalConsts)
+	DebugPrint("Global variables", GlobalVars)
 
-		QComboBox:hover {
-			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #373737, stop:0.505682 #373737, stop:1 #282828);
-			color: >>ColorInput<<;
-		}
+	return GlobalVars, GlobalConsts
 
-		QComboBox::drop-down {
-			background-color: gray;
-			width: 20px;
-			border-top-right-radius: 8px;
-			border-bottom-right-radius: 8px;
-		}
+# Parse global types
+def GetGlobalTypes(TypePaths, GlobalConsts):
+	"""
+	Parses types from all valid global .typ files.
 
-		QComboBox QAbstractItemView {
-			background-color: >>BackgroundInput<<;
-			color: >>ColorInput<<;
-		}
-		"""
-		Self.setStyleSheet(FinishStyle(Style))
+	GlobalTypes [{
+		Name: ""
+		Type: ""
+		Array: [Start, End]
+		Description2: ""
+		ParentType: ""
+	}]
+	"""
+	GlobalTypes = []
+	for TypePath in TypePaths:
+		for Name, Type, Array, Description2, ParentType in ParseCachedFile(TypePath, ParseTypFile):
+			GlobalTypes.append({"Name": Name, "Type": Type, "Array": list(Array) if Array != "" else "", "Description2": Description2, "ParentType": ParentType})
+	GlobalTypes = ReplaceConstsByNums(GlobalTypes, GlobalConsts)
+	DebugPrint("Global types", GlobalTypes)
 
-		# Create main group box
-		Self.MainGB = QGroupBox(Self)
-		Self.MainGB.setGeometry(0, Self.TitleBar.height(), Self.width(), Self.height() - Self.TitleBar.height())
+	return GlobalTypes
 
-		# Create a form Layout
-		Self.LayoutFL = QFormLayout()
-		Self.LayoutFL.setHorizontalSpacing(20)
+# Parse variables and constants of one .var file
+def ParseVarFile(VarText):
+	"""
+	Returns tuples of variables and constants in order of their declaration.
 
-		# Set layout of window
-		MainVBL = QVBoxLayout(Self)
-		MainVBL.addLayout(Self.LayoutFL)
-		MainVBL.addWidget(Self.BottomBar.BottomBarGB)
+	Vars [(Name, Type, (Start, End) or "")]
+	Consts [(Name, Type, Value)]
+	"""
+	Vars = []
+	Consts = []
+	VarStructures = re.findall(PATTERN_VAR_SECTION, VarText)
+	for VarStructure in VarStructures:
+		if (VarStructure[0] != '') or (VarStructure[2] != ''):
+			if VarStructure[0] != '':
+				Matches = re.findall(PATTERN_VARIABLE, VarStructure[0])
+			else:
+				Matches = re.findall(PATTERN_VARIABLE, VarStructure[2])
+			for Var in Matches:
+				if Var[0] != '':
+					Vars.append((Var[0], Var[2], ""))
+				elif Var[3] != '':
+					Vars.append((Var[3], Var[6], (Var[4], Var[5])))
+		elif VarStructure[1] != '':
+			Matches = re.findall(PATTERN_CONSTANT, VarStructure[1])
+			for Var in Matches:
+				if Var[1] in PERMITTED_TYPES_OF_ARRAY_CONSTANTS:
+					Consts.append((Var[0], Var[1], Var[2]))
+	return Vars, Consts
+
+# Parse structure members of one .typ file
+def ParseTypFile(TypeText):
+	"""
+	Returns tuples of structure members in order of their declaration.
 
-	# Form widgets
-	def CreateFormWidgets(Self):
-		# Configuration selection
-		Self.ConfigComboBox = QComboBox()
-		Self.ConfigComboBox.addItems(ConfigName)
-		Self.ConfigComboBox.setToolTip("Select configuration with .mpalarmxcore file")
-		Self.ConfigComboBox.setCurrentText(UserData["Configuration"])
-		ConfigLabel = QLabel("Select configuration")
-		ConfigLabel.setToolTip("Select configuration with .mpalarmxcore file")
-		Self.LayoutFL.addRow(ConfigLabel, Self.ConfigComboBox)
+	Members [(Name, Type, (Start, End) or "", Description2, ParentType)]
+	"""
+	Members = []
+	TypeStructures = re.findall(PATTERN_STRUCTURE, TypeText)
+	for TypeStructure in TypeStructures:
+		for Member in re.findall(PATTERN_MEMBER, TypeStructure[1]):
+			if Member[0] != '':
+				Members.append((Member[0], Member[3], (Member[1], Member[2]), Member[5], TypeStructure[0]))
+			else:
+				Members.append((Member[6], Member[7], "", Member[9], TypeStructure[0]))
+	return Members
+
+# Returns parsed content of file, file is read and parsed again only if its content has changed since the previous run
+def ParseCachedFile(FilePath, ParseFile):
+	Hash = GetFileHash(FilePath)
+	Cached = gCaches["parse"]["Previous"].get(FilePath)
+	if (Cached != None) and (Cached["ParseFile"] == ParseFile.__name__) and (Cached["Hash"] == Hash):
+		Data = Cached["Data"]
+	else:
+		File = open(FilePath, "r")
+		Data = ParseFile(File.read())
+		File.close()
+	gCaches["parse"]["Current"][FilePath] = {"ParseFile": ParseFile.__name__, "Hash": Hash, "Data": Data}
+	return Data
+
+# Returns content hash of file (empty if file does not exist), file is read only if its size or modification time has changed since the previous run
+def GetFileHash(FilePath):
+	try:
+		Stat = os.stat(FilePath)
+	except OSError:
+		return ""
+	for Cache in (gCaches["hash"]["Current"], gCaches["hash"]["Previous"]):
+		Cached = Cache.get(FilePath)
+		if (Cached != None) and (Cached[0] == Stat.st_size) and (Cached[1] == Stat.st_mtime_ns):
+			gCaches["hash"]["Current"][FilePath] = Cached
+			return Cached[2]
+	Hash = hashlib.sha256()
+	with open(FilePath, "rb") as File:
+		for Chunk in iter(lambda: File.read(FILE_CHUNK_SIZE), b""):
+			Hash.update(Chunk)
+	ModificationTime = Stat.st_mtime_ns
+	if time.time_ns() - ModificationTime < TIME_RESOLUTION:
+		ModificationTime = None
+	gCaches["hash"]["Current"][FilePath] = (Stat.st_size, ModificationTime, Hash.hexdigest())
+	return Hash.hexdigest()
+
+# Returns fingerprint of all inputs (script, user settings, global files) and generated files
+def GetFingerprint(GlobalPaths):
+	FilePaths = [os.path.abspath(__file__)] + GlobalPaths
+	if UserData["UpdateTmx"]:
+		FilePaths.append(FindFilePath(LogicalPath, UserData["TmxName"] + ".tmx", False))
+	if UserData["UpdateMpConfig"]:
+		FilePaths.append(FindFilePath(ConfigPath, UserData["MpConfigName"] + ".mpalarmxcore", False))
+	if UserData["UpdateProgram"]:
+		for ProgramName in GetPrograms():
+			for Extension in EXTENSIONS:
+				ProgramPath = FindFilePath(LogicalPath, ProgramName + Extension, False)
+				if ProgramPath != "":
+					FilePaths.append(ProgramPath)
+					FilePaths.append(GetProgramListingPath(os.path.dirname(ProgramPath)))
+					FilePaths += GetShardPaths(os.path.dirname(ProgramPath), ProgramName)
+					FilePaths.append(FindFilePath(os.path.dirname(ProgramPath), ProgramName + ".var", False))
+					FilePaths.append(FindFilePath(os.path.dirname(ProgramPath), ProgramName + ".typ", False))
+	Inputs = [SCRIPT_VERSION, sorted(UserData.items())]
+	for FilePath in sorted(FilePaths):
+		Inputs.append((FilePath, GetFileHash(FilePath)))
+	return hashlib.sha256(repr(Inputs).encode()).hexdigest()
 
-		# Enable
-		Self.EnablePushButton = QPushButton("ENABLE")
-		Self.EnablePushButton.setToolTip("Turns on the prebuild function")
-		Self.EnablePushButton.setCheckable(True)
-		Self.EnablePushButton.setChecked(UserData["Enable"])
-		Self.EnablePushButton.setFixedHeight(50)
-		EnableLabel = QLabel("Enable prebuild")
-		EnableLabel.setToolTip("Turns on the prebuild function")
-		Self.LayoutFL.addRow(EnableLabel, Self.EnablePushButton)
+# Get value of all constants
+def GetConstsValue(Consts):
+	NotDoneConsts = []
+	DoneConstsName = []
+	DoneConstsValue = []
+	for Index, Const in enumerate(Consts):
+		try:
+			if type(Const["Value"]) == str:
+				Consts[Index]["Value"] = int(eval(Const["Value"]))
+				DoneConstsName.append(Const["Name"])
+				DoneConstsValue.append(Const["Value"])
+		except:
+			NotDoneConsts.append(Const)
+	if NotDoneConsts != []:
+		FoundZeroDoneConstants = True
+		for Index, Const in enumerate(NotDoneConsts):
+			InnerConsts = re.findall(PATTERN_CONSTANT_VALUE, Const["Value"])
+			for InnerConst in InnerConsts:
+				if InnerConst in DoneConstsName:
+					FoundZeroDoneConstants = False
+					# Consts[Find index of Const with Name in NotDoneConsts[Index]["Name"]]["Value"] = replace all InnerConst by values
+					Consts[next((index for (index, d) in enumerate(Consts) if d["Name"] == NotDoneConsts[Index]["Name"]), None)]["Value"] = re.sub(r"\b%s\b" % InnerConst, str(DoneConstsValue[DoneConstsName.index(InnerConst)]), NotDoneConsts[Index]["Value"])
+		if FoundZeroDoneConstants:
+			for NotDoneConst in NotDoneConsts:
+				InnerConsts = re.findall(PATTERN_CONSTANT_VALUE, NotDoneConst["Value"])
+				for InnerConst in InnerConsts:
+					if next((index for (index, d) in enumerate(NotDoneConsts) if d["Name"] == InnerConst), None) == None:
+						print("Error: Constant " + InnerConst + " cannot be found.")
+			TerminateScript()
+		GetConstsValue(Consts)
+		return Consts
+	else:
+		return Consts
 
-		# Debug option
-		Self.DebugPushButton = QPushButton("DEBUG")
-		Self.DebugPushButton.setToolTip("Turns on printing of debug messages")
-		Self.DebugPushButton.setCheckable(True)
-		Self.DebugPushButton.setChecked(UserData["Debug"])
-		Self.DebugPushButton.setFixedHeight(50)
-		DebugLabel = QLabel("Turn on debugging")
-		DebugLabel.setToolTip("Turns on printing of debug messages")
-		Self.LayoutFL.addRow(DebugLabel, Self.DebugPushButton)
+# Replace list["Array"] defined with onstants by numbers and convert strings to ints
+def ReplaceConstsByNums(List, GlobalConsts):
+	for Index, Member in enumerate(List):
+		if Member["Array"] != "":
+			for i in (0,1):
+				try:
+					List[Index]["Array"][i] = int(Member["Array"][i])
+				except:
+					try:
+						List[Index]["Array"][i] = GlobalConsts[next((index for (index, d) in enumerate(GlobalConsts) if d["Name"] == Member["Array"][i]), None)]["Value"]
+					except:
+						print("Error: Constant " + Member["Array"][i] + " in array of variable " + Member["Name"] + " cannot be found.")
+						TerminateScript()
+	return List
 
-		# Tmx name
-		Self.TmxNameLineEdit = QLineEdit()
-		Self.TmxNameLineEdit.setToolTip("Name of the tmx file without .tmx extension")
-		Self.TmxNameLineEdit.setText(UserData["TmxName"])
-		Self.TmxNameLineEdit.setFixedHeight(50)
-		TmxNameLabel = QLabel("Tmx name")
-		TmxNameLabel.setToolTip("Name of the tmx file without .tmx extension")
-		TmxExtensionLabel = QLabel(".tmx")
-		TmxExtensionLabel.setToolTip("Name of the tmx file without .tmx extension")
-		Self.TmxNameRow = QHBoxLayout()
-		Self.TmxNameRow.addWidget(Self.TmxNameLineEdit)
-		Self.TmxNameRow.addSpacing(10)
-		Self.TmxNameRow.addWidget(TmxExtensionLabel)
-		Self.LayoutFL.addRow(TmxNameLabel, Self.TmxNameRow)
+# Index structure members of global types by the type they belong to and by their own type
+def GetTypeGraph(GlobalTypes):
+	"""
+	Gets type graph from global types, members keep their order in GlobalTypes
 
-		# MpConfig name
-		Self.MpConfigNameLineEdit = QLineEdit()
-		Self.MpConfigNameLineEdit.setToolTip("Name of the MpConfig file without .mpalarmxcore extension (cannot be same as program name)")
-		Self.MpConfigNameLineEdit.setText(UserData["MpConfigName"])
-		Self.MpConfigNameLineEdit.setFixedHeight(50)
-		MpConfigNameLabel = QLabel("MpConfig name")
-		MpConfigNameLabel.setToolTip("Name of the MpConfig file without .mpalarmxcore extension (cannot be same as program name)")
-		MpConfigExtensionLabel = QLabel(".mpalarmxcore")
-		MpConfigExtensionLabel.setToolTip("Name of the MpConfig file without .mpalarmxcore extension (cannot be same as program name)")
-		Self.MpConfigNameRow = QHBoxLayout()
-		Self.MpConfigNameRow.addWidget(Self.MpConfigNameLineEdit)
-		Self.MpConfigNameRow.addSpacing(10)
-		Self.MpConfigNameRow.addWidget(MpConfigExtensionLabel)
-		Self.LayoutFL.addRow(MpConfigNameLabel, Self.MpConfigNameRow)
+	TypeGraph {
+		Members: {ParentType: [GlobalType]}
+		References: {Type: [GlobalType]}
+	}
+	"""
+	TypeGraph = {"Members": {}, "References": {}}
+	for GlobalType in GlobalTypes:
+		TypeGraph["Members"].setdefault(GlobalType["ParentType"], []).append(GlobalType)
+		TypeGraph["References"].setdefault(GlobalType["Type"], []).append(GlobalType)
+	return TypeGraph
+
+# Get all possible paths to alarm types (from the outermost type down to the member of alarm type)
+def GetPaths(AlarmTypes, GlobalTypes, TypeGraph):
+	# Paths leading to each type are created from paths of the types it is used in, outer types are resolved first
+	PathsAbove = {}
+	for Type in GetTypeOrder(AlarmTypes, TypeGraph):
+		Paths = []
+		for GlobalType in TypeGraph["References"].get(Type, []):
+			for ParentPath in PathsAbove[GlobalType["ParentType"]]:
+				Paths.append(ParentPath + (GlobalType,))
+		# Type which is not used in any other type is the outermost type of the path
+		if Paths == []:
+			Paths.append(())
+		PathsAbove[Type] = Paths
 
-		# MpLink name
-		Self.MpLinkLineEdit = QLineEdit()
-		Self.MpLinkLineEdit.setToolTip("Name of the alarm MpLink")
-		Self.MpLinkLineEdit.setText(UserData["MpLink"])
-		Self.MpLinkLineEdit.setFixedHeight(50)
-		MpLinkLabel = QLabel("MpLink name")
-		MpLinkLabel.setToolTip("Name of the alarm MpLink")
-		Self.MpLinkRow = QHBoxLayout()
-		Self.MpLinkRow.addWidget(Self.MpLinkLineEdit)
-		Self.MpLinkRow.addSpacing(10)
-		Self.LayoutFL.addRow(MpLinkLabel, Self.MpLinkRow)
+	AlarmPaths = []
+	for GlobalType in GlobalTypes:
+		if GlobalType["Type"] in AlarmTypes:
+			for PathAbove in PathsAbove[GlobalType["ParentType"]]:
+				AlarmPaths.append(list(PathAbove) + [GlobalType])
+	return AlarmPaths
+
+# Get all types containing alarm types ordered from the outermost ones, terminates script if types are nested recursively
+def GetTypeOrder(AlarmTypes, TypeGraph):
+	# Strongly connected components of graph where each type points to types it is used in (Tarjan's algorithm without recursion)
+	Index = {}
+	LowLink = {}
+	Stack = []
+	OnStack = set()
+	TypeOrder = []
+	Cycles = []
+	for RootType in sorted(AlarmTypes):
+		if RootType in Index:
+			continue
+		Index[RootType] = LowLink[RootType] = len(Index)
+		Stack.append(RootType)
+		OnStack.add(RootType)
+		Work = [(RootType, iter(GetParentTypes(RootType, TypeGraph)))]
+		while Work:
+			Type, ParentTypes = Work[-1]
+			for ParentType in ParentTypes:
+				if ParentType not in Index:
+					Index[ParentType] = LowLink[ParentType] = len(Index)
+					Stack.append(ParentType)
+					OnStack.add(ParentType)
+					Work.append((ParentType, iter(GetParentTypes(ParentType, TypeGraph))))
+					break
+				elif ParentType in OnStack:
+					LowLink[Type] = min(LowLink[Type], Index[ParentType])
+			else:
+				Work.pop()
+				if Work:
+					LowLink[Work[-1][0]] = min(LowLink[Work[-1][0]], LowLink[Type])
+				if LowLink[Type] == Index[Type]:
+					Component = []
+					while True:
+						ComponentType = Stack.pop()
+						OnStack.discard(ComponentType)
+						Component.append(ComponentType)
+						if ComponentType == Type:
+							break
+					if (len(Component) > 1) or (Type in GetParentTypes(Type, TypeGraph)):
+						Cycles.append(GetTypeCycle(Component, TypeGraph))
+					TypeOrder += Component
 
-		# Program name
-		Self.ProgramNameLineEdit = QLineEdit()
-		Self.ProgramNameLineEdit.setToolTip("Name of the program file without .st/.c extension (cannot be same as MpConfig name)")
-		Self.ProgramNameLineEdit.setText(UserData["ProgramName"])
-		Self.ProgramNameLineEdit.setFixedHeight(50)
-		ProgramNameLabel = QLabel("Program name")
-		ProgramNameLabel.setToolTip("Name of the program file without .st/.c extension (cannot be same as MpConfig name)")
-		ProgramExtensionLabel = QLabel(".st/.c")
-		ProgramExtensionLabel.setToolTip("Name of the program file without .st/.c extension (cannot be same as MpConfig name)")
-		Self.ProgramNameRow = QHBoxLayout()
-		Self.ProgramNameRow.addWidget(Self.ProgramNameLineEdit)
-		Self.ProgramNameRow.addSpacing(10)
-		Self.ProgramNameRow.addWidget(ProgramExtensionLabel)
-		Self.LayoutFL.addRow(ProgramNameLabel, Self.ProgramNameRow)
-
-		# Sections update
-		ProgramNameLabel = QLabel("Alarm keywords")
-		ProgramNameLabel.setToolTip("The keyword for alarms that the script will look for in data type names")
-		Self.ErrorKeywordLineEdit = QLineEdit()
-		Self.ErrorKeywordLineEdit.setToolTip("The keyword for Error alarm that the script will look for in data type names")
-		Self.ErrorKeywordLineEdit.setPlaceholderText("Error")
-		Self.ErrorKeywordLineEdit.setText(UserData["AlarmKeyword"]["Error"])
-		Self.ErrorKeywordLineEdit.setFixedHeight(50)
-		Self.WarningKeywordLineEdit = QLineEdit()
-		Self.WarningKeywordLineEdit.setToolTip("The keyword for Warning alarm that the script will look for in data type names")
-		Self.WarningKeywordLineEdit.setPlaceholderText("Warning")
-		Self.WarningKeywordLineEdit.setText(UserData["AlarmKeyword"]["Warning"])
-		Self.WarningKeywordLineEdit.setFixedHeight(50)
-		Self.InfoKeywordLineEdit = QLineEdit()
-		Self.InfoKeywordLineEdit.setToolTip("The keyword for Info alarm that the script will look for in data type names")
-		Self.InfoKeywordLineEdit.setPlaceholderText("Info")
-		Self.InfoKeywordLineEdit.setText(UserData["AlarmKeyword"]["Info"])
-		Self.InfoKeywordLineEdit.setFixedHeight(50)
-		Self.KeywordSectionRow = QHBoxLayout()
-		Self.KeywordSectionRow.addWidget(Self.ErrorKeywordLineEdit)
-		Self.KeywordSectionRow.addSpacing(10)
-		Self.KeywordSectionRow.addWidget(Self.WarningKeywordLineEdit)
-		Self.KeywordSectionRow.addSpacing(10)
-		Self.KeywordSectionRow.addWidget(Self.InfoKeywordLineEdit)
-		Self.LayoutFL.addRow(ProgramNameLabel, Self.KeywordSectionRow)
+	if Cycles != []:
+		for Cycle in Cycles:
+			print("Error: Recursive nesting in data types: " + " > ".join(Cycle) + ".")
+		TerminateScript()
+	return TypeOrder
+
+# Get types in which the type is used
+def GetParentTypes(Type, TypeGraph):
+	return [GlobalType["ParentType"] for GlobalType in TypeGraph["References"].get(Type, [])]
+
+# Get one cycle of nested types from strongly connected component, each type of the cycle contains the next one
+def GetTypeCycle(Component, TypeGraph):
+	Cycle = [Component[0]]
+	while True:
+		NextType = next(ParentType for ParentType in GetParentTypes(Cycle[-1], TypeGraph) if ParentType in Component)
+		if NextType in Cycle:
+			Cycle = Cycle[Cycle.index(NextType):] + [NextType]
+			break
+		Cycle.append(NextType)
+	Cycle.reverse()
+	return Cycle
 
-		# Sections update
-		Self.UpdateTmxCheckBox = QCheckBox("Update TMX")
-		Self.UpdateTmxCheckBox.setToolTip("The script will update the TMX file every build")
-		Self.UpdateTmxCheckBox.setFixedHeight(50)
-		Self.UpdateTmxCheckBox.setChecked(UserData["UpdateTmx"])
-		Self.UpdateMpConfigCheckBox = QCheckBox("Update MpConfig")
-		Self.UpdateMpConfigCheckBox.setToolTip("The script will update the MpAlarmXCore file every build")
-		Self.UpdateMpConfigCheckBox.setFixedHeight(50)
-		Self.UpdateMpConfigCheckBox.setChecked(UserData["UpdateMpConfig"])
-		Self.UpdateProgramCheckBox = QCheckBox("Update Set/Reset")
-		Self.UpdateProgramCheckBox.setToolTip("The script will update the .st/.c program file every build")
-		Self.UpdateProgramCheckBox.setFixedHeight(50)
-		Self.UpdateProgramCheckBox.setChecked(UserData["UpdateProgram"])
-		Self.UpdateSectionRow = QHBoxLayout()
-		Self.UpdateSectionRow.addWidget(Self.UpdateTmxCheckBox)
-		Self.UpdateSectionRow.addSpacing(10)
-		Self.UpdateSectionRow.addWidget(Self.UpdateMpConfigCheckBox)
-		Self.UpdateSectionRow.addSpacing(10)
-		Self.UpdateSectionRow.addWidget(Self.UpdateProgramCheckBox)
-		Self.LayoutFL.addRow(Self.UpdateSectionRow)
+# Add global variables to the beginning of the paths
+def AddVarsToPaths(GlobalVars, GlobalTypes, AlarmPaths):
+	# Paths are compared as tuples of member IDs, members with the same content have the same ID
+	MemberIds = {}
+	ContentIds = {}
+	PathIds = [tuple(GetMemberId(PathMember, MemberIds, ContentIds) for PathMember in AlarmPath) for AlarmPath in AlarmPaths]
 
-	# Window actions
-	def CreateActions(Self):
-		# Actions of global buttons
-		Self.BottomBar.RunPB.clicked.connect(Self.Run)
-		Self.BottomBar.OkPB.clicked.connect(Self.aGuiAccepted)
-		Self.BottomBar.CancelPB.clicked.connect(Self.close)
-		Self.InfoD.OkPB.clicked.connect(Self.close)
-		Self.InfoD.OkPB.clicked.connect(Self.InfoD.close)
+	# Positions in paths where members of each type begin
+	PathStarts = {}
+	for IndexPath, AlarmPath in enumerate(AlarmPaths):
+		for IndexMember, PathMember in enumerate(AlarmPath):
+			PathStarts.setdefault(PathMember["ParentType"], []).append((IndexPath, IndexMember))
 
-		# Actions of form widgets
-		Self.TmxNameLineEdit.textChanged.connect(lambda: Self.TextInputCheck(Self.TmxNameLineEdit))
-		Self.MpConfigNameLineEdit.textChanged.connect(lambda: Self.TextInputCheck(Self.MpConfigNameLineEdit, Self.ProgramNameLineEdit))
-		Self.ProgramNameLineEdit.textChanged.connect(lambda: Self.TextInputCheck(Self.ProgramNameLineEdit, Self.MpConfigNameLineEdit))
-		Self.ErrorKeywordLineEdit.textChanged.connect(lambda: Self.TextInputCheck(Self.ErrorKeywordLineEdit))
-		Self.WarningKeywordLineEdit.textChanged.connect(lambda: Self.TextInputCheck(Self.WarningKeywordLineEdit))
-		Self.InfoKeywordLineEdit.textChanged.connect(lambda: Self.TextInputCheck(Self.InfoKeywordLineEdit))
+	ExtendedPaths = []
+	ExtendedPathIds = set()
+	for GlobalVar in GlobalVars:
+		PathsNumber = 0
+		VarId = GetMemberId(GlobalVar, MemberIds, ContentIds)
+		for IndexPath, IndexMember in PathStarts.get(GlobalVar["Type"], []):
+			PathsNumber += 1
+			HelpPathId = (VarId,) + PathIds[IndexPath][IndexMember:]
+			if HelpPathId not in ExtendedPathIds:
+				ExtendedPathIds.add(HelpPathId)
+				HelpPath = AlarmPaths[IndexPath][IndexMember:]
+				HelpPath.insert(0, GlobalVar)
+				ExtendedPaths.append(HelpPath)
+		if PathsNumber == 0:
+			if (UserData["AlarmKeyword"]["Error"] in GlobalVar["Type"]) or (UserData["AlarmKeyword"]["Warning"] in GlobalVar["Type"]) or (UserData["AlarmKeyword"]["Info"] in GlobalVar["Type"]):
+				for GlobalType in GlobalTypes:
+					if GlobalVar["Type"] == GlobalType["ParentType"]:
+						ExtendedPaths.append([GlobalVar])
+						break
+	return ExtendedPaths
 
-	# Text inputs condition check
-	def TextInputCheck(Self, TextInput1: QLineEdit, TextInput2: QLineEdit = None):
-		if (TextInput1.text() == ""):
-			TextInput1.setStyleSheet("QLineEdit{background:#661111;}")
-		else:
-			TextInput1.setStyleSheet("")
+# Get ID of member (variable or structure member), IDs are created once per member object
+def GetMemberId(Member, MemberIds, ContentIds):
+	if id(Member) not in MemberIds:
+		MemberIds[id(Member)] = ContentIds.setdefault(repr(Member), len(ContentIds))
+	return MemberIds[id(Member)]
 
-		if TextInput2 != None:
-			if (TextInput2.text() == ""):
-				TextInput2.setStyleSheet("QLineEdit{background:#661111;}")
+# Create alarm list
+def CreateAlarms(GlobalTypes, AlarmPaths):
+	# Index BOOL members by type they belong to, severity and acknowledge values are resolved once per member
+	AlarmMembers = {}
+	MemberCounts = {}
+	for GlobalType in GlobalTypes:
+		MemberCounts[GlobalType["ParentType"]] = MemberCounts.get(GlobalType["ParentType"], 0) + 1
+		if GlobalType["Type"] == "BOOL":
+			if (UserData["AlarmKeyword"]["Error"] in GlobalType["ParentType"]):
+				Severity = "Error"
+			elif (UserData["AlarmKeyword"]["Warning"] in GlobalType["ParentType"]):
+				Severity = "Warning"
+			elif (UserData["AlarmKeyword"]["Info"] in GlobalType["ParentType"]):
+				Severity = "Info"
 			else:
-				TextInput2.setStyleSheet("")
+				continue
+			GlobalType["Description2"] = re.sub(r"Behavior\.Acknowledge[\s]*=[\s]*RequiredAndResettable", r"Behavior.Acknowledge = 3", GlobalType["Description2"])
+			GlobalType["Description2"] = re.sub(r"Behavior\.Acknowledge[\s]*=[\s]*RequiredAfterActive", r"Behavior.Acknowledge = 2", GlobalType["Description2"])
+			GlobalType["Description2"] = re.sub(r"Behavior\.Acknowledge[\s]*=[\s]*Required", r"Behavior.Acknowledge = 1", GlobalType["Description2"])
+			GlobalType["Description2"] = re.sub(r"Behavior\.Acknowledge[\s]*=[\s]*Disabled", r"Behavior.Acknowledge = 0", GlobalType["Description2"])
+			AlarmMembers.setdefault(GlobalType["ParentType"], []).append((GlobalType, Severity))
 
-			if (TextInput1.text() == TextInput2.text()):
-				TextInput1.setStyleSheet("QLineEdit{background:#661111;}")
-				TextInput2.setStyleSheet("QLineEdit{background:#661111;}")
+	Alarms = []
+	for AlarmPath in AlarmPaths:
+		for GlobalType, Severity in AlarmMembers.get(AlarmPath[-1]["Type"], []):
+			Alarms.append({"Variable": GlobalType["Name"], "Array": GlobalType["Array"], "Path": AlarmPath, "Severity": Severity, "Properties": GlobalType["Description2"], "Members": MemberCounts[AlarmPath[-1]["Type"]]})
+	return Alarms
 
-	# Run the script from the configuration
-	def Run(Self):
-		Self.GetUserData()
-		Prebuild()
+# Returd code of given alarm or 0 if property is not defined
+def GetCode(Alarm) -> int:
+	return next((int(Property["Value"]) for Property in Alarm["Properties"] if Property["Key"] == "Code"), 0)
 
-	# GUI was accepted by OK button
-	def aGuiAccepted(Self):
-		if (Self.TmxNameLineEdit.text() != "") and (Self.MpConfigNameLineEdit.text() != "") and (Self.ProgramNameLineEdit.text() != "") and (Self.ErrorKeywordLineEdit.text() != "") and (Self.WarningKeywordLineEdit.text() != "") and (Self.InfoKeywordLineEdit.text() != "") and (Self.MpConfigNameLineEdit.text() != Self.ProgramNameLineEdit.text()):
-			Self.GetUserData()
-			
-			with open(UserDataPath, "wb") as CreateAlarmsSettings:
-				pickle.dump(UserData, CreateAlarmsSettings)
-				
-			Self.InfoD.MessageL.setText("The configuration has been set.")
-			ShowAdjusted(Self.InfoD)
+# Sort alarms by 'code' property
+def SortByCode(Alarms):
+	return sorted(Alarms, key=lambda x: (GetCode(x), x["Variable"]))
 
-	# Get data from widgets and fill in the UserData structure
-	def GetUserData(Self):
-		UserData["Configuration"] = Self.ConfigComboBox.currentText()
-		UserData["Enable"] = Self.EnablePushButton.isChecked()
-		UserData["Debug"] = Self.DebugPushButton.isChecked()
-		UserData["UpdateTmx"] = Self.UpdateTmxCheckBox.isChecked()
-		UserData["UpdateMpConfig"] = Self.UpdateMpConfigCheckBox.isChecked()
-		UserData["UpdateProgram"] = Self.UpdateProgramCheckBox.isChecked()
-		UserData["TmxName"] = Self.TmxNameLineEdit.text()
-		UserData["MpConfigName"] = Self.MpConfigNameLineEdit.text()
-		UserData["MpLink"] = Self.MpLinkLineEdit.text()
-		UserData["ProgramName"] = Self.ProgramNameLineEdit.text()
-		UserData["AlarmKeyword"]["Error"] = Self.ErrorKeywordLineEdit.text()
-		UserData["AlarmKeyword"]["Warning"] = Self.WarningKeywordLineEdit.text()
-		UserData["AlarmKeyword"]["Info"] = Self.InfoKeywordLineEdit.text()
+# Parse properties of alarms
+def ParseProperties(Alarms):
+	"""
+	Parses Input string and returns list of Alarms.
 
-	# State of the window changed
-	def changeEvent(Self, Event: QEvent):
-		if Event.type() == Event.WindowStateChange:
-			Self.TitleBar.windowStateChanged(Self.windowState())
+	Alarm {
+		Task: ""
+		Type: ""
+		Name: ""
+		Properties: [
+			{
+				Key: ""
+				Value: ""
+				Valid: False/True
+				Tag: ""
+			}
+		]
+	}
+	"""
+	for Member in Alarms:
+		Pairs = re.findall(PATTERN_PAIR, Member["Properties"])
+		Properties = []
+		BehaviorFound = False
 
-	# Size of the window changed
-	def resizeEvent(Self, Event: QEvent):
-		Self.TitleBar.resize(Self.width(), Self.TitleBar.height())
-		Self.MainGB.setGeometry(0, Self.TitleBar.height(), Self.width(), Self.height() - Self.TitleBar.height())
+		for Pair in Pairs:
+			Key = Pair[0]
+			Value = Pair[1]
+			
+			if Value.startswith("\"") and Value.endswith("\""): 
+				Value = Value[1:-1]
+			
+			if Key in PROPERTIES:
+				BehaviorFound |= (Key == "Behavior")
+				if "FALSE" in PROPERTIES[Key]["Validity"]:
+					Value = Value.upper()
+				Valid = Validity(Member["Variable"], Key, Value)
+				Properties.append({"Key": Key, "Value": Value, "Valid": Valid, "Tag": PROPERTIES[Key]["Tag"], "ID": PROPERTIES[Key]["ID"]})
+			else:
+				print("Warning: Property '" + Key + "' of member '" + PathToAlarm(Member) +"' is not valid.")
+				Properties.append({"Key": Key, "Value": Value, "Valid": False, "Tag": None, "ID": None})
+		
+		if not BehaviorFound and Properties:
+			Key = "Behavior"
+			Properties.append({"Key": Key, "Value": "EdgeAlarm", "Valid": True, "Tag": PROPERTIES[Key]["Tag"], "ID": PROPERTIES[Key]["ID"]})
 
-# Window title bar
-class TitleBar(QWidget):
-	ClickPosition = None
+		if Properties:
+			Properties = sorted(Properties, key=lambda d: d["Key"])
+			Member["Properties"] = Properties
+	
+	return Alarms
 
-	# Initialization of the title bar
-	def __init__(Self, Parent, WindowTitle, TitleColor, UseMinButton, UseMaxButton, UseCloseButton):
-		super(TitleBar, Self).__init__(Parent)
+# Check validity of property value
+def Validity(Name, Key, Value):
+	Valid = False
+	try:
+		ValueNotInRangeText = "Warning: Value of property '" + Key + "' of member '" + Name + "' is not in valid range "
+		if type(PROPERTIES[Key]["Validity"][0]) == int:
+			if int(Value) in range(PROPERTIES[Key]["Validity"][0], PROPERTIES[Key]["Validity"][1] + 1):
+				Valid = True
+			else:
+				print(ValueNotInRangeText + "<" + str(PROPERTIES[Key]["Validity"][0]) + "; " + str(PROPERTIES[Key]["Validity"][1]) + ">")
 
-		# Title bar layout
-		Layout = QHBoxLayout(Self)
-		Layout.setContentsMargins(int(8 * gSizeRatio), int(8 * gSizeRatio),int(8 * gSizeRatio),int(8 * gSizeRatio))
-		Layout.addStretch()
+		elif type(PROPERTIES[Key]["Validity"][0]) == float:
+			if (float(Value) >= PROPERTIES[Key]["Validity"][0]) and (float(Value) <= PROPERTIES[Key]["Validity"][1]):
+				Valid = True
+			else:
+				print(ValueNotInRangeText + "<" + str(PROPERTIES[Key]["Validity"][0]) + "; " + str(PROPERTIES[Key]["Validity"][1]) + ">")
 
-		# Label title
-		Self.Title = QLabel(WindowTitle, Self, alignment = Qt.AlignCenter)
-		Style = """
-		QLabel {
-			background-color: >>TitleBarColor<<;
-			color: >>ColorTitle<<;
-			font: >>TitleFont<<px ">>StandardFont<<";
-			padding-top: 4px;
-			border-radius: 0px;
-			border-bottom: 2px solid #ff8000;
-		}
-		"""
-		Self.Title.setStyleSheet(FinishStyle(Style.replace(">>TitleBarColor<<", TitleColor)))
-		Self.Title.adjustSize()
+		elif type(PROPERTIES[Key]["Validity"][0]) == str:
+			if Value in PROPERTIES[Key]["Validity"]:
+				Valid = True
+			else:
+				if "FALSE" in PROPERTIES[Key]["Validity"]: print(ValueNotInRangeText + str(RANGE_BOOL))
+				else: print(ValueNotInRangeText + str(PROPERTIES[Key]["Validity"]))
+		elif PROPERTIES[Key]["Validity"][0] == None:
+			Valid = True
 
-		# Appearance definition
-		Style = Self.style()
-		Self.ReferenceSize = Self.Title.height() - int(18 * gSizeRatio)
-		Self.ReferenceSize += Style.pixelMetric(Style.PM_ButtonMargin) * 2
-		Self.setMaximumHeight(Self.ReferenceSize + 2)
-		Self.setMinimumHeight(Self.Title.height() + 12)
+	except:
+		print("Warning: Wrong data type of property '" + Key + "' of member '" + Name + "'")
 
-		# Tool buttons (Min, Normal, Max, Close)
-		ButtonVisibility = {"min": UseMinButton, "normal": False, "max": UseMaxButton, "close": UseCloseButton}
-		ButtonSize = QSize(Self.ReferenceSize, Self.ReferenceSize)
-		for Target in ("min", "normal", "max", "close"):
-			Button = QToolButton(Self, focusPolicy=Qt.NoFocus)
-			Layout.addWidget(Button)
-			Button.setFixedSize(ButtonSize)
+	return Valid
 
-			IconType = getattr(Style.StandardPixmap, "SP_TitleBar{}Button".format(Target.capitalize()))
-			
-			Button.setIcon(Style.standardIcon(IconType))
-			
-			if Target == "close":
-				ColorNormal = "gray"
-				ColorHover = "orangered"
+# Create serialized alarm group (alarm name consists of names of variables and array indexes, so it does not need to be escaped)
+def MpAlarmCreateGroup(Index: int, Name: str, PropertiesXml: bytes) -> bytes:
+	Name = Name.encode("ascii")
+	return b"<Group ID=\"[" + str(Index).encode() + b"]\"><Property ID=\"Name\" Value=\"" + Name + b"\" /><Property ID=\"Message\" Value=\"{$Alarms/" + Name + b"}\" />" + PropertiesXml + b"</Group>"
+
+# Create serialized properties of alarm group, properties are serialized only once for alarms with the same properties
+def MpAlarmCreateProperties(Properties: list, PropertiesCache: dict) -> bytes:
+	PropertiesKey = repr(Properties)
+	if PropertiesKey not in PropertiesCache:
+		Group = et.Element("Group")
+		MpAlarmCreateNodes(Group, RemoveInvalidProperties(CreateTreeFromProperties(Properties)))
+		PropertiesCache[PropertiesKey] = b"".join(et.tostring(Element) for Element in Group)
+	return PropertiesCache[PropertiesKey]
+
+# Tansform alarm list to a tree
+def CreateTreeFromProperties(Properties: list) -> Node:
+	Tree = Node("Root")
+	for Item in Properties:
+		Keys = Item["Key"].split(".")
+		Last = Keys.pop(-1)
+		Parent = Tree
+		for Index, Key in enumerate(Keys):
+			Child = Parent.find(Key)
+			if Child:
+				Parent = Child
 			else:
-				ColorNormal = "gray"
-				ColorHover = "white"
+				if len(Keys) > 1:
+					PropertyName = ".".join(Keys[0:Index+1])
+				else:
+					PropertyName = Key
+				Parent = Parent.append(Node(Key, PROPERTIES[PropertyName]))
+		Parent.append(Node(Last, Item))
+	return Tree
 
-			Button.setStyleSheet("QToolButton {{background-color: {};border: none; border-radius: 4px;}} QToolButton:hover {{background-color: {}}}".format(ColorNormal, ColorHover))
+# Remove invalid properties
+def RemoveInvalidProperties(Properties: list) -> list:
+	for Index, Item in enumerate(Properties.children):
+		if ("Valid" in Item.data and Item.data["Valid"]) or ("Validity" in Item.data and Item.data["Validity"] == RANGE_NONE):
+			RemoveInvalidProperties(Item)
+		else:
+			del(Properties.children[Index])
+	return Properties
 
-			Signal = getattr(Self, Target + "Clicked")
-			Button.clicked.connect(Signal)
+# Insert new configuration
+def MpAlarmCreateNodes(Parent, Properties) -> et.Element:
+	for Item in Properties:
+		if Item.data:
+			Attrib = {"ID": Item.data["ID"]}
+			if "Value" in Item.data:
+				Attrib["Value"] = Item.data["Value"]
+			Element = et.Element(Item.data["Tag"], Attrib)
+			MpAlarmCreateNodes(Element, Item)
+			Parent.append(Element)
+	return Parent
 
-			setattr(Self, Target + "Button", Button)
+# Function for alarms set/reset text generation, text of the group of alarms is appended to the list of text parts
+def AlarmSetReset(SetResetText, Group, ProgramLanguage, NameTable, Shift = 0):
+	# Structure can be compared with its flags only if all its members are set and reset, other members are never copied to the flags
+	Guarded = UserData["ChangeGuard"] and (len(Group) == Group[0][0]["Members"])
+	Block = []
+	NumberOfForLoops = 0
+	if Guarded:
+		Block, OpenLoops = CreateGuardBlock(Group[0][0])
+	for Alarm, ResetAlarm in Group:
+		# Names of alarm instances in arrays are taken from the name table, instances of one alarm occupy a continuous range of the table
+		NameElement = None
+		if "NameFormat" not in Alarm:
+			Alarm["NameFormat"] = CreateNameFormat(Alarm)
+		if UserData["AlarmNames"] and Alarm["NameFormat"][1]:
+			NameElement = NameTable["Member"] + "[" + GetNameIndex(Alarm, NameTable["Size"]) + "]"
+			NameTable["Alarms"].append(Alarm)
+			NameTable["Size"] += CountInstances(Alarm)
+			NameTable["Length"] = max(NameTable["Length"], GetMaxNameLength(Alarm))
+
+		AlarmBlock, AlarmForLoops = CreateSetResetBlock(Alarm, ResetAlarm, NameElement, Guarded)
+		Block += AlarmBlock
+		NumberOfForLoops = max(NumberOfForLoops, AlarmForLoops)
+	if Guarded:
+		Block.append(("EndIf", OpenLoops + 1))
+		for Loop in range(OpenLoops, 0, -1):
+			Block.append(("EndFor", Loop))
+	SetResetText.append(EmitSetResetBlock(Block, ProgramLanguage, Shift) + "\n\t")
+	return NumberOfForLoops
+
+# Creates loops over arrays in the path of the alarm structure and a condition skipping the structure if none of its alarms differs from its flags
+def CreateGuardBlock(Alarm):
+	Block, AlarmName, NameParts = CreateAlarmLoops(Alarm, 1)
+	OpenLoops = CountPathLoops(Alarm)
+	Block = Block[:OpenLoops]
+	StructureName = AlarmName.rsplit(".", 1)[0]
+	Block.append(("If", OpenLoops + 1, ("Differs", StructureName, "Flag." + StructureName)))
+	return Block, OpenLoops
+
+# Returns number of loops over arrays in the path of the alarm structure
+def CountPathLoops(Alarm) -> int:
+	return sum(1 for PathMember in Alarm["Path"] if PathMember["Array"] != "")
+
+# Creates FOR loops over all arrays in the path of the alarm, returns the loops, name of the alarm indexed by loop variables and parts of its name
+def CreateAlarmLoops(Alarm, Depth):
+	Loops = []
+	AlarmName = ""
+	NameParts = []
+	for PathMember in Alarm["Path"] + [{"Name": Alarm["Variable"], "Array": Alarm["Array"]}]:
+		AlarmName += PathMember["Name"]
+		if PathMember["Array"] != "":
+			ArrayIndex = "ArrayIndex" + str(len(Loops) + 1)
+			Loops.append(("For", Depth + len(Loops), ArrayIndex, str(PathMember["Array"][0]), str(PathMember["Array"][1])))
+			NameParts += [("String", PathMember["Name"] + "["), ("Index", ArrayIndex), ("String", "]")]
+			AlarmName += "[" + ArrayIndex + "]"
+		else:
+			NameParts.append(("String", PathMember["Name"]))
+		NameParts.append(("String", "."))
+		AlarmName += "."
+	NameParts.pop()
+	return Loops, AlarmName[:-1], NameParts
+
+# Returns index of the alarm instance in the name table composed from loop variables, instances are stored in the order of CreateNames
+def GetNameIndex(Alarm, Offset) -> str:
+	if "NameFormat" not in Alarm:
+		Alarm["NameFormat"] = CreateNameFormat(Alarm)
+	Ranges = Alarm["NameFormat"][1]
+	Terms = []
+	Stride = 1
+	for Loop in range(len(Ranges), 0, -1):
+		Offset -= Ranges[Loop - 1].start * Stride
+		if Stride == 1:
+			Terms.insert(0, "ArrayIndex" + str(Loop))
+		else:
+			Terms.insert(0, "ArrayIndex" + str(Loop) + " * " + str(Stride))
+		Stride *= len(Ranges[Loop - 1])
+	NameIndex = " + ".join(Terms)
+	if Offset > 0:
+		NameIndex += " + " + str(Offset)
+	elif Offset < 0:
+		NameIndex += " - " + str(-Offset)
+	return NameIndex
+
+# Creates statements composing the alarm name from its parts at runtime, consecutive static parts of the name are merged
+def CreateNameCreation(NameParts, Depth, Target):
+	NameCreation = [("Call", Depth, "brsmemset", [("Adr", Target), ("Var", "0"), ("SizeOf", Target)])]
+	for Kind, Parts in itertools.groupby(NameParts, key=lambda Part: Part[0]):
+		if Kind == "String":
+			NameCreation.append(("Call", Depth, "brsstrcat", [("Adr", Target), ("AdrString", "".join(Part[1] for Part in Parts))]))
+		else:
+			for Part in Parts:
+				NameCreation.append(("Call", Depth, "brsmemset", [("Adr", "String"), ("Var", "0"), ("SizeOf", "String")]))
+				NameCreation.append(("Call", Depth, "brsitoa", [("Var", Part[1]), ("Adr", "String")]))
+				NameCreation.append(("Call", Depth, "brsstrcat", [("Adr", Target), ("Adr", "String")]))
+	NameCreation[1] = ("Call", Depth, "brsstrcpy", NameCreation[1][3])
+	return NameCreation
+
+# Creates language independent set/reset block of the alarm, each statement is a tuple (Kind, Depth, Arguments...) and each expression is a tuple (Kind, Arguments...)
+def CreateSetResetBlock(Alarm, ResetAlarm, NameElement, Guarded = False):
+	# Guarded block is nested in the loops over the path and the condition of the guard
+	OpenLoops = 0
+	Shift = 0
+	if Guarded:
+		OpenLoops = CountPathLoops(Alarm)
+		Shift = 1
+	Block, AlarmName, NameParts = CreateAlarmLoops(Alarm, 1 + Shift)
+	NumberOfForLoops = len(Block)
+	Block = Block[OpenLoops:]
+	FlagName = "Flag." + AlarmName
+	Depth = NumberOfForLoops + 1 + Shift
+	Link = ("Link", UserData["MpLink"])
 
-			Button.setVisible(ButtonVisibility[Target])
+	if NumberOfForLoops != 0:
+		if NameElement == None:
+			NameCreation = CreateNameCreation(NameParts, Depth + 1, "HelpName")
+			Name = ("Var", "HelpName")
+		else:
+			NameCreation = []
+			Name = ("Var", "AlarmNames." + NameElement)
+		if not(ResetAlarm):
+			Block.append(("If", Depth, ("Var", AlarmName)))
+			Block += NameCreation
+			Block.append(("Call", Depth + 1, "MpAlarmXSet", [Link, Name]))
+			Block.append(("Assign", Depth + 1, ("Var", AlarmName), ("False",)))
+		else:
+			Block.append(("If", Depth, ("NotEqual", AlarmName, FlagName)))
+			Block += NameCreation
+			Block.append(("If", Depth + 1, ("Greater", AlarmName, FlagName)))
+			Block.append(("Call", Depth + 2, "MpAlarmXSet", [Link, Name]))
+			Block.append(("Else", Depth + 1))
+			Block.append(("Call", Depth + 2, "MpAlarmXReset", [Link, Name]))
+			Block.append(("EndIf", Depth + 1))
+	else:
+		Name = ("String", AlarmName)
+		if not(ResetAlarm):
+			Block.append(("If", Depth, ("Var", AlarmName)))
+			Block.append(("Call", Depth + 1, "MpAlarmXSet", [Link, Name]))
+			Block.append(("Assign", Depth + 1, ("Var", AlarmName), ("False",)))
+		else:
+			Block.append(("If", Depth, ("Greater", AlarmName, FlagName)))
+			Block.append(("Call", Depth + 1, "MpAlarmXSet", [Link, Name]))
+			Block.append(("ElseIf", Depth, ("Less", AlarmName, FlagName)))
+			Block.append(("Call", Depth + 1, "MpAlarmXReset", [Link, Name]))
+	Block.append(("EndIf", Depth))
+	if ResetAlarm:
+		Block.append(("Assign", Depth, ("Var", FlagName), ("Var", AlarmName)))
+
+	for Loop in range(NumberOfForLoops, OpenLoops, -1):
+		Block.append(("EndFor", Loop + Shift))
+
+	return Block, NumberOfForLoops
+
+# Creates filling of the alarm table and a loop setting and resetting all alarms of the table, the code does not depend on the number of alarms
+# Addresses of alarms are looked up by their names, the table is filled again whenever the first alarm of a global variable has moved (e.g. by online change)
+def CreateTableBlocks(TableSize, CheckNames):
+	Link = ("Link", UserData["MpLink"])
+	Name = ("Var", "AlarmTable.Name[AlarmIndex]")
+	Reset = ("Var", "AlarmTable.Reset[AlarmIndex]")
+	Value = ("Deref", "AlarmValue")
+	Flag = ("Var", "AlarmTable.Flag[AlarmIndex]")
+	Initialization = []
+	for Index, CheckName in enumerate(CheckNames):
+		Initialization += [("If", 1, ("NotEqual", ("Var", "AlarmTable.Check[" + str(Index) + "]"), ("Adr", CheckName))),
+						   ("Assign", 2, ("Var", "AlarmTable.Ready"), ("False",)),
+						   ("EndIf", 1)]
+	Initialization += [("If", 1, ("Not", "AlarmTable.Ready")),
+					   ("For", 2, "AlarmIndex", "0", str(TableSize - 1)),
+					   ("Result", 3, ("Var", "AlarmStatus"), "PV_xgetadr", [("Adr", "AlarmTable.Name[AlarmIndex]"), ("Adr", "AlarmTable.Alarm[AlarmIndex]"), ("Adr", "AlarmLength")]),
+					   ("If", 3, ("NotZero", "AlarmStatus")),
+					   ("Assign", 4, ("Var", "AlarmTable.Alarm[AlarmIndex]"), ("Adr", "AlarmTable.Dummy")),
+					   ("EndIf", 3),
+					   ("EndFor", 2)]
+	for Index, CheckName in enumerate(CheckNames):
+		Initialization.append(("Assign", 2, ("Var", "AlarmTable.Check[" + str(Index) + "]"), ("Adr", CheckName)))
+	Initialization += [("Assign", 2, ("Var", "AlarmTable.Ready"), ("True",)),
+					   ("EndIf", 1)]
+	if UserData["PackedFlags"]:
+		return Initialization + CreatePackedTableLoop(TableSize)
+
+	Loop = [("For", 1, "AlarmIndex", "0", str(TableSize - 1)),
+			("Access", 2, ("Var", "AlarmValue"), ("Var", "AlarmTable.Alarm[AlarmIndex]")),
+			("If", 2, Reset),
+			("If", 3, ("NotEqual", Value, Flag)),
+			("If", 4, Value),
+			("Call", 5, "MpAlarmXSet", [Link, Name]),
+			("Else", 4),
+			("Call", 5, "MpAlarmXReset", [Link, Name]),
+			("EndIf", 4),
+			("Assign", 4, Flag, Value),
+			("EndIf", 3),
+			("ElseIf", 2, Value),
+			("Call", 3, "MpAlarmXSet", [Link, Name]),
+			("Assign", 3, Value, ("False",)),
+			("EndIf", 2),
+			("EndFor", 1)]
+	return Initialization + Loop
+
+# Creates loop over the alarm table with flags packed into words, states of 32 alarms are collected into a word and compared with their flags at once
+def CreatePackedTableLoop(TableSize):
+	Link = ("Link", UserData["MpLink"])
+	Name = ("Var", "AlarmTable.Name[AlarmIndex]")
+	Reset = ("Var", "AlarmTable.Reset[AlarmIndex]")
+	Value = ("Deref", "AlarmValue")
+	State = ("Var", "AlarmState")
+	Mask = ("Var", "AlarmMask")
+	Loop = [("For", 1, "AlarmWord", "0", str((TableSize + 31) // 32 - 1)),
+			("Assign", 2, ("Var", "AlarmEnd"), ("Var", "AlarmWord * 32 + 31")),
+			("If", 2, ("Greater", "AlarmEnd", str(TableSize - 1))),
+			("Assign", 3, ("Var", "AlarmEnd"), ("Var", str(TableSize - 1))),
+			("EndIf", 2),
+			# Collect states of alarms of the word
+			("Assign", 2, State, ("Var", "0")),
+			("Assign", 2, Mask, ("Var", "1")),
+			("For", 2, "AlarmIndex", "AlarmWord * 32", "AlarmEnd"),
+			("Access", 3, ("Var", "AlarmValue"), ("Var", "AlarmTable.Alarm[AlarmIndex]")),
+			("If", 3, Value),
+			("Assign", 4, State, ("SetBits", State, Mask)),
+			("EndIf", 3),
+			("Assign", 3, Mask, ("ShiftLeft", Mask)),
+			("EndFor", 2),
+			# Set and reset only alarms of changed bits
+			("Assign", 2, ("Var", "AlarmChanged"), ("Xor", State, ("Var", "AlarmTable.Flags[AlarmWord]"))),
+			("If", 2, ("NotZero", "AlarmChanged")),
+			("Assign", 3, Mask, ("Var", "1")),
+			("For", 3, "AlarmIndex", "AlarmWord * 32", "AlarmEnd"),
+			("If", 4, ("Masked", "AlarmChanged", Mask)),
+			("If", 5, ("Masked", State, Mask)),
+			("Call", 6, "MpAlarmXSet", [Link, Name]),
+			("If", 6, ("Not", "AlarmTable.Reset[AlarmIndex]")),
+			("Access", 7, ("Var", "AlarmValue"), ("Var", "AlarmTable.Alarm[AlarmIndex]")),
+			("Assign", 7, Value, ("False",)),
+			("Assign", 7, State, ("ClearBits", State, Mask)),
+			("EndIf", 6),
+			("ElseIf", 5, Reset),
+			("Call", 6, "MpAlarmXReset", [Link, Name]),
+			("EndIf", 5),
+			("EndIf", 4),
+			("Assign", 4, Mask, ("ShiftLeft", Mask)),
+			("EndFor", 3),
+			("Assign", 3, ("Var", "AlarmTable.Flags[AlarmWord]"), State),
+			("EndIf", 2),
+			("EndFor", 1)]
+	return Loop
+
+# Formats expression in the syntax of the program language, arguments of the expression can be expressions too
+def FormatExpression(Expression, Expressions) -> str:
+	return Expressions[Expression[0]].format(*(FormatExpression(Argument, Expressions) if isinstance(Argument, tuple) else Argument for Argument in Expression[1:]))
+
+# Emits set/reset block in the syntax of the program language, the block can be shifted by additional indentation levels
+def EmitSetResetBlock(Block, ProgramLanguage, Shift = 0) -> str:
+	Statements = SYNTAX_STATEMENTS[ProgramLanguage]
+	Expressions = SYNTAX_EXPRESSIONS[ProgramLanguage]
+	Text = []
+	for Kind, Depth, *Arguments in Block:
+		if Kind == "Call":
+			Arguments = [Arguments[0], ", ".join(FormatExpression(Argument, Expressions) for Argument in Arguments[1])]
+		elif Kind == "Result":
+			Arguments = [FormatExpression(Arguments[0], Expressions), Arguments[1], ", ".join(FormatExpression(Argument, Expressions) for Argument in Arguments[2])]
+		elif Kind != "For":
+			Arguments = [FormatExpression(Argument, Expressions) for Argument in Arguments]
+		Tabs = "\n" + "\t" * (Depth + Shift)
+		for Line in Statements[Kind]:
+			Text.append(Tabs + Line.format(*Arguments))
+	return "".join(Text)
+
+# Splits groups of alarms into continuous slices with similar number of alarm instances
+def SplitIntoSlices(Groups, NumberOfSlices):
+	Slices = [[] for Slice in range(NumberOfSlices)]
+	Sizes = [sum(CountInstances(Alarm) for Alarm, ResetAlarm in Group) for Group in Groups]
+	Total = max(sum(Sizes), 1)
+	Count = 0
+	# Group is placed to the slice containing its middle instance
+	for Group, Size in zip(Groups, Sizes):
+		Slices[min((2 * Count + Size) * NumberOfSlices // (2 * Total), NumberOfSlices - 1)].append(Group)
+		Count += Size
+	return Slices
 
-	# State of the window changed
-	def windowStateChanged(Self, State):
-		Self.normalButton.setVisible(State == Qt.WindowMaximized)
-		Self.maxButton.setVisible(State != Qt.WindowMaximized)
+# Prebuild mode function
+def Prebuild():
 
-	# Mouse pressed event
-	def mousePressEvent(Self, Event: QEvent):
-		if Event.button() == Qt.LeftButton:
-			Self.ClickPosition = Event.pos()
+	# Ouput window message
+	print("----------------------- Beginning of the script CreateAlarms " + SCRIPT_VERSION + " -----------------------")
 
-	# Mouse moved event
-	def mouseMoveEvent(Self, Event: QEvent):
-		if Self.ClickPosition is not None:
-			Self.window().move(Self.window().pos() + Event.pos() - Self.ClickPosition)
+	# Project files are indexed and parsed again in every run, only modified directories and files are read again
+	gFileIndexes.clear()
+	gUpdatedFiles.clear()
+	LoadCaches()
 
-	# Mouse released event
-	def mouseReleaseEvent(Self, MouseEvent: QMouseEvent):
-		Self.ClickPosition = None
+	if UserData["Configuration"] != "":
+		UsedConfiguration = UserData["Configuration"]
+	else:
+		UsedConfiguration = FindFilePath(ConfigPath, UserData["MpConfigName"] + ".mpalarmxcore", True)
+		UsedConfiguration = UsedConfiguration[UsedConfiguration.find("Physical") + 9:]
+		UsedConfiguration = UsedConfiguration[:UsedConfiguration.find("\\")]
+	print("Used configuration: " + UsedConfiguration)
 
-	# Button Close clicked
-	def closeClicked(Self):
-		Self.window().close()
+	# Get all valid var and type files
+	VarPaths = GetGlobalPaths("var")
+	TypePaths = GetGlobalPaths("typ")
 
-	# Button Maximize clicked
-	def maxClicked(Self):
-		Self.window().showMaximized()
+	# Nothing to do if no input and no generated file has changed since the last successful run
+	if GetFingerprint(VarPaths + TypePaths) == gCaches["fingerprint"]["Previous"].get("Fingerprint"):
+		print("No changes since the last run, all files are up to date.")
+		gCaches["fingerprint"]["Current"] = gCaches["fingerprint"]["Previous"]
+		SaveCaches()
+		print("--------------------------------- End of the script CreateAlarms ---------------------------------")
+		return
 
-	# Button Normal clicked
-	def normalClicked(Self):
-		Self.window().showNormal()
+	# Get alarms from global variables and types
+	global Alarms
+	Alarms = GetAlarms(VarPaths, TypePaths)
 
-	# Button Minimize clicked
-	def minClicked(Self):
-		Self.window().showMinimized()
+	# Count alarm instances before anything is generated
+	PrintAlarmCounts(CountAlarms(Alarms))
 
-	# Size of the window changed
-	def resizeEvent(Self, Event: QEvent):
-		Self.Title.resize(Self.minButton.x() + Self.ReferenceSize * 3 + int(40 * gSizeRatio), Self.height())
+	DebugPrint("User settings", UserData)
 
-# Window bottom button bar
-class BottomBar(QWidget):
-	# Initialization of the title bar
-	def __init__(Self, Parent):
-		super(BottomBar, Self).__init__(Parent)
+	# Update Tmx file
+	if UserData["UpdateTmx"]: UpdateTmx()
 
-		# Create bottom button box bar group box
-		Self.BottomBarGB = QGroupBox()
-		Self.BottomBarGB.setMaximumHeight(int(gAdjustedGuiSize["WidgetHeight"]) * 2)
-		Style = """
-		QGroupBox {
-			background-color: transparent;
-			border-top: 2px solid #222222;
-			border-left: none;
-			border-right: none;
-			border-bottom: none;
-			margin-top: 20px;
-		}
-			
-		QToolTip {
-			background-color: #eedd22;
-		}
+	# Update mpalarmxcore file
+	if UserData["UpdateMpConfig"]: UpdateMpalarmxcore()
 
-		QLabel {
-			background-color: transparent;
-			font: >>Font<<px ">>StandardFont<<";
-		}
+	# Update program file
+	Programs = gCaches["fingerprint"]["Previous"].get("Programs", [])
+	if UserData["UpdateProgram"]: Programs = UpdateProgram()
 
-		QPushButton {
-			background-color: #222222;
-			color: >>ColorInput<<;
-			width: >>ButtonWidth<<px;
-			height: >>WidgetHeight<<px;
-			border-style: solid;
-			border-radius: 8px;
-		}
+	# Report files which were really changed
+	if gUpdatedFiles:
+		print("Updated files: " + ", ".join(os.path.basename(UpdatedFile) for UpdatedFile in gUpdatedFiles))
+	else:
+		print("All files are up to date.")
 
-		QPushButton:hover {
-			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #373737, stop:0.505682 #373737, stop:1 #282828);
-			color: >>ColorInput<<;
-		}
+	# Store fingerprint of the updated files and cached data for the next run
+	gCaches["fingerprint"]["Current"] = {"Fingerprint": GetFingerprint(VarPaths + TypePaths), "Programs": Programs}
+	SaveCaches()
 
-		QPushButton:pressed {
-			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #2d2d2d, stop:0.505682 #282828, stop:1 #2d2d2d);
-			color: #ffffff;
-		}
-		"""
-		Self.BottomBarGB.setStyleSheet(FinishStyle(Style))
+	# Ouput window message
+	print("--------------------------------- End of the script CreateAlarms ---------------------------------")
 
-		# Add buttons OK and Cancel to bottom bar
-		BottomBarHBL = QHBoxLayout(Self.BottomBarGB)
+# Creates all paths to one alarm with all possible array values, paths are generated one by one
+def CreateNames(Alarm):
+	if "NameFormat" not in Alarm:
+		Alarm["NameFormat"] = CreateNameFormat(Alarm)
+	Format, Ranges = Alarm["NameFormat"]
+	for Indexes in itertools.product(*Ranges):
+		yield Format.format(*Indexes)
+
+# Creates format of alarm path with placeholders for array indexes and ranges of the indexes
+def CreateNameFormat(Alarm):
+	Format = ""
+	Ranges = []
+	for Member in Alarm["Path"] + [{"Name": Alarm["Variable"], "Array": Alarm["Array"]}]:
+		if Format != "":
+			Format += "."
+		Format += Member["Name"].replace("{", "{{").replace("}", "}}")
+		if Member["Array"] != "":
+			Format += "[{}]"
+			Ranges.append(range(Member["Array"][0], Member["Array"][1] + 1))
+	return Format, Ranges
+
+# Returns number of instances of one alarm (product of lengths of all arrays in its path) without creating their names
+def CountInstances(Alarm) -> int:
+	if "NameFormat" not in Alarm:
+		Alarm["NameFormat"] = CreateNameFormat(Alarm)
+	Count = 1
+	for Range in Alarm["NameFormat"][1]:
+		Count *= len(Range)
+	return Count
+
+# Returns maximal length of names of the alarm instances without creating them
+def GetMaxNameLength(Alarm) -> int:
+	if "NameFormat" not in Alarm:
+		Alarm["NameFormat"] = CreateNameFormat(Alarm)
+	Format, Ranges = Alarm["NameFormat"]
+	return len(Format.format(*["" for Range in Ranges])) + sum(max(len(str(Range.start)), len(str(Range.stop - 1))) for Range in Ranges)
+
+# Count alarm instances per global variable, per severity and in total
+def CountAlarms(Alarms):
+	"""
+	Counts instances of all alarms
 
-		# Version label
-		VersionL = QLabel("ⓘ " + SCRIPT_VERSION)
-		VersionL.setToolTip("""To get more information about each row, hold the pointer on its label.
-	\nSupport contacts
-	michal.vavrik@br-automation.com
-	adam.sefranek@br-automation.com
-	\nVersion 2.3.0
-	- Enable of prebuild function added
-	- Possibility to run the script from configuration
-	- Editable MpLink name
-	\nVersion 2.2.0
-	- Possibility of choosing keywords for alarms (Error, Warning, Info)
-	- Behavior.Acknowledge replacing bug fixed
-	- GUI style changed
-	\nVersion 2.1.0
-	- PyGuiTemplate implemented
-	- Tmx encoding improved
-	- Sorting alarms by code and variable name
-	- Not resetting of Edge alarms (its automatic)
-	\nVersion 2.0.2
-	- Changes according to B&R Coding guidelines
-	\nVersion 2.0.1
-	- Once nested alarms path bug fixed
-	- Supported properties change
-	- Print of used configuration
-	- Invalid property name bug fixed
-	\nVersion 2.0.0
-	- New system of finding alarm paths
-	- Support of arrays (also defined by constants)
-	\nVersion 1.2.0
-	- Configuration of sections to update
-	- Configuration of TMX, MpConfig and program name
-	- Properties validity
-	- Strings must be in quotation marks
-	\nVersion 1.1.0
-	- Bug with default alarm behavior fixed
-	- Behavior.Monitoring.MonitoredPV bug fixed
-	- Tags are taken from the graphics editor
-	- Monitoring alarm types have no longer Set and Reset in the Alarms program
-	- Path to user data changed to AppData/Roaming/BR/Scripts/CreateAlarms/
-	- Error mode added
-	\nVersion 1.0.0
-	- Script creation
-	- Basic functions implemented""")
-		BottomBarHBL.addWidget(VersionL, 0, Qt.AlignLeft)
+	Counts {
+		Total: 0
+		Severity: {Error: 0, Warning: 0, Info: 0}
+		Variable: {Name: 0}
+	}
+	"""
+	Counts = {"Total": 0, "Severity": {"Error": 0, "Warning": 0, "Info": 0}, "Variable": {}}
+	for Alarm in Alarms:
+		Count = CountInstances(Alarm)
+		Counts["Total"] += Count
+		Counts["Severity"][Alarm["Severity"]] += Count
+		Variable = Alarm["Path"][0]["Name"]
+		Counts["Variable"][Variable] = Counts["Variable"].get(Variable, 0) + Count
+	return Counts
+
+# Print summary of alarm instances and warn if there are too many of them
+def PrintAlarmCounts(Counts):
+	print("Alarm instances: " + str(Counts["Total"]) + " (errors " + str(Counts["Severity"]["Error"]) + ", warnings " + str(Counts["Severity"]["Warning"]) + ", infos " + str(Counts["Severity"]["Info"]) + ")")
+	for Variable, Count in Counts["Variable"].items():
+		print("  " + Variable + ": " + str(Count))
+	if Counts["Total"] > WARNING_ALARM_INSTANCES:
+		print("Warning: Project contains " + str(Counts["Total"]) + " alarm instances (more than " + str(WARNING_ALARM_INSTANCES) + "), generated files will be very large.")
 
-		Self.RunPB = QPushButton("RUN")
-		BottomBarHBL.addWidget(Self.RunPB, 10, Qt.AlignRight)
-		Self.OkPB = QPushButton("OK")
-		BottomBarHBL.addWidget(Self.OkPB, 10, Qt.AlignRight)
-		Self.CancelPB = QPushButton("Cancel")
-		BottomBarHBL.addSpacing(10)
-		BottomBarHBL.addWidget(Self.CancelPB, 0, Qt.AlignRight)
+# Return path to alarm with array ranges
+def PathToAlarm(Alarm) -> str:
+	Path = ""
+	for PathMember in Alarm["Path"]:
+		Path += PathMember["Name"] + str(PathMember["Array"]) + " > "
+	Path += Alarm["Variable"] + str(Alarm["Array"])
+	return Path
 
-# Dialog for displaying info messages
-class InfoDialog(QDialog):
-	# Initialization of the dialog
-	def __init__(Self):
-		super(InfoDialog, Self).__init__()
+# Update TMX file
+def UpdateTmx():
+	#####################################################################################################################################################
+	# Update Tmx file
+	#####################################################################################################################################################
 
-		# Create title bar
-		Self.TitleBar = TitleBar(Self, "Info", DEFAULT_GUI_COLOR["WindowBorderStandard"], False, False, False)
-		Self.setContentsMargins(0, Self.TitleBar.height(), 0, 0)
+	# Ouput window message
+	print("Updating " + UserData["TmxName"] + ".tmx file...")
 
-		# Set dialog styles
-		Style = """
-			QWidget {
-				background-color: >>Background<<;
-				color: >>ColorInput<<;
-				font: >>Font<<px ">>StandardFont<<";
-			}
+	TmxPath = FindFilePath(LogicalPath, UserData["TmxName"] + ".tmx", True)
 
-			QDialog {
-				border: 2px solid >>WindowBorderStandard<<;
-			}
-
-			QLabel {
-				background-color: >>BackgroundOutput<<;
-				color: >>ColorOutput<<;
-				qproperty-alignment: "AlignVCenter | AlignCenter";
-				padding: 5px;
-				border-radius: 8px;
-			}
+	# Get alarm names from Global.typ file
+	TypAlarmsSet = set(itertools.chain.from_iterable(CreateNames(Alarm) for Alarm in Alarms))
+	if UserData["Debug"]:
+		DebugPrint("Typ alarms", list(itertools.chain.from_iterable(CreateNames(Alarm) for Alarm in Alarms)))
 
-			QPushButton {
-				background-color: #222222;
-				width: >>ButtonWidth<<px;
-				height: >>WidgetHeight<<px;
-				border-style: solid;
-				color: >>ColorInput<<;
-				border-radius: 8px;
-			}
+	# The file is parsed and copied in one pass, existing alarms are copied byte by byte, missing alarms are left out and new alarms are added to the end of body
+	TmxAlarms = []
+	TmxAlarmsSet = set()
+	MissingAlarms = []
+	NewAlarms = []
+	State = {"Depth": 0, "BodyTag": None, "MissingTag": None}
+
+	# Parser handlers, the file is copied up to the position of the element which is being changed
+	def StartElement(Name, Attributes):
+		State["Depth"] += 1
+		if (Name == "body") and (State["Depth"] == 2):
+			Copier.CopyTo(Parser.CurrentByteIndex)
+			State["BodyTag"] = Copier.ReadTag()
+			if not State["BodyTag"].endswith(b"/>"):
+				Copier.Write(State["BodyTag"])
+		elif (Name == "tu") and (State["Depth"] == 3) and ("tuid" in Attributes):
+			TmxAlarms.append(Attributes["tuid"])
+			TmxAlarmsSet.add(Attributes["tuid"])
+			if Attributes["tuid"] not in TypAlarmsSet:
+				MissingAlarms.append(Attributes["tuid"])
+				Copier.CopyTo(Parser.CurrentByteIndex)
+				State["MissingTag"] = Copier.ReadTag()
+
+	def EndElement(Name):
+		if (Name == "body") and (State["Depth"] == 2):
+			if State["BodyTag"].endswith(b"/>"):
+				Indentation = Copier.Indentation
+				Copier.Write(State["BodyTag"][:-2].rstrip() + b">" + Copier.Newline)
+			else:
+				Copier.CopyTo(Parser.CurrentByteIndex)
+			for Alarm in Alarms:
+				for AlarmName in CreateNames(Alarm):
+					if AlarmName not in TmxAlarmsSet:
+						NewAlarms.append(AlarmName)
+						Copier.WriteLines(b"\t<tu tuid=\"" + AlarmName.encode("utf-8") + b"\" />" + Copier.Newline)
+			if State["BodyTag"].endswith(b"/>"):
+				Copier.Write(Indentation + b"</body>")
+		elif (Name == "tu") and (State["Depth"] == 3) and (State["MissingTag"] != None):
+			if not State["MissingTag"].endswith(b"/>"):
+				Copier.SkipTo(Parser.CurrentByteIndex)
+				Copier.ReadTag()
+			Copier.SkipLineEnd()
+			State["MissingTag"] = None
+		State["Depth"] -= 1
+
+	Parser = expat.ParserCreate()
+	Parser.StartElementHandler = StartElement
+	Parser.EndElementHandler = EndElement
+
+	TempPath = TmxPath + ".tmp"
+	with open(TmxPath, "rb") as TmxFile, open(TmxPath, "rb") as SourceFile, open(TempPath, "wb") as TempFile:
+		Copier = FileCopier(SourceFile, TempFile)
+		try:
+			for Chunk in iter(lambda: TmxFile.read(FILE_CHUNK_SIZE), b""):
+				Parser.Parse(Chunk)
+			Parser.Parse(b"", True)
+		except expat.ExpatError as Error:
+			TempFile.close()
+			os.remove(TempPath)
+			print("Error: File " + UserData["TmxName"] + ".tmx is not valid, " + str(Error) + ".")
+			TerminateScript()
+		Copier.CopyTo(None)
 
-			QPushButton:hover {
-				color: >>ColorInput<<;
-				background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 rgba(55, 55, 55, 255), stop:0.505682 rgba(55, 55, 55, 255), stop:1 rgba(40, 40, 40, 255));
-			}
+	if State["BodyTag"] == None:
+		os.remove(TempPath)
+		print("Error: Element body not found in file " + UserData["TmxName"] + ".tmx.")
+		TerminateScript()
 
-			QPushButton:pressed {
-				background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 rgba(45, 45, 45, 255), stop:0.505682 rgba(40, 40, 40, 255), stop:1 rgba(45, 45, 45, 255));
-				color: #ffffff;
-			}
-			"""
-		Self.setStyleSheet(FinishStyle(Style))
+	DebugPrint("Tmx alarms", TmxAlarms)
+	DebugPrint("New alarms", NewAlarms)
+	DebugPrint("Missing alarms", MissingAlarms)
 
-		# Set general dialog settings
-		Self.setWindowTitle("Info")
-		Self.setWindowFlag(Qt.FramelessWindowHint)
-		Self.setGeometry(0, 0, 100, 100)
-		Self.setModal(True)
+	ReplaceFile(TmxPath, TempPath)
 
-		# Create widgets
-		MainVBL = QVBoxLayout(Self)
+# Update mpalarmxcore file
+def UpdateMpalarmxcore():
+	#####################################################################################################################################################
+	# Update mpalarmxcore
+	#####################################################################################################################################################
 
-		Self.MessageL = QLabel()
-		MainVBL.addWidget(Self.MessageL)
-		
-		ButtonBoxHBL = QHBoxLayout()
-		Self.OkPB = QPushButton()
-		Self.OkPB.setText("OK")
-		ButtonBoxHBL.addWidget(Self.OkPB)
-		
-		# Show dialog
-		MainVBL.addLayout(ButtonBoxHBL)
+	# Ouput window message
+	print("Updating " + UserData["MpConfigName"] + ".mpalarmxcore file...")
 
-	# Size of the window changed
-	def resizeEvent(Self, Event: QEvent):
-		Self.TitleBar.resize(Self.width(), Self.TitleBar.height())
-		Self.TitleBar.Title.setMinimumWidth(Self.width())
+	# Create path to mpalarmxcore
+	MpAlarmPath = FindFilePath(ConfigPath, UserData["MpConfigName"] + ".mpalarmxcore", True)
 
-# Dialog for displaying error messages
-class ErrorDialog(QDialog):
-	# Initialization of the dialog
-	def __init__(Self, Messages):
-		super(ErrorDialog, Self).__init__()
+	# Load file
+	IsFile(MpAlarmPath)
 
-		# Create title bar
-		Self.TitleBar = TitleBar(Self, "Error", "#6e1010", False, False, True)
-		Self.setContentsMargins(0, Self.TitleBar.height(), 0, 0)
+	# Parse file, groups of the old alarm list are removed during parsing, so the old alarm list is never loaded as a whole
+	Parent = None
+	OpenElements = []
+	MpAlarmElements = et.iterparse(MpAlarmPath, events = ("start", "end"))
+	for Event, Element in MpAlarmElements:
+		if Event == "start":
+			if (Parent == None) and (Element.tag == "Element") and (Element.get("Type") == "mpalarmxcore"):
+				Parent = Element
+			OpenElements.append(Element)
+		else:
+			OpenElements.pop()
+			if (len(OpenElements) > 1) and (OpenElements[-2] is Parent) and (OpenElements[-1].get("ID") == "mapp.AlarmX.Core.Configuration"):
+				OpenElements[-1].remove(Element)
+	MpAlarmRoot = MpAlarmElements.root
 
-		# Set dialog styles
-		Style = """
-			QWidget {
-				background-color: >>Background<<;
-				color: >>ColorInput<<;
-				font: >>Font<<px ">>StandardFont<<";
-			}
+	# Remove old configuration
+	for Group in Parent.findall("Group[@ID=\"mapp.AlarmX.Core.Configuration\"]"):
+		Parent.remove(Group)
 
-			QDialog {
-				border: 2px solid >>WindowBorderError<<;
-			}
+	# Serialize the file with a placeholder of the alarm list
+	MpAlarmList = et.SubElement(Parent, "Group", {"ID": "mapp.AlarmX.Core.Configuration"})
+	if Alarms:
+		MpAlarmList.append(et.Comment("Alarm list"))
+	MpAlarmHead, Placeholder, MpAlarmTail = et.tostring(MpAlarmRoot).partition(b"<!--Alarm list-->")
+
+	# Write groups of alarms in place of the placeholder
+	TempPath = MpAlarmPath + ".tmp"
+	with open(TempPath, "wb") as TempFile:
+		TempFile.write(MpAlarmHead)
+		PropertiesCache = {}
+		Index = 0
+		for Alarm in Alarms:
+			PropertiesXml = MpAlarmCreateProperties(Alarm["Properties"], PropertiesCache)
+			for AlarmName in CreateNames(Alarm):
+				TempFile.write(MpAlarmCreateGroup(Index, AlarmName, PropertiesXml))
+				Index += 1
+		TempFile.write(MpAlarmTail)
 
-			QLabel {
-				background-color: >>BackgroundOutput<<;
-				color: >>ColorOutput<<;
-				padding: 5px;
-				border-radius: 8px;
-			}
-			"""
-		Self.setStyleSheet(FinishStyle(Style))
+	# Save file
+	ReplaceFile(MpAlarmPath, TempPath)
 
-		# Set general dialog settings
-		Self.setWindowTitle("Error")
-		Self.setWindowFlag(Qt.FramelessWindowHint)
-		Self.setGeometry(0, 0, 100, 100)
+# Creates sections of groups of alarms of the severities, returns text parts of the sections and maximal number of nested FOR loops
+def CreateSections(AlarmGroups, Severities, ProgramLanguage, NameTable, Indent):
+	if ProgramLanguage == LANGUAGE_C:
+		ProgramErrorText = [Indent + "/********************************************* Errors *********************************************/"]
+		ProgramWarningText = ["\n\t\n" + Indent + "/******************************************** Warnings ********************************************/"]
+		ProgramInfoText = ["\n\t\n" + Indent + "/********************************************* Infos **********************************************/"]
+	elif ProgramLanguage == LANGUAGE_ST:
+		ProgramErrorText = [Indent + "(********************************************* Errors *********************************************)"]
+		ProgramWarningText = ["\n\t\n" + Indent + "(******************************************** Warnings ********************************************)"]
+		ProgramInfoText = ["\n\t\n" + Indent + "(********************************************* Infos **********************************************)"]
 
-		# Create widgets
-		DialogVBL = QVBoxLayout(Self)
+	SectionText = []
+	MaxNumberOfForLoops = 0
+	Sliced = (UserData["TimeSlices"] > 1) and not UserData["AlarmTable"]
+
+	# Time slices of alarms are processed one per cycle in round-robin order
+	for Severity, SeverityText in (("Error", ProgramErrorText), ("Warning", ProgramWarningText), ("Info", ProgramInfoText)):
+		if Severity not in Severities:
+			continue
+		# The first section is inserted without the leading empty line
+		if len(SectionText) == 0:
+			SeverityText[0] = SeverityText[0].removeprefix("\n\t\n")
+		Slices = [list(AlarmGroups[Severity].values())]
+		if Sliced and not ((Severity == "Error") and UserData["ErrorsEveryCycle"]):
+			Slices = SplitIntoSlices(Slices[0], UserData["TimeSlices"])
+		for Slice, Groups in enumerate(Slices):
+			if len(Groups) == 0:
+				continue
+			Shift = 0
+			if len(Slices) > 1:
+				Shift = 1
+				SeverityText.append(EmitSetResetBlock([("If", 1, ("Equal", "AlarmSlice", str(Slice)))], ProgramLanguage))
+			LastVariableName = ""
+			for Group in Groups:
+				VariableName = Group[0][0]["Path"][0]["Name"]
+				if not(LastVariableName == VariableName):
+					SeverityText.append("\n" + Indent + "\t" * Shift + "// Global variable " + VariableName)
+				NumberOfForLoops = AlarmSetReset(SeverityText, Group, ProgramLanguage, NameTable, Shift)
+				LastVariableName = VariableName
+				
+				if NumberOfForLoops > MaxNumberOfForLoops:
+					MaxNumberOfForLoops = NumberOfForLoops
+			if Shift != 0:
+				SeverityText.append(EmitSetResetBlock([("EndIf", 1)], ProgramLanguage) + "\n\t")
+		SectionText += SeverityText
+	return SectionText, MaxNumberOfForLoops
+
+# Writes shard files of the program, adds them to the list of program files and removes shards which are no longer generated
+def UpdateShards(ProgramPath, ProgramName, Shards, ProgramLanguage):
+	ProgramDir = os.path.dirname(ProgramPath)
+	Extension = EXTENSIONS[ProgramLanguage]
+	ShardFiles = [ShardName + Extension for ShardName in Shards]
+	StalePaths = [ShardPath for ShardPath in GetShardPaths(ProgramDir, ProgramName) if os.path.basename(ShardPath) not in ShardFiles]
+	if (len(Shards) == 0) and (len(StalePaths) == 0):
+		return
+
+	for ShardName, ShardText in Shards.items():
+		if ProgramLanguage == LANGUAGE_C:
+			Text = "#include <bur/plctypes.h>\n#ifdef _DEFAULT_INCLUDES\n\t#include <AsDefault.h>\n#endif\n\n// Automatically generated alarms, do not edit\nvoid " + ShardName + "(void)\n{\n" + "".join(ShardText) + "\n}\n"
+		else:
+			Text = "// Automatically generated alarms, do not edit\nACTION " + ShardName + ":\n" + "".join(ShardText) + "\nEND_ACTION\n"
+		WriteFile(os.path.join(ProgramDir, ShardName + Extension), EncodeText(Text))
+	for StalePath in StalePaths:
+		os.remove(StalePath)
+
+	# Shard files are listed as files of the program
+	ListingPath = GetProgramListingPath(ProgramDir)
+	if ListingPath == "":
+		print("Warning: List of files of the program " + ProgramName + " not found, shard files have to be added to the program manually.")
+		return
+	with open(ListingPath, "r", encoding = "utf-8") as ListingFile:
+		ListingText = ListingFile.read()
+	NewText = re.sub(r"^[ \t]*<File[^>]*>" + re.escape(ProgramName) + r"Shard_\w+\.(?:st|c)</File>\n", "", ListingText, flags = re.M)
+	Indentation = re.search(r"^([ \t]*)<File\b", ListingText, re.M)
+	if Indentation != None:
+		Indentation = Indentation.group(1)
+	else:
+		Indentation = "    "
+	Entries = "".join(Indentation + "<File Description=\"Generated alarms\">" + ShardFile + "</File>\n" for ShardFile in ShardFiles)
+	NewText, Count = re.subn(r"^([ \t]*</Files>)", lambda Match: Entries + Match.group(1), NewText, count = 1, flags = re.M)
+	if (Count == 0) and (len(ShardFiles) != 0):
+		print("Warning: Element Files not found in " + os.path.basename(ListingPath) + ", shard files have to be added to the program manually.")
+	WriteFile(ListingPath, EncodeText(NewText, "utf-8"))
+
+# Returns paths of existing shard files of the program
+def GetShardPaths(ProgramDir, ProgramName):
+	FileNames, SubDirNames = ListDirectory(ProgramDir)
+	return [os.path.join(ProgramDir, FileName) for FileName in sorted(FileNames) if re.fullmatch(re.escape(ProgramName) + r"Shard_\w+\.(?:st|c)", FileName)]
+
+# Returns path to the file listing files of the program (IEC.prg, ANSIC.prg or Package.pkg)
+def GetProgramListingPath(ProgramDir):
+	FileNames, SubDirNames = ListDirectory(ProgramDir)
+	for FileName in sorted(FileNames):
+		if FileName.endswith(".prg"):
+			return os.path.join(ProgramDir, FileName)
+	if "Package.pkg" in FileNames:
+		return os.path.join(ProgramDir, "Package.pkg")
+	return ""
+
+# Returns names of programs with severities of alarms generated to them, severities without their own program are generated to the main program
+def GetPrograms() -> dict:
+	Programs = {}
+	for Severity in ("Error", "Warning", "Info"):
+		ProgramName = UserData["SeverityProgram"][Severity]
+		if ProgramName == "":
+			ProgramName = UserData["ProgramName"]
+		Programs.setdefault(ProgramName, []).append(Severity)
+	return Programs
+
+# Update program files, programs with alarms generated by the last run which no longer get any alarms are cleared
+def UpdateProgram() -> list:
+	Programs = GetPrograms()
+	for ProgramName in gCaches["fingerprint"]["Previous"].get("Programs", []):
+		if (ProgramName not in Programs) and any(FindFilePath(LogicalPath, ProgramName + Extension, False) != "" for Extension in EXTENSIONS):
+			print("Warning: Program " + ProgramName + " no longer gets any alarms, its automatically generated code is removed.")
+			UpdateProgramFile(ProgramName, [])
+	for ProgramName, Severities in Programs.items():
+		UpdateProgramFile(ProgramName, Severities)
+	return list(Programs)
+
+# Update program file with alarms of given severities
+def UpdateProgramFile(ProgramName, Severities):
+	#####################################################################################################################################################
+	# Update alarms program
+	#####################################################################################################################################################
 
-		for Message in Messages:
-			ErrorL = QLabel(Message)
-			ErrorL.setOpenExternalLinks(True)
-			DialogVBL.addWidget(ErrorL)
+	# Detect programming language
+	if (FindFilePath(LogicalPath, ProgramName + EXTENSIONS[LANGUAGE_C], False) != ""):
+		ProgramLanguage = LANGUAGE_C
+	else:
+		ProgramLanguage = LANGUAGE_ST
 	
-		# Show dialog
-		ShowAdjusted(Self)
-
-	# Size of the window changed
-	def resizeEvent(Self, Event: QEvent):
-		Self.TitleBar.resize(Self.width(), Self.TitleBar.height())
-		Self.TitleBar.Title.setMinimumWidth(Self.width())
-
-#####################################################################################################################################################
-# Global functions
-#####################################################################################################################################################
-# Get whole header of xml file
-def GetXmlHeader(FilePath):
-	Header = ""
-	File = open(FilePath,"r", encoding = "utf-8")
-	for Line in File:
-		if ("<?" in Line) and ("?>" in Line):
-			Header += Line
-		else:
-			break
-	File.close()
-	return Header
+	# Ouput window message
+	print("Updating " + ProgramName + EXTENSIONS[ProgramLanguage] + " file...")
 
-# Show widget with adjusted size
-def ShowAdjusted(Widget: QWidget):
-	# Adjust window size and position (must be twice to really adjust the size)
-	Widget.adjustSize()
-	Widget.adjustSize()
-	Rectangle = Widget.frameGeometry()
-	CenterPoint = QDesktopWidget().availableGeometry().center()
-	Rectangle.moveCenter(CenterPoint)
-	Widget.move(Rectangle.topLeft())
-	Widget.show()
+	# Generate cyclic program
+	ProgramPath = FindFilePath(LogicalPath, ProgramName + EXTENSIONS[ProgramLanguage], True)
 
-# Finish style with defined constants
-def FinishStyle(Style: str):
-	Style = Style.replace(">>StandardFont<<", DEFAULT_GUI_FONT)
-	for DefaultSizeElement in DEFAULT_GUI_SIZE:
-		Style = Style.replace(">>" + DefaultSizeElement + "<<", gAdjustedGuiSize[DefaultSizeElement])
-	for DefaultColorElement in DEFAULT_GUI_COLOR:
-		Style = Style.replace(">>" + DefaultColorElement + "<<", DEFAULT_GUI_COLOR[DefaultColorElement])
-	return Style
+	# Create whole automatically generated cyclic section and insert it to the file
+	ProgramFile = open(ProgramPath, "r")
+	ProgramText = []
+	AutomaticSectionStartFound = False
+	InAutomaticSection = False
+	TableNames = []
+	TableResets = []
+	CheckNames = {}
+	NameTable = {"Alarms": [], "Size": 0, "Length": 1, "Member": "Name"}
+	NameTables = [NameTable]
+	Sliced = (UserData["TimeSlices"] > 1) and not UserData["AlarmTable"] and (len(Severities) != 0)
+	Sharded = UserData["ShardFiles"] and not UserData["AlarmTable"]
+	Shards = {}
+	Indent = "\t"
 
-# Terminates the script
-def TerminateScript():
-	# Ouput window message
-	print("--------------------------------- End of the script CreateAlarms ---------------------------------")
-	sys.exit()
+	MaxNumberOfForLoops = 0
+	for ProgramLine in ProgramFile:
+		if not InAutomaticSection:
+			ProgramText.append(ProgramLine)
+		if (ProgramLine.find("// START OF AUTOMATIC CODE GENERATION //") != -1): # Automatic generation section start
+			AutomaticSectionStartFound = True
+			InAutomaticSection = True
+			# Alarms of one structure are grouped under one guard, otherwise each alarm is a group of its own
+			AlarmGroups = {"Error": {}, "Warning": {}, "Info": {}}
+			for Alarm in Alarms:
+				SetResetNotValid = False
+				ResetAlarm = False
+				for Property in Alarm["Properties"]:
+					if Property["Key"] == "Behavior":
+						if ("Monitoring" in Property["Value"]) or not Property["Valid"]:
+							SetResetNotValid = True
+							break
+						elif (Property["Value"] in (RANGE_BEHAVIOR[1:])):
+							ResetAlarm = True
+							break
+				if not SetResetNotValid and (Alarm["Severity"] in Severities):
+					Groups = AlarmGroups[Alarm["Severity"]]
+					if UserData["ChangeGuard"]:
+						GroupKey = ".".join(PathMember["Name"] for PathMember in Alarm["Path"])
+					else:
+						GroupKey = len(Groups)
+					Groups.setdefault(GroupKey, []).append((Alarm, ResetAlarm))
+
+			# Alarms of each global variable are generated to their own file, the program only calls them
+			if len(Severities) == 0:
+				SectionText = []
+			elif UserData["AlarmTable"]:
+				# Names and behavior of alarm instances are constants of the table type, the first alarm of each global variable checks the table
+				for Severity in Severities:
+					for Group in AlarmGroups[Severity].values():
+						for Alarm, ResetAlarm in Group:
+							for AlarmName in CreateNames(Alarm):
+								CheckNames.setdefault(Alarm["Path"][0]["Name"], AlarmName)
+								TableNames.append(AlarmName)
+								TableResets.append(ResetAlarm)
+				SectionText = [EmitSetResetBlock(CreateTableBlocks(len(TableNames), list(CheckNames.values())), ProgramLanguage)[1:] + "\n\t"]
+			elif Sharded:
+				ShardGroups = {}
+				for Severity, Groups in AlarmGroups.items():
+					for GroupKey, Group in Groups.items():
+						VariableName = Group[0][0]["Path"][0]["Name"]
+						ShardGroups.setdefault(VariableName, {"Error": {}, "Warning": {}, "Info": {}})[Severity][GroupKey] = Group
+				Dispatcher = []
+				for VariableName, Groups in ShardGroups.items():
+					ShardName = ProgramName + "Shard_" + VariableName
+					ShardSeverities = [Severity for Severity in Severities if len(Groups[Severity]) != 0]
+					# Each shard has its own array of names, so that indexes in the shard do not depend on alarms of other shards
+					ShardNameTable = {"Alarms": [], "Size": 0, "Length": 1, "Member": VariableName}
+					NameTables.append(ShardNameTable)
+					Shards[ShardName], NumberOfForLoops = CreateSections(Groups, ShardSeverities, ProgramLanguage, ShardNameTable, Indent)
+					MaxNumberOfForLoops = max(MaxNumberOfForLoops, NumberOfForLoops)
+					Dispatcher.append(("Declare", 1, ("Var", ShardName)))
+					Dispatcher.append(("Action", 1, ("Var", ShardName)))
+				SectionText = [EmitSetResetBlock(Dispatcher, ProgramLanguage)[1:] + "\n\t"]
+			else:
+				SectionText, MaxNumberOfForLoops = CreateSections(AlarmGroups, Severities, ProgramLanguage, NameTable, Indent)
 
-# Debug printing
-def DebugPrint(Message, Data):
-	if UserData["Debug"]: print(">> " + Message + " >> " + str(Data) + "\n")
+			ProgramText += SectionText
+			if Sliced:
+				SliceCounter = [("If", 1, ("Equal", "AlarmSlice", str(UserData["TimeSlices"] - 1))),
+								("Assign", 2, ("Var", "AlarmSlice"), ("Var", "0")),
+								("Else", 1),
+								("Assign", 2, ("Var", "AlarmSlice"), ("Var", "AlarmSlice + 1")),
+								("EndIf", 1)]
+				ProgramText.append("\n\t// Slice of alarms processed in the next cycle" + EmitSetResetBlock(SliceCounter, ProgramLanguage))
 
-# Finds file in directory and subdirectories, returns path to the FIRST found file and terminates script if file does not found and termination is required
-# If *.extension FileName input (i.e. *.var) is specified, returns list of all occurrences of this extension
-def FindFilePath(SourcePath, FileName, Terminate):
-	if "*" in FileName: FilePath = []
-	else: FilePath = ""
-	EndLoop = False
-	for DirPath, DirNames, FileNames in os.walk(SourcePath):
-		if "*" in FileName:
-			for File in FileNames:
-				if File.endswith(FileName[1:]):
-					FilePath.append(os.path.join(DirPath, File))
-		else:
-			for File in FileNames:
-				if File == FileName:
-					FilePath = os.path.join(DirPath, File)
-					EndLoop = True
-			if EndLoop:
-				break
-	if (FilePath == "" or FilePath == []) and Terminate:
-		print("Error: File " + FileName + " does not exist.")
-		TerminateScript()
-	return FilePath
+		elif (ProgramLine.find("// END OF AUTOMATIC CODE GENERATION //") != -1): # Automatic generation section end
+			InAutomaticSection = False
+			ProgramText.append("\n\t\n" + ProgramLine)
 
-# Checks if file exists and terminates script if not
-def IsFile(FilePath):
-	if not os.path.isfile(FilePath):
-		print("Error: File " + os.path.basename(FilePath) + " does not exist.")
+	ProgramFile.close()
+	if not AutomaticSectionStartFound:
+		print("Error: Start of automatically generated section not found. Insert comment // START OF AUTOMATIC CODE GENERATION // to Alarms" + EXTENSIONS[ProgramLanguage] + ".")
 		TerminateScript()
-	return True
-
-# Checks if directory exists and terminates script if not
-def IsDir(DirPath):
-	if not os.path.isdir(DirPath):
-		print("Error: Directory " + DirPath + " does not exist.")
+	elif InAutomaticSection:
+		print("Error: End of automatically generated section not found. Insert comment // END OF AUTOMATIC CODE GENERATION // to Alarms" + EXTENSIONS[ProgramLanguage] + ".")
 		TerminateScript()
-	return True
-
-# Get project info (project name, project path, path to logical)
-def GetProjectInfo():
-	CurrentPath = os.path.dirname(os.path.abspath(__file__))
-	if (CurrentPath.find("Logical") == -1):
-		print("Error: Directory 'Logical' does not exist.")
-		ProjectName = ProjectPath = LogicalPath = ""
 	else:
-		# Get project path
-		ProjectPath = CurrentPath[:CurrentPath.find("Logical") - 1]
+		WriteFile(ProgramPath, EncodeText("".join(ProgramText)))
+		UpdateShards(ProgramPath, ProgramName, Shards, ProgramLanguage)
+		
+	# Check if necessary variables exist and create them if not
+	AlarmsVarPath = FindFilePath(os.path.dirname(ProgramPath), ProgramName + ".var", True)
+	AlarmsVarFile = open(AlarmsVarPath, "r")
+	AlarmsVarContent = AlarmsVarFile.read()
+	AlarmsVarText = "\nVAR"
+	if not "Flag : FlagType;" in AlarmsVarContent:
+		AlarmsVarText += "\n\tFlag : FlagType; (*Flag structure used for edge detection*)"
+	if (MaxNumberOfForLoops > 0) and not UserData["AlarmTable"] and not UserData["AlarmNames"] and (not "HelpName : STRING[255];" in AlarmsVarContent):
+		AlarmsVarText += "\n\tHelpName : STRING[255]; (*Auxiliary string for composing alarms name*)"
+	if (MaxNumberOfForLoops > 0) and not UserData["AlarmNames"] and (not "String : STRING[255];" in AlarmsVarContent):
+		AlarmsVarText += "\n\tString : STRING[255]; (*Auxiliary string for converting numbers to string*)"
+	if UserData["AlarmNames"] and not UserData["AlarmTable"] and (not "AlarmNames : AlarmNamesType;" in AlarmsVarContent):
+		AlarmsVarText += "\n\tAlarmNames : AlarmNamesType; (*Names of alarms in arrays*)"
+	if UserData["AlarmTable"]:
+		if not "AlarmTable : AlarmTableType;" in AlarmsVarContent:
+			AlarmsVarText += "\n\tAlarmTable : AlarmTableType; (*Table of all alarms*)"
+		if not "AlarmIndex : DINT;" in AlarmsVarContent:
+			AlarmsVarText += "\n\tAlarmIndex : DINT; (*Index for iteration in the alarm table*)"
+		if not "AlarmValue : REFERENCE TO BOOL;" in AlarmsVarContent:
+			AlarmsVarText += "\n\tAlarmValue : REFERENCE TO BOOL; (*Alarm of the alarm table entry*)"
+		if not "AlarmStatus : UINT;" in AlarmsVarContent:
+			AlarmsVarText += "\n\tAlarmStatus : UINT; (*Status of the lookup of the alarm address*)"
+		if not "AlarmLength : UDINT;" in AlarmsVarContent:
+			AlarmsVarText += "\n\tAlarmLength : UDINT; (*Length of the alarm found by the lookup*)"
+		if UserData["PackedFlags"]:
+			if not "AlarmWord : DINT;" in AlarmsVarContent:
+				AlarmsVarText += "\n\tAlarmWord : DINT; (*Index of the word of packed flags*)"
+			if not "AlarmEnd : DINT;" in AlarmsVarContent:
+				AlarmsVarText += "\n\tAlarmEnd : DINT; (*Index of the last alarm of the word*)"
+			if not "AlarmState : UDINT;" in AlarmsVarContent:
+				AlarmsVarText += "\n\tAlarmState : UDINT; (*States of alarms of the word*)"
+			if not "AlarmMask : UDINT;" in AlarmsVarContent:
+				AlarmsVarText += "\n\tAlarmMask : UDINT; (*Bit of the alarm in the word*)"
+			if not "AlarmChanged : UDINT;" in AlarmsVarContent:
+				AlarmsVarText += "\n\tAlarmChanged : UDINT; (*Changed alarms of the word*)"
+	if Sliced and (not "AlarmSlice : UINT;" in AlarmsVarContent):
+		AlarmsVarText += "\n\tAlarmSlice : UINT; (*Slice of alarms processed in this cycle*)"
+	for Index in range(MaxNumberOfForLoops):
+		if not ("ArrayIndex" + str(Index + 1) + " : INT;") in AlarmsVarContent:
+			AlarmsVarText += "\n\tArrayIndex" + str(Index + 1) + " : INT; (*Index for iteration in for loops*)"
+		
+	AlarmsVarText += "\nEND_VAR"
+	if AlarmsVarText != "\nVAR\nEND_VAR":
+		AlarmsVarFile.close()
+		AlarmsVarFile = open(AlarmsVarPath, "a")
+		AlarmsVarFile.write(AlarmsVarText)
+		gUpdatedFiles.append(AlarmsVarPath)
+	AlarmsVarFile.close()
 
-		# Get project name
-		ProjectName = os.path.basename(ProjectPath)
+	# Generate Flag type
+	AutomaticSectionStartFound = False
+	InAutomaticSection = False
+	AlarmsTypText = ""
+	AlarmsTypPath = FindFilePath(os.path.dirname(ProgramPath), ProgramName + ".typ", True)
+	AlarmsTypFile = open(AlarmsTypPath, "r")
+	for AlarmsTypLine in AlarmsTypFile:
+		if not InAutomaticSection:
+			AlarmsTypText += AlarmsTypLine
+		if (AlarmsTypLine.find("// START OF AUTOMATIC CODE GENERATION //") != -1): # Automatic generation section start
+			AutomaticSectionStartFound = True
+			InAutomaticSection = True
 
-		# Get logical path
-		LogicalPath = CurrentPath[:CurrentPath.find("Logical") + 7]
-
-	return ProjectName, ProjectPath, LogicalPath
+			# Local types generation
+			# Get unique paths
+			UniquePaths = []
+			for Alarm in Alarms:
+				if (Alarm["Severity"] in Severities) and (Alarm["Path"] not in UniquePaths):
+					UniquePaths.append(Alarm["Path"])
 
-# Walk through all variables and data types and create list of alarms
-def GetAlarms():
-	"""
-	Gets Alarm list from all variables and types
+			# Flags of the alarm table replace the flag structure
+			if UserData["AlarmTable"]:
+				UniquePaths = []
 
-	Alarms [{
-		Variable: ""
-		Array: [Start, End]
-		Path: [{
-			Name: ""
-			Type: ""
-			Array: [Start, End]
-			Description2: ""
-			ParentType: ""
-		}]
-		Severity: ""
-		Properties: [{
-				Key: ""
-				Value: ""
-				Valid: False/True
-				Tag: ""
-		}]
-	}]
-	"""
+			FlagTypeHeader = "\nTYPE\n\tFlagType : STRUCT  (*Flag structure used for edge detection*)"
+			LocalTypes = [FlagTypeHeader]
+			for UniquePath in UniquePaths:
+				for IndexMember, Member in enumerate(UniquePath):
+					if IndexMember == 0:
+						if not Member["Name"] in LocalTypes[0]:
+							if Member["Array"] != "":
+								TypeFormat = "ARRAY[" + str(Member["Array"][0]) + ".." + str(Member["Array"][1]) + "]OF "
+							else:
+								TypeFormat = ""
+							if (IndexMember + 1) != len(UniquePath):
+								TypeFormat += Member["Type"][:-4] + "FlagType;"
+							else:
+								TypeFormat += Member["Type"] + ";"
+							LocalTypes[0] += "\n\t\t" + Member["Name"] + " : " + TypeFormat
+					else:
+						for IndexType, LocalType in enumerate(LocalTypes):
+							if Member["Array"] != "":
+								TypeFormat = "ARRAY[" + str(Member["Array"][0]) + ".." + str(Member["Array"][1]) + "]OF "
+							else:
+								TypeFormat = ""
+							if (IndexMember + 1) != len(UniquePath):
+								TypeFormat += Member["Type"][:-4] + "FlagType;"
+							else:
+								TypeFormat += Member["Type"] + ";"
+							ParentTypeFormat = Member["ParentType"][:-4] + "FlagType"
+							if ParentTypeFormat + " : STRUCT" in LocalType:
+								if not Member["Name"] + " : " + TypeFormat in LocalTypes[IndexType]:
+									if Member["Array"] != "":
+										LocalTypes[IndexType] += "\n\t\t" + Member["Name"] + " : " + TypeFormat
+									else:
+										LocalTypes[IndexType] += "\n\t\t" + Member["Name"] + " : " + TypeFormat
+								break
+							elif (IndexType + 1) == len(LocalTypes):
+								LocalTypes.append("\n\t" + ParentTypeFormat + " : STRUCT")
+								if Member["Array"] != "":
+									LocalTypes[IndexType + 1] += "\n\t\t" + Member["Name"] + " : " + TypeFormat
+								else:
+									LocalTypes[IndexType + 1] += "\n\t\t" + Member["Name"] + " : " + TypeFormat
+								break
+			if (len(LocalTypes) == 1) and (LocalTypes[0] == FlagTypeHeader):
+				LocalTypes[0] += "\n\t\tNew_Member : USINT;"
+			if UserData["AlarmTable"]:
+				TableRange = "ARRAY[0.." + str(max(len(TableNames), 1) - 1) + "]OF "
+				NameLength = max([len(AlarmName) for AlarmName in TableNames] + [1])
+				Names = ", ".join("'" + AlarmName + "'" for AlarmName in TableNames)
+				Resets = ", ".join("TRUE" if ResetAlarm else "FALSE" for ResetAlarm in TableResets)
+				TableType = "\n\tAlarmTableType : STRUCT  (*Table of all alarms*)\n\t\tReady : BOOL; (*Addresses of alarms are valid*)"
+				TableType += "\n\t\tCheck : ARRAY[0.." + str(max(len(CheckNames), 1) - 1) + "]OF UDINT; (*Addresses of the first alarm of each global variable when the table was filled*)"
+				TableType += "\n\t\tDummy : BOOL; (*Replaces alarms whose address was not found*)"
+				TableType += "\n\t\tAlarm : " + TableRange + "UDINT; (*Addresses of alarms*)"
+				TableType += "\n\t\tName : " + TableRange + "STRING[" + str(NameLength) + "]" + (" := [" + Names + "]" if Names != "" else "") + "; (*Names of alarms*)"
+				TableType += "\n\t\tReset : " + TableRange + "BOOL" + (" := [" + Resets + "]" if Resets != "" else "") + "; (*Alarm is reset by the program*)"
+				if UserData["PackedFlags"]:
+					TableType += "\n\t\tFlags : ARRAY[0.." + str(max((len(TableNames) + 31) // 32, 1) - 1) + "]OF UDINT; (*Flags used for edge detection, one bit per alarm*)"
+				else:
+					TableType += "\n\t\tFlag : " + TableRange + "BOOL; (*Flags used for edge detection*)"
+				LocalTypes.append(TableType)
+			if UserData["AlarmNames"] and not UserData["AlarmTable"]:
+				NamesType = "\n\tAlarmNamesType : STRUCT  (*Names of alarms in arrays*)"
+				UsedNameTables = [UsedNameTable for UsedNameTable in NameTables if UsedNameTable["Size"] != 0]
+				if len(UsedNameTables) == 0:
+					UsedNameTables = [NameTable]
+				for UsedNameTable in UsedNameTables:
+					Names = ", ".join("'" + AlarmName + "'" for Alarm in UsedNameTable["Alarms"] for AlarmName in CreateNames(Alarm))
+					if Names != "":
+						Names = " := [" + Names + "]"
+					NamesType += "\n\t\t" + UsedNameTable["Member"] + " : ARRAY[0.." + str(max(UsedNameTable["Size"], 1) - 1) + "]OF STRING[" + str(UsedNameTable["Length"]) + "]" + Names + "; (*Names of alarm instances*)"
+				LocalTypes.append(NamesType)
+			for LocalType in LocalTypes:
+				AlarmsTypText += LocalType + "\n\tEND_STRUCT;"
+			AlarmsTypText += "\nEND_TYPE"
 
-	# Get all valid var and type files
-	VarPaths = GetGlobalPaths("var")
-	TypePaths = GetGlobalPaths("typ")
+		elif (AlarmsTypLine.find("// END OF AUTOMATIC CODE GENERATION //") != -1): # Automatic generation section end
+			InAutomaticSection = False
+			AlarmsTypText += "\n\n" + AlarmsTypLine
 
-	# Get all global variables, constants and types
-	GlobalVars, GlobalConsts = GetGlobalVars(VarPaths)
-	GlobalTypes = GetGlobalTypes(TypePaths, GlobalConsts)
+	AlarmsTypFile.close()
+	if not AutomaticSectionStartFound:
+		print("Error: Start of automatically generated section not found. Insert comment // START OF AUTOMATIC CODE GENERATION // to Alarms.typ.")
+		TerminateScript()
+	elif InAutomaticSection:
+		print("Error: End of automatically generated section not found. Insert comment // END OF AUTOMATIC CODE GENERATION // to Alarms.typ.")
+		TerminateScript()
+	else:
+		WriteFile(AlarmsTypPath, EncodeText(AlarmsTypText))
 
-	# Look for all types with Error/Warning/Info in name
-	AlarmTypes = []
-	for GlobalType in GlobalTypes:
-		if (UserData["AlarmKeyword"]["Error"] in GlobalType["ParentType"]) or (UserData["AlarmKeyword"]["Warning"] in GlobalType["ParentType"]) or (UserData["AlarmKeyword"]["Info"] in GlobalType["ParentType"]):
-			AlarmTypes.append(GlobalType["ParentType"])
-	
-	# Generate all alarm paths
-	AlarmPaths = []
-	GetPaths(AlarmTypes, GlobalTypes, AlarmPaths, True)
-	for AlarmPath in AlarmPaths:
-		AlarmPath.reverse()
+#####################################################################################################################################################
+# Main
+#####################################################################################################################################################
 
-	# Add global variables to alarm paths
-	AlarmPaths = AddVarsToPaths(GlobalVars, GlobalTypes, AlarmPaths)
+# Get project info
+ProjectName, ProjectPath, LogicalPath = GetProjectInfo()
 
-	# Create alarm list
-	Alarms = CreateAlarms(GlobalTypes, AlarmPaths)
+# Script mode decision
+if LogicalPath == "":
+	# Logical path not found
+	RunMode = MODE_ERROR
 
-	# Alarm paths print
-	if UserData["Debug"]:
-		print("Paths to alarms:")
-		for Index, Alarm in enumerate(Alarms):
-			print(str(Index + 1) + ": " + str(PathToAlarm(Alarm)))
-		print("\n")
+elif "-prebuild" in sys.argv:
+	# Argument -prebuild found
+	RunMode = MODE_PREBUILD
 
-	# Parse properties of alarms
-	Alarms = ParseProperties(Alarms)
-	Alarms = SortByCode(Alarms)
+else:
+	# Argument -prebuild not found
+	RunMode = MODE_CONFIGURATION
 
-	DebugPrint("Alarms", Alarms)
+if not(RunMode == MODE_ERROR):
+	# Get path to user data
+	UserDataPath = os.path.join(os.getenv("APPDATA"), "BR", "Scripts", "CreateAlarms", ProjectName)
+	if not os.path.isdir(os.path.dirname(UserDataPath)):
+		os.makedirs(os.path.dirname(UserDataPath))
 
-	return Alarms
+	# Load user data
+	try:
+		with open(UserDataPath, "rb") as CreateAlarmsSettings:
+			UserData = pickle.load(CreateAlarmsSettings)
+	except:
+		UserData = copy.deepcopy(DEFAULT_USER_DATA)
+
+	# Settings saved by older versions keep their values, new settings get default values and unknown settings are dropped
+	SavedUserData = UserData
+	UserData = copy.deepcopy(DEFAULT_USER_DATA)
+	if type(SavedUserData) == dict:
+		for Key, Value in SavedUserData.items():
+			if (Key in UserData) and (type(Value) == type(UserData[Key])):
+				if type(Value) == dict:
+					UserData[Key].update((SubKey, SubValue) for SubKey, SubValue in Value.items() if SubKey in UserData[Key])
+				else:
+					UserData[Key] = Value
 
-# Get all global paths excluding private files and files from Libraries
-def GetGlobalPaths(Extension):
-	# Get path to all .Extension files
-	GlobalPaths = FindFilePath(LogicalPath, "*." + Extension, True)
+	# Get selected config path
+	ConfigPath = os.path.join(ProjectPath, "Physical", UserData["Configuration"])
 
-	# Remove undesirable Extension files
-	PathsToRemove = []
-	for GlobalPath in GlobalPaths:
-		FileName = os.path.basename(GlobalPath)
-		DirName = os.path.dirname(GlobalPath)
+# Prebuild mode needs only the standard library, the script ends here
+if RunMode == MODE_PREBUILD:
+	if UserData["Enable"]:
+		Prebuild()
+	sys.exit()
 
-		# Remove all "Libraries" files
-		if "Libraries" in GlobalPath:
-			PathsToRemove.append(GlobalPath)
+#####################################################################################################################################################
+# Graphical user interface (PyQt5 is imported only in configuration and error mode)
+#####################################################################################################################################################
+from PyQt5.QtCore import *
+from PyQt5.QtGui import *
+from PyQt5.QtWidgets import *
 
-		# Remove all Private files
-		elif os.path.isfile(os.path.join(DirName, "Package.pkg")):
-			PkgPath = os.path.join(DirName, "Package.pkg")
-			PkgFile = open(PkgPath, "r")
-			for Line in PkgFile:
-				if (FileName in Line) and ("Private=\"true\"" in Line):
-					PathsToRemove.append(GlobalPath)
-		else:
-			PathsToRemove.append(GlobalPath)
+# Main GUI window
+class MainWindow(QWidget):
+	# Initialization of the window
+	def __init__(Self):
+		super(MainWindow, Self).__init__()
 
-	GlobalPaths = list(set(GlobalPaths) - set(PathsToRemove))
-	DebugPrint("All valid ." + Extension + " files", GlobalPaths)
+		# Window functions
+		Self.CreateGlobalWidgets()
+		Self.CreateFormWidgets()
+		Self.CreateActions()
 
-	return GlobalPaths
+		# Show window
+		ShowAdjusted(Self)
 
-# Get all global variables from VarPaths
-def GetGlobalVars(VarPaths):
-	"""
-	Parses variables and constants from all valid global .var files.
+	# Global widgets of the window
+	def CreateGlobalWidgets(Self):
+		# Set frameless window
+		Self.setWindowFlags(Self.windowFlags() | Qt.FramelessWindowHint)
+		Self.setWindowTitle(WINDOW_TITLE)
 
-	GlobalVars [{
-		Name: ""
-		Type: ""
-		Array: [Start, End]
-	}]
+		# Create title bar
+		Self.TitleBar = TitleBar(Self, WINDOW_TITLE, DEFAULT_GUI_COLOR["WindowBorderStandard"], True, True, True)
+		Self.setContentsMargins(0, Self.TitleBar.height(), 0, 0)
 
-	GlobalConsts [{
-		Name: ""
-		Type: ""
-		Value: ""
-	}]
-	"""
-	GlobalVars = []
-	GlobalConsts = []
-	for VarPath in VarPaths:
-		VarFile = open(VarPath, "r")
-		VarText = VarFile.read()
-		VarFile.close()
-		VarStructures = re.findall(PATTERN_VAR_SECTION, VarText)
-		for VarStructure in VarStructures:
-			if (VarStructure[0] != '') or (VarStructure[2] != ''):
-				if VarStructure[0] != '':
-					Vars = re.findall(PATTERN_VARIABLE, VarStructure[0])
-				else:
-					Vars = re.findall(PATTERN_VARIABLE, VarStructure[2])
-				for Var in Vars:
-					if Var[0] != '':
-						GlobalVars.append({"Name":Var[0], "Type":Var[2], "Array": ""})
-					elif Var[3] != '':
-						GlobalVars.append({"Name":Var[3], "Type":Var[6], "Array": [Var[4], Var[5]]})
-			elif VarStructure[1] != '':
-				Vars = re.findall(PATTERN_CONSTANT, VarStructure[1])
-				for Var in Vars:
-					if Var[1] in PERMITTED_TYPES_OF_ARRAY_CONSTANTS:
-						GlobalConsts.append({"Name":Var[0], "Type":Var[1], "Value": Var[2]})
-	
-	GlobalConsts = GetConstsValue(GlobalConsts)
-	GlobalVars = ReplaceConstsByNums(GlobalVars, GlobalConsts)
-	DebugPrint("Global constants", GlobalConsts)
-	DebugPrint("Global variables", GlobalVars)
+		# Create bottom button bar
+		Self.BottomBar = BottomBar(Self)
+		
+		# Create info dialog to inform the user
+		Self.InfoD = InfoDialog()
 
-	return GlobalVars, GlobalConsts
+		# Adjust window size
+		Self.resize(800, Self.TitleBar.height())
+		Self.setMaximumSize(1920, 1080)
 
-# Parse global types
-def GetGlobalTypes(TypePaths, GlobalConsts):
-	"""
-	Parses types from all valid global .typ files.
+		# Set window styles
+		Style = """
+		QWidget {
+			background-color: >>Background<<;
+			color: >>ColorInput<<;
+			font: >>Font<<px ">>StandardFont<<";
+		}
 
-	GlobalTypes [{
-		Name: ""
-		Type: ""
-		Array: [Start, End]
-		Description2: ""
-		ParentType: ""
-	}]
-	"""
-	GlobalTypes = []
-	for TypePath in TypePaths:
-		TypeFile = open(TypePath, "r")
-		TypeText = TypeFile.read()
-		TypeFile.close()
-		TypeStructures = re.findall(PATTERN_STRUCTURE, TypeText)
-		for TypeStructure in TypeStructures:
-			Members = re.findall(PATTERN_MEMBER, TypeStructure[1])
-			for Member in Members:
-				if Member[0] != '':
-					GlobalTypes.append({"Name": Member[0], "Type": Member[3], "Array": [Member[1], Member[2]], "Description2": Member[5], "ParentType": TypeStructure[0]})
-				else:
-					GlobalTypes.append({"Name": Member[6], "Type": Member[7], "Array": "", "Description2": Member[9], "ParentType": TypeStructure[0]})
-		GlobalTypes = ReplaceConstsByNums(GlobalTypes, GlobalConsts)
-	DebugPrint("Global types", GlobalTypes)
+		QGroupBox {
+			border: 2px solid >>WindowBorderStandard<<;
+			border-top: 0px;
+		}
 
-	return GlobalTypes
+		QTabWidget::pane {
+			border-top: 2px solid #222222;
+			background: rgb(245, 245, 245);
+		}
 
-# Get value of all constants
-def GetConstsValue(Consts):
-	NotDoneConsts = []
-	DoneConstsName = []
-	DoneConstsValue = []
-	for Index, Const in enumerate(Consts):
-		try:
-			if type(Const["Value"]) == str:
-				Consts[Index]["Value"] = int(eval(Const["Value"]))
-				DoneConstsName.append(Const["Name"])
-				DoneConstsValue.append(Const["Value"])
-		except:
-			NotDoneConsts.append(Const)
-	if NotDoneConsts != []:
-		FoundZeroDoneConstants = True
-		for Index, Const in enumerate(NotDoneConsts):
-			InnerConsts = re.findall(PATTERN_CONSTANT_VALUE, Const["Value"])
-			for InnerConst in InnerConsts:
-				if InnerConst in DoneConstsName:
-					FoundZeroDoneConstants = False
-					# Consts[Find index of Const with Name in NotDoneConsts[Index]["Name"]]["Value"] = replace all InnerConst by values
-					Consts[next((index for (index, d) in enumerate(Consts) if d["Name"] == NotDoneConsts[Index]["Name"]), None)]["Value"] = re.sub(r"\b%s\b" % InnerConst, str(DoneConstsValue[DoneConstsName.index(InnerConst)]), NotDoneConsts[Index]["Value"])
-		if FoundZeroDoneConstants:
-			for NotDoneConst in NotDoneConsts:
-				InnerConsts = re.findall(PATTERN_CONSTANT_VALUE, NotDoneConst["Value"])
-				for InnerConst in InnerConsts:
-					if next((index for (index, d) in enumerate(NotDoneConsts) if d["Name"] == InnerConst), None) == None:
-						print("Error: Constant " + InnerConst + " cannot be found.")
-			TerminateScript()
-		GetConstsValue(Consts)
-		return Consts
-	else:
-		return Consts
+		QTabBar::disabled {
+			color: #555555;
+		}
 
-# Replace list["Array"] defined with onstants by numbers and convert strings to ints
-def ReplaceConstsByNums(List, GlobalConsts):
-	for Index, Member in enumerate(List):
-		if Member["Array"] != "":
-			for i in (0,1):
-				try:
-					List[Index]["Array"][i] = int(Member["Array"][i])
-				except:
-					try:
-						List[Index]["Array"][i] = GlobalConsts[next((index for (index, d) in enumerate(GlobalConsts) if d["Name"] == Member["Array"][i]), None)]["Value"]
-					except:
-						print("Error: Constant " + Member["Array"][i] + " in array of variable " + Member["Name"] + " cannot be found.")
-						TerminateScript()
-	return List
+		QTabBar::tab::disabled {
+			background-color: #3d3d3d;
+		}
 
-# Get all possible paths to alarm types
-def GetPaths(AlarmTypes, GlobalTypes, AlarmPaths, FirstTime, Nesting = 0):
-	Nesting += 1
-	if Nesting >= UserData["MaxNesting"]:
-		print("Warning: Recursive nesting in data types.")
-		TerminateScript()
-	Types = []
-	AlarmTypes = list(set(AlarmTypes))
-	for GlobalType in GlobalTypes:
-		if GlobalType["Type"] in AlarmTypes:
-			Types.append(GlobalType["ParentType"])
-			if FirstTime:
-				AlarmPaths.append([GlobalType])
-			else:
-				HelpAlarmPaths = []
-				for IndexPath, AlarmPath in enumerate(AlarmPaths):
-					for IndexMember, PathMember in enumerate(AlarmPath):
-						if PathMember["ParentType"] == GlobalType["Type"]:
-							if IndexMember == (len(AlarmPaths[IndexPath]) - 1):
-								AlarmPaths[IndexPath].append(GlobalType)
-							else:
-								HelpList = AlarmPaths[IndexPath][:IndexMember + 1]
-								HelpList.append(GlobalType)
-								DoNotAppend = False
-								for Path in AlarmPaths:
-									if HelpList == Path[:IndexMember+2]:
-										DoNotAppend = True
-										break
-								if not DoNotAppend:
-									if HelpAlarmPaths == []:
-										HelpAlarmPaths.append(HelpList)
-									else:
-										DoNotAppend = False
-										for HelpPath in HelpAlarmPaths:
-											if HelpList == HelpPath:
-												DoNotAppend = True
-												break
-										if not DoNotAppend:
-											HelpAlarmPaths.append(HelpList)
-				if HelpAlarmPaths != []:
-					for HelpPath in HelpAlarmPaths:
-						AlarmPaths.append(HelpPath)
-	if Types != []:
-		GetPaths(Types, GlobalTypes, AlarmPaths, False, Nesting)
+		QTabBar::tab {
+			background-color: #353535;
+			padding: 10px;
+			margin-right: 4px;
+			margin-bottom: 4px;
+			border-radius: 12px;
+		}
 
-# Add global variables to the beginning of the paths
-def AddVarsToPaths(GlobalVars, GlobalTypes, AlarmPaths):
-	ExtendedPaths = []
-	for GlobalVar in GlobalVars:
-		PathsNumber = 0
-		for AlarmPath in AlarmPaths:
-			for IndexMember, PathMember in enumerate(AlarmPath):
-				if GlobalVar["Type"] == PathMember["ParentType"]:
-					PathsNumber += 1
-					HelpPath = AlarmPath[IndexMember:]
-					HelpPath.insert(0, GlobalVar)
-					if HelpPath not in ExtendedPaths:
-						ExtendedPaths.append(HelpPath)
-		if PathsNumber == 0:
-			if (UserData["AlarmKeyword"]["Error"] in GlobalVar["Type"]) or (UserData["AlarmKeyword"]["Warning"] in GlobalVar["Type"]) or (UserData["AlarmKeyword"]["Info"] in GlobalVar["Type"]):
-				for GlobalType in GlobalTypes:
-					if GlobalVar["Type"] == GlobalType["ParentType"]:
-						ExtendedPaths.append([GlobalVar])
-						break
-	return ExtendedPaths
+		QTabBar::tab:selected {
+			background: #222222;
+			color: #dddddd;
+			margin-bottom: 0px;
+			border-bottom-left-radius: 0px;
+			border-bottom-right-radius: 0px;
+		}
 
-# Create alarm list
-def CreateAlarms(GlobalTypes, AlarmPaths):
-	Alarms = []
-	for AlarmPath in AlarmPaths:
-		for GlobalType in GlobalTypes:
-			if (GlobalType["ParentType"] == AlarmPath[-1]["Type"]) and (GlobalType["Type"] == "BOOL"):
-				if (UserData["AlarmKeyword"]["Error"] in GlobalType["ParentType"]):
-					Severity = "Error"
-				elif (UserData["AlarmKeyword"]["Warning"] in GlobalType["ParentType"]):
-					Severity = "Warning"
-				elif (UserData["AlarmKeyword"]["Info"] in GlobalType["ParentType"]):
-					Severity = "Info"
-				GlobalType["Description2"] = re.sub(r"Behavior\.Acknowledge[\s]*=[\s]*RequiredAndResettable", r"Behavior.Acknowledge = 3", GlobalType["Description2"])
-				GlobalType["Description2"] = re.sub(r"Behavior\.Acknowledge[\s]*=[\s]*RequiredAfterActive", r"Behavior.Acknowledge = 2", GlobalType["Description2"])
-				GlobalType["Description2"] = re.sub(r"Behavior\.Acknowledge[\s]*=[\s]*Required", r"Behavior.Acknowledge = 1", GlobalType["Description2"])
-				GlobalType["Description2"] = re.sub(r"Behavior\.Acknowledge[\s]*=[\s]*Disabled", r"Behavior.Acknowledge = 0", GlobalType["Description2"])
-				Alarms.append({"Variable": GlobalType["Name"], "Array": GlobalType["Array"], "Path": AlarmPath, "Severity": Severity, "Properties": GlobalType["Description2"]})
-	return Alarms
+		QTabBar::tab:last {
+			font: ReplaceFontSizepx "Bahnschrift SemiLight SemiConde";
+			background-color: transparent;
+			border-style: none;
+			color: #888888;
+		}
 
-# Returd code of given alarm or 0 if property is not defined
-def GetCode(Alarm) -> int:
-	return next((int(Property["Value"]) for Property in Alarm["Properties"] if Property["Key"] == "Code"), 0)
+		QToolTip {
+			background-color: #eedd22;
+			color: #111111;
+			font: >>TooltipFont<<px ">>StandardFont<<";
+			border: solid black 1px;
+		}
 
-# Sort alarms by 'code' property
-def SortByCode(Alarms):
-	return sorted(Alarms, key=lambda x: (GetCode(x), x["Variable"]))
+		QLabel {
+			background-color: >>BackgroundOutput<<;
+			color: >>ColorOutput<<;
+			padding: 5px;
+			border-radius: 8px;
+		}
 
-# Parse properties of alarms
-def ParseProperties(Alarms):
-	"""
-	Parses Input string and returns list of Alarms.
+		QLineEdit {
+			background-color: >>BackgroundInput<<;
+			color: >>ColorInput<<;
+			border-radius: 8px;
+			padding-left: 10px;
+			height: >>WidgetHeight<<px;
+		}
 
-	Alarm {
-		Task: ""
-		Type: ""
-		Name: ""
-		Properties: [
-			{
-				Key: ""
-				Value: ""
-				Valid: False/True
-				Tag: ""
-			}
-		]
-	}
-	"""
-	for Member in Alarms:
-		Pairs = re.findall(PATTERN_PAIR, Member["Properties"])
-		Properties = []
-		BehaviorFound = False
+		QLineEdit:hover {
+			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #373737, stop:0.505682 #373737, stop:1 #282828);
+			color: >>ColorInput<<;
+		}
 
-		for Pair in Pairs:
-			Key = Pair[0]
-			Value = Pair[1]
-			
-			if Value.startswith("\"") and Value.endswith("\""): 
-				Value = Value[1:-1]
-			
-			if Key in PROPERTIES:
-				BehaviorFound |= (Key == "Behavior")
-				if "FALSE" in PROPERTIES[Key]["Validity"]:
-					Value = Value.upper()
-				Valid = Validity(Member["Variable"], Key, Value)
-				Properties.append({"Key": Key, "Value": Value, "Valid": Valid, "Tag": PROPERTIES[Key]["Tag"], "ID": PROPERTIES[Key]["ID"]})
-			else:
-				print("Warning: Property '" + Key + "' of member '" + PathToAlarm(Member) +"' is not valid.")
-				Properties.append({"Key": Key, "Value": Value, "Valid": False, "Tag": None, "ID": None})
-		
-		if not BehaviorFound and Properties:
-			Key = "Behavior"
-			Properties.append({"Key": Key, "Value": "EdgeAlarm", "Valid": True, "Tag": PROPERTIES[Key]["Tag"], "ID": PROPERTIES[Key]["ID"]})
+		QPlainTextEdit {
+			background-color: >>BackgroundInput<<;
+			color: >>ColorInput<<;
+			border-radius: 8px;
+			padding-left: 10px;
+			padding-top: 10px;
+		}
 
-		if Properties:
-			Properties = sorted(Properties, key=lambda d: d["Key"])
-			Member["Properties"] = Properties
-	
-	return Alarms
+		QPlainTextEdit:hover {
+			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #373737, stop:0.505682 #373737, stop:1 #282828);
+			color: >>ColorInput<<;
+		}
+
+		QPushButton {
+			background-color: >>BackgroundInput<<;
+			color: >>ColorInput<<;
+			width: >>ButtonWidth<<px;
+			height: >>WidgetHeight<<px;
+			border-style: solid;
+			border-radius: 8px;
+		}
+
+		QPushButton:hover {
+			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #373737, stop:0.505682 #373737, stop:1 #282828);
+			color: >>ColorInput<<;
+		}
+
+		QPushButton:pressed {
+			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #2d2d2d, stop:0.505682 #282828, stop:1 #2d2d2d);
+			color: #ffffff;
+		}
+
+		QPushButton:checked {
+			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #095209, stop:1 #0e780e);
+			color:#ffffff;
+		}
+
+		QPushButton:checked:hover {
+			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #084209, stop:1 #0c660e);
+		}
+
+		QPushButton:checked:pressed {
+			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #083108, stop:1 #0d570d);
+		}
+
+		QCheckBox {
+			background-color: transparent;
+			border-style: none;
+		}
+
+		QCheckBox::indicator {
+			background-color: >>BackgroundInput<<;
+			top: 2px;
+			width: >>WidgetHeight<<px;
+			height: >>WidgetHeight<<px;
+			border-radius: 8px;
+			margin-bottom: 4px;
+		}
+
+		QCheckBox::indicator:hover {
+			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #373737, stop:0.505682 #373737, stop:1 #282828);
+		}
+
+		QCheckBox::indicator:pressed {
+			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #2d2d2d, stop:0.505682 #282828, stop:1 #2d2d2d);
+		}
+
+		QCheckBox::indicator:checked {
+			background-color: >>ColorCheckBox<<;
+		}
+
+		QCheckBox::indicator:checked:hover {
+			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #084209, stop:1 #0c660e);
+		}
+
+		QCheckBox::indicator:checked:pressed {
+			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #083108, stop:1 #0d570d);
+		}
+
+		QComboBox {
+			background-color: >>BackgroundInput<<;
+			color: >>ColorInput<<;
+			height: >>WidgetHeight<<px;
+			border: none;
+			border-radius: 8px;
+			padding-left: 10px;
+		}
+
+		QComboBox:hover {
+			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #373737, stop:0.505682 #373737, stop:1 #282828);
+			color: >>ColorInput<<;
+		}
+
+		QComboBox::drop-down {
+			background-color: gray;
+			width: 20px;
+			border-top-right-radius: 8px;
+			border-bottom-right-radius: 8px;
+		}
+
+		QComboBox QAbstractItemView {
+			background-color: >>BackgroundInput<<;
+			color: >>ColorInput<<;
+		}
+		"""
+		Self.setStyleSheet(FinishStyle(Style))
+
+		# Create main group box
+		Self.MainGB = QGroupBox(Self)
+		Self.MainGB.setGeometry(0, Self.TitleBar.height(), Self.width(), Self.height() - Self.TitleBar.height())
+
+		# Create a form Layout
+		Self.LayoutFL = QFormLayout()
+		Self.LayoutFL.setHorizontalSpacing(20)
+
+		# Set layout of window
+		MainVBL = QVBoxLayout(Self)
+		MainVBL.addLayout(Self.LayoutFL)
+		MainVBL.addWidget(Self.BottomBar.BottomBarGB)
+
+	# Form widgets
+	def CreateFormWidgets(Self):
+		# Configuration selection
+		Self.ConfigComboBox = QComboBox()
+		Self.ConfigComboBox.addItems(ConfigName)
+		Self.ConfigComboBox.setToolTip("Select configuration with .mpalarmxcore file")
+		Self.ConfigComboBox.setCurrentText(UserData["Configuration"])
+		ConfigLabel = QLabel("Select configuration")
+		ConfigLabel.setToolTip("Select configuration with .mpalarmxcore file")
+		Self.LayoutFL.addRow(ConfigLabel, Self.ConfigComboBox)
+
+		# Enable
+		Self.EnablePushButton = QPushButton("ENABLE")
+		Self.EnablePushButton.setToolTip("Turns on the prebuild function")
+		Self.EnablePushButton.setCheckable(True)
+		Self.EnablePushButton.setChecked(UserData["Enable"])
+		Self.EnablePushButton.setFixedHeight(50)
+		EnableLabel = QLabel("Enable prebuild")
+		EnableLabel.setToolTip("Turns on the prebuild function")
+		Self.LayoutFL.addRow(EnableLabel, Self.EnablePushButton)
+
+		# Debug option
+		Self.DebugPushButton = QPushButton("DEBUG")
+		Self.DebugPushButton.setToolTip("Turns on printing of debug messages")
+		Self.DebugPushButton.setCheckable(True)
+		Self.DebugPushButton.setChecked(UserData["Debug"])
+		Self.DebugPushButton.setFixedHeight(50)
+		DebugLabel = QLabel("Turn on debugging")
+		DebugLabel.setToolTip("Turns on printing of debug messages")
+		Self.LayoutFL.addRow(DebugLabel, Self.DebugPushButton)
+
+		# Tmx name
+		Self.TmxNameLineEdit = QLineEdit()
+		Self.TmxNameLineEdit.setToolTip("Name of the tmx file without .tmx extension")
+		Self.TmxNameLineEdit.setText(UserData["TmxName"])
+		Self.TmxNameLineEdit.setFixedHeight(50)
+		TmxNameLabel = QLabel("Tmx name")
+		TmxNameLabel.setToolTip("Name of the tmx file without .tmx extension")
+		TmxExtensionLabel = QLabel(".tmx")
+		TmxExtensionLabel.setToolTip("Name of the tmx file without .tmx extension")
+		Self.TmxNameRow = QHBoxLayout()
+		Self.TmxNameRow.addWidget(Self.TmxNameLineEdit)
+		Self.TmxNameRow.addSpacing(10)
+		Self.TmxNameRow.addWidget(TmxExtensionLabel)
+		Self.LayoutFL.addRow(TmxNameLabel, Self.TmxNameRow)
 
-# Check validity of property value
-def Validity(Name, Key, Value):
-	Valid = False
-	try:
-		ValueNotInRangeText = "Warning: Value of property '" + Key + "' of member '" + Name + "' is not in valid range "
-		if type(PROPERTIES[Key]["Validity"][0]) == int:
-			if int(Value) in range(PROPERTIES[Key]["Validity"][0], PROPERTIES[Key]["Validity"][1] + 1):
-				Valid = True
-			else:
-				print(ValueNotInRangeText + "<" + str(PROPERTIES[Key]["Validity"][0]) + "; " + str(PROPERTIES[Key]["Validity"][1]) + ">")
+		# MpConfig name
+		Self.MpConfigNameLineEdit = QLineEdit()
+		Self.MpConfigNameLineEdit.setToolTip("Name of the MpConfig file without .mpalarmxcore extension (cannot be same as program name)")
+		Self.MpConfigNameLineEdit.setText(UserData["MpConfigName"])
+		Self.MpConfigNameLineEdit.setFixedHeight(50)
+		MpConfigNameLabel = QLabel("MpConfig name")
+		MpConfigNameLabel.setToolTip("Name of the MpConfig file without .mpalarmxcore extension (cannot be same as program name)")
+		MpConfigExtensionLabel = QLabel(".mpalarmxcore")
+		MpConfigExtensionLabel.setToolTip("Name of the MpConfig file without .mpalarmxcore extension (cannot be same as program name)")
+		Self.MpConfigNameRow = QHBoxLayout()
+		Self.MpConfigNameRow.addWidget(Self.MpConfigNameLineEdit)
+		Self.MpConfigNameRow.addSpacing(10)
+		Self.MpConfigNameRow.addWidget(MpConfigExtensionLabel)
+		Self.LayoutFL.addRow(MpConfigNameLabel, Self.MpConfigNameRow)
 
-		elif type(PROPERTIES[Key]["Validity"][0]) == float:
-			if (float(Value) >= PROPERTIES[Key]["Validity"][0]) and (float(Value) <= PROPERTIES[Key]["Validity"][1]):
-				Valid = True
-			else:
-				print(ValueNotInRangeText + "<" + str(PROPERTIES[Key]["Validity"][0]) + "; " + str(PROPERTIES[Key]["Validity"][1]) + ">")
+		# MpLink name
+		Self.MpLinkLineEdit = QLineEdit()
+		Self.MpLinkLineEdit.setToolTip("Name of the alarm MpLink")
+		Self.MpLinkLineEdit.setText(UserData["MpLink"])
+		Self.MpLinkLineEdit.setFixedHeight(50)
+		MpLinkLabel = QLabel("MpLink name")
+		MpLinkLabel.setToolTip("Name of the alarm MpLink")
+		Self.MpLinkRow = QHBoxLayout()
+		Self.MpLinkRow.addWidget(Self.MpLinkLineEdit)
+		Self.MpLinkRow.addSpacing(10)
+		Self.LayoutFL.addRow(MpLinkLabel, Self.MpLinkRow)
 
-		elif type(PROPERTIES[Key]["Validity"][0]) == str:
-			if Value in PROPERTIES[Key]["Validity"]:
-				Valid = True
-			else:
-				if "FALSE" in PROPERTIES[Key]["Validity"]: print(ValueNotInRangeText + str(RANGE_BOOL))
-				else: print(ValueNotInRangeText + str(PROPERTIES[Key]["Validity"]))
-		elif PROPERTIES[Key]["Validity"][0] == None:
-			Valid = True
+		# Program name
+		Self.ProgramNameLineEdit = QLineEdit()
+		Self.ProgramNameLineEdit.setToolTip("Name of the program file without .st/.c extension (cannot be same as MpConfig name)")
+		Self.ProgramNameLineEdit.setText(UserData["ProgramName"])
+		Self.ProgramNameLineEdit.setFixedHeight(50)
+		ProgramNameLabel = QLabel("Program name")
+		ProgramNameLabel.setToolTip("Name of the program file without .st/.c extension (cannot be same as MpConfig name)")
+		ProgramExtensionLabel = QLabel(".st/.c")
+		ProgramExtensionLabel.setToolTip("Name of the program file without .st/.c extension (cannot be same as MpConfig name)")
+		Self.ProgramNameRow = QHBoxLayout()
+		Self.ProgramNameRow.addWidget(Self.ProgramNameLineEdit)
+		Self.ProgramNameRow.addSpacing(10)
+		Self.ProgramNameRow.addWidget(ProgramExtensionLabel)
+		Self.LayoutFL.addRow(ProgramNameLabel, Self.ProgramNameRow)
 
-	except:
-		print("Warning: Wrong data type of property '" + Key + "' of member '" + Name + "'")
+		# Sections update
+		ProgramNameLabel = QLabel("Alarm keywords")
+		ProgramNameLabel.setToolTip("The keyword for alarms that the script will look for in data type names")
+		Self.ErrorKeywordLineEdit = QLineEdit()
+		Self.ErrorKeywordLineEdit.setToolTip("The keyword for Error alarm that the script will look for in data type names")
+		Self.ErrorKeywordLineEdit.setPlaceholderText("Error")
+		Self.ErrorKeywordLineEdit.setText(UserData["AlarmKeyword"]["Error"])
+		Self.ErrorKeywordLineEdit.setFixedHeight(50)
+		Self.WarningKeywordLineEdit = QLineEdit()
+		Self.WarningKeywordLineEdit.setToolTip("The keyword for Warning alarm that the script will look for in data type names")
+		Self.WarningKeywordLineEdit.setPlaceholderText("Warning")
+		Self.WarningKeywordLineEdit.setText(UserData["AlarmKeyword"]["Warning"])
+		Self.WarningKeywordLineEdit.setFixedHeight(50)
+		Self.InfoKeywordLineEdit = QLineEdit()
+		Self.InfoKeywordLineEdit.setToolTip("The keyword for Info alarm that the script will look for in data type names")
+		Self.InfoKeywordLineEdit.setPlaceholderText("Info")
+		Self.InfoKeywordLineEdit.setText(UserData["AlarmKeyword"]["Info"])
+		Self.InfoKeywordLineEdit.setFixedHeight(50)
+		Self.KeywordSectionRow = QHBoxLayout()
+		Self.KeywordSectionRow.addWidget(Self.ErrorKeywordLineEdit)
+		Self.KeywordSectionRow.addSpacing(10)
+		Self.KeywordSectionRow.addWidget(Self.WarningKeywordLineEdit)
+		Self.KeywordSectionRow.addSpacing(10)
+		Self.KeywordSectionRow.addWidget(Self.InfoKeywordLineEdit)
+		Self.LayoutFL.addRow(ProgramNameLabel, Self.KeywordSectionRow)
 
-	return Valid
+		# Programs of severities
+		SeverityProgramLabel = QLabel("Severity programs")
+		SeverityProgramLabel.setToolTip("Names of programs for Error, Warning and Info alarms, alarms with empty program name are generated to the main program")
+		Self.ErrorProgramLineEdit = QLineEdit()
+		Self.ErrorProgramLineEdit.setToolTip("Name of the program for Error alarms (empty for the main program)")
+		Self.ErrorProgramLineEdit.setPlaceholderText("Program name")
+		Self.ErrorProgramLineEdit.setText(UserData["SeverityProgram"]["Error"])
+		Self.ErrorProgramLineEdit.setFixedHeight(50)
+		Self.WarningProgramLineEdit = QLineEdit()
+		Self.WarningProgramLineEdit.setToolTip("Name of the program for Warning alarms (empty for the main program)")
+		Self.WarningProgramLineEdit.setPlaceholderText("Program name")
+		Self.WarningProgramLineEdit.setText(UserData["SeverityProgram"]["Warning"])
+		Self.WarningProgramLineEdit.setFixedHeight(50)
+		Self.InfoProgramLineEdit = QLineEdit()
+		Self.InfoProgramLineEdit.setToolTip("Name of the program for Info alarms (empty for the main program)")
+		Self.InfoProgramLineEdit.setPlaceholderText("Program name")
+		Self.InfoProgramLineEdit.setText(UserData["SeverityProgram"]["Info"])
+		Self.InfoProgramLineEdit.setFixedHeight(50)
+		Self.SeverityProgramRow = QHBoxLayout()
+		Self.SeverityProgramRow.addWidget(Self.ErrorProgramLineEdit)
+		Self.SeverityProgramRow.addSpacing(10)
+		Self.SeverityProgramRow.addWidget(Self.WarningProgramLineEdit)
+		Self.SeverityProgramRow.addSpacing(10)
+		Self.SeverityProgramRow.addWidget(Self.InfoProgramLineEdit)
+		Self.LayoutFL.addRow(SeverityProgramLabel, Self.SeverityProgramRow)
 
-# Create alarm groups
-def MpAlarmCreateGroup(Index: int, Name: str, Properties: list) -> et.Element:
-	Group = et.Element("Group", {"ID": "["+str(Index)+"]"})
-	Message = "{$Alarms/"+Name+"}"
-	et.SubElement(Group, "Property", {"ID": "Name", "Value": Name})
-	et.SubElement(Group, "Property", {"ID": "Message", "Value": Message})
-	Properties = CreateTreeFromProperties(Properties)
-	Properties = RemoveInvalidProperties(Properties)
-	MpAlarmCreateNodes(Group, Properties)
-	return Group
+		# Sections update
+		Self.UpdateTmxCheckBox = QCheckBox("Update TMX")
+		Self.UpdateTmxCheckBox.setToolTip("The script will update the TMX file every build")
+		Self.UpdateTmxCheckBox.setFixedHeight(50)
+		Self.UpdateTmxCheckBox.setChecked(UserData["UpdateTmx"])
+		Self.UpdateMpConfigCheckBox = QCheckBox("Update MpConfig")
+		Self.UpdateMpConfigCheckBox.setToolTip("The script will update the MpAlarmXCore file every build")
+		Self.UpdateMpConfigCheckBox.setFixedHeight(50)
+		Self.UpdateMpConfigCheckBox.setChecked(UserData["UpdateMpConfig"])
+		Self.UpdateProgramCheckBox = QCheckBox("Update Set/Reset")
+		Self.UpdateProgramCheckBox.setToolTip("The script will update the .st/.c program file every build")
+		Self.UpdateProgramCheckBox.setFixedHeight(50)
+		Self.UpdateProgramCheckBox.setChecked(UserData["UpdateProgram"])
+		Self.UpdateSectionRow = QHBoxLayout()
+		Self.UpdateSectionRow.addWidget(Self.UpdateTmxCheckBox)
+		Self.UpdateSectionRow.addSpacing(10)
+		Self.UpdateSectionRow.addWidget(Self.UpdateMpConfigCheckBox)
+		Self.UpdateSectionRow.addSpacing(10)
+		Self.UpdateSectionRow.addWidget(Self.UpdateProgramCheckBox)
+		Self.LayoutFL.addRow(Self.UpdateSectionRow)
 
-# Tansform alarm list to a tree
-def CreateTreeFromProperties(Properties: list) -> Node:
-	Tree = Node("Root")
-	for Item in Properties:
-		Keys = Item["Key"].split(".")
-		Last = Keys.pop(-1)
-		Parent = Tree
-		for Index, Key in enumerate(Keys):
-			Child = Parent.find(Key)
-			if Child:
-				Parent = Child
-			else:
-				if len(Keys) > 1:
-					PropertyName = ".".join(Keys[0:Index+1])
-				else:
-					PropertyName = Key
-				Parent = Parent.append(Node(Key, PROPERTIES[PropertyName]))
-		Parent.append(Node(Last, Item))
-	return Tree
+		# Generated code options
+		Self.AlarmTableCheckBox = QCheckBox("Alarm table")
+		Self.AlarmTableCheckBox.setToolTip("Alarms are set and reset in one loop over a table of all alarms instead of one block of code per alarm")
+		Self.AlarmTableCheckBox.setFixedHeight(50)
+		Self.AlarmTableCheckBox.setChecked(UserData["AlarmTable"])
+		Self.AlarmNamesCheckBox = QCheckBox("Name table")
+		Self.AlarmNamesCheckBox.setToolTip("Names of alarms in arrays are generated into a table instead of being composed at runtime")
+		Self.AlarmNamesCheckBox.setFixedHeight(50)
+		Self.AlarmNamesCheckBox.setChecked(UserData["AlarmNames"])
+		Self.PackedFlagsCheckBox = QCheckBox("Packed flags")
+		Self.PackedFlagsCheckBox.setToolTip("Flags of the alarm table are packed into words and 32 alarms are checked for changes at once (only with alarm table)")
+		Self.PackedFlagsCheckBox.setFixedHeight(50)
+		Self.PackedFlagsCheckBox.setChecked(UserData["PackedFlags"])
+		Self.ChangeGuardCheckBox = QCheckBox("Change guard")
+		Self.ChangeGuardCheckBox.setToolTip("Alarms of a structure are skipped if none of them differs from its flag (not with alarm table)")
+		Self.ChangeGuardCheckBox.setFixedHeight(50)
+		Self.ChangeGuardCheckBox.setChecked(UserData["ChangeGuard"])
+		Self.ShardFilesCheckBox = QCheckBox("Shard files")
+		Self.ShardFilesCheckBox.setToolTip("Alarms of each global variable are generated to their own file called from the program (not with alarm table)")
+		Self.ShardFilesCheckBox.setFixedHeight(50)
+		Self.ShardFilesCheckBox.setChecked(UserData["ShardFiles"])
+		Self.CodeSectionRow = QHBoxLayout()
+		Self.CodeSectionRow.addWidget(Self.AlarmTableCheckBox)
+		Self.CodeSectionRow.addSpacing(10)
+		Self.CodeSectionRow.addWidget(Self.AlarmNamesCheckBox)
+		Self.CodeSectionRow.addSpacing(10)
+		Self.CodeSectionRow.addWidget(Self.PackedFlagsCheckBox)
+		Self.CodeSectionRow.addSpacing(10)
+		Self.CodeSectionRow.addWidget(Self.ChangeGuardCheckBox)
+		Self.CodeSectionRow.addSpacing(10)
+		Self.CodeSectionRow.addWidget(Self.ShardFilesCheckBox)
+		Self.LayoutFL.addRow(Self.CodeSectionRow)
+
+		# Time slices
+		Self.TimeSlicesLineEdit = QLineEdit()
+		Self.TimeSlicesLineEdit.setToolTip("Number of cycles in which all alarms are processed, each cycle processes one slice of alarms (not with alarm table)")
+		Self.TimeSlicesLineEdit.setValidator(QIntValidator(1, 1000))
+		Self.TimeSlicesLineEdit.setText(str(UserData["TimeSlices"]))
+		Self.TimeSlicesLineEdit.setFixedHeight(50)
+		TimeSlicesLabel = QLabel("Time slices")
+		TimeSlicesLabel.setToolTip("Number of cycles in which all alarms are processed, each cycle processes one slice of alarms (not with alarm table)")
+		Self.ErrorsEveryCycleCheckBox = QCheckBox("Errors every cycle")
+		Self.ErrorsEveryCycleCheckBox.setToolTip("Errors are processed every cycle, only warnings and infos are divided into slices")
+		Self.ErrorsEveryCycleCheckBox.setFixedHeight(50)
+		Self.ErrorsEveryCycleCheckBox.setChecked(UserData["ErrorsEveryCycle"])
+		Self.TimeSlicesRow = QHBoxLayout()
+		Self.TimeSlicesRow.addWidget(Self.TimeSlicesLineEdit)
+		Self.TimeSlicesRow.addSpacing(10)
+		Self.TimeSlicesRow.addWidget(Self.ErrorsEveryCycleCheckBox)
+		Self.LayoutFL.addRow(TimeSlicesLabel, Self.TimeSlicesRow)
 
-# Remove invalid properties
-def RemoveInvalidProperties(Properties: list) -> list:
-	for Index, Item in enumerate(Properties.children):
-		if ("Valid" in Item.data and Item.data["Valid"]) or ("Validity" in Item.data and Item.data["Validity"] == RANGE_NONE):
-			RemoveInvalidProperties(Item)
-		else:
-			del(Properties.children[Index])
-	return Properties
+	# Window actions
+	def CreateActions(Self):
+		# Actions of global buttons
+		Self.BottomBar.RunPB.clicked.connect(Self.Run)
+		Self.BottomBar.OkPB.clicked.connect(Self.aGuiAccepted)
+		Self.BottomBar.CancelPB.clicked.connect(Self.close)
+		Self.InfoD.OkPB.clicked.connect(Self.close)
+		Self.InfoD.OkPB.clicked.connect(Self.InfoD.close)
 
-# Insert new configuration
-def MpAlarmCreateNodes(Parent, Properties) -> et.Element:
-	for Item in Properties:
-		if Item.data:
-			Attrib = {"ID": Item.data["ID"]}
-			if "Value" in Item.data:
-				Attrib["Value"] = Item.data["Value"]
-			Element = et.Element(Item.data["Tag"], Attrib)
-			MpAlarmCreateNodes(Element, Item)
-			Parent.append(Element)
-	return Parent
+		# Actions of form widgets
+		Self.TmxNameLineEdit.textChanged.connect(lambda: Self.TextInputCheck(Self.TmxNameLineEdit))
+		Self.MpConfigNameLineEdit.textChanged.connect(lambda: Self.TextInputCheck(Self.MpConfigNameLineEdit, Self.ProgramNameLineEdit))
+		Self.ProgramNameLineEdit.textChanged.connect(lambda: Self.TextInputCheck(Self.ProgramNameLineEdit, Self.MpConfigNameLineEdit))
+		Self.ErrorKeywordLineEdit.textChanged.connect(lambda: Self.TextInputCheck(Self.ErrorKeywordLineEdit))
+		Self.WarningKeywordLineEdit.textChanged.connect(lambda: Self.TextInputCheck(Self.WarningKeywordLineEdit))
+		Self.InfoKeywordLineEdit.textChanged.connect(lambda: Self.TextInputCheck(Self.InfoKeywordLineEdit))
 
-# Function for alarms set/reset text generation
-def AlarmSetReset(SetResetText, Alarm, ProgramLanguage, ResetAlarm):
-	AlarmName = ""
-	ConfigNameCreation = ["\nbrsmemset(ADR(HelpName), 0, SIZEOF(HelpName));"]
-	Tabs = "\n"
-	NumberOfForLoops = 0
-	for IndexMember, PathMember in enumerate(Alarm["Path"]):
-		AlarmName += PathMember["Name"]
-		if PathMember["Array"] != "":
-			NumberOfForLoops += 1
-			ConfigNameCreation.append("\nbrsstrcat(ADR(HelpName), ADR('" + PathMember["Name"] + "['));")
-			ConfigNameCreation.append("\nbrsmemset(ADR(String), 0, SIZEOF(String));")
-			ConfigNameCreation.append("\nbrsitoa(ArrayIndex" + str(NumberOfForLoops) + ", ADR(String));")
-			ConfigNameCreation.append("\nbrsstrcat(ADR(HelpName), ADR(String));")
-			ConfigNameCreation.append("\nbrsstrcat(ADR(HelpName), ADR('].'));")
-			AlarmName += "[ArrayIndex" + str(NumberOfForLoops) + "]."
-			Tabs = "\n"
-			for Index in range(NumberOfForLoops):
-				Tabs += "\t"
-			SetResetText += Tabs + "FOR ArrayIndex" + str(NumberOfForLoops) + " := " + str(PathMember["Array"][0]) + " TO " + str(PathMember["Array"][1]) + " DO"
-		else:
-			ConfigNameCreation.append("\nbrsstrcat(ADR(HelpName), ADR('" + PathMember["Name"] + ".'));")
-			AlarmName += "."
-	AlarmName += Alarm["Variable"]
-	if Alarm["Array"] != "":
-		NumberOfForLoops += 1
-		ConfigNameCreation.append("\nbrsstrcat(ADR(HelpName), ADR('" + Alarm["Variable"] + "['));")
-		ConfigNameCreation.append("\nbrsmemset(ADR(String), 0, SIZEOF(String));")
-		ConfigNameCreation.append("\nbrsitoa(ArrayIndex" + str(NumberOfForLoops) + ", ADR(String));")
-		ConfigNameCreation.append("\nbrsstrcat(ADR(HelpName), ADR(String));")
-		ConfigNameCreation.append("\nbrsstrcat(ADR(HelpName), ADR(']'));")
-		AlarmName += "[ArrayIndex" + str(NumberOfForLoops) + "]"
-		Tabs = "\n"
-		for Tab in range(NumberOfForLoops):
-			Tabs += "\t"
-		SetResetText += Tabs + "FOR ArrayIndex" + str(NumberOfForLoops) + " := " + str(Alarm["Array"][0]) + " TO " + str(Alarm["Array"][1]) + " DO"
-	else:
-		ConfigNameCreation.append("\nbrsstrcat(ADR(HelpName), ADR('" + Alarm["Variable"] + "'));")
-	Tabs += "\t"
-
-	ConfigName = ""
-	BeforeStatic = False
-	for Line in ConfigNameCreation:
-		if "ADR('" in Line:
-			if not BeforeStatic:
-				ConfigName += Line
-			else:
-				ConfigName = ConfigName[:ConfigName.rfind("')")] + Line[Line.find("ADR('") + 5:Line.find("')")] + ConfigName[ConfigName.rfind("')"):]
-			BeforeStatic = True
+	# Text inputs condition check
+	def TextInputCheck(Self, TextInput1: QLineEdit, TextInput2: QLineEdit = None):
+		if (TextInput1.text() == ""):
+			TextInput1.setStyleSheet("QLineEdit{background:#661111;}")
 		else:
-			ConfigName += Line
-			BeforeStatic = False
+			TextInput1.setStyleSheet("")
 
-	ConfigName = ConfigName.replace("\n", Tabs + "\t")
-	ConfigName = ConfigName.replace("brsstrcat", "brsstrcpy", 1)
+		if TextInput2 != None:
+			if (TextInput2.text() == ""):
+				TextInput2.setStyleSheet("QLineEdit{background:#661111;}")
+			else:
+				TextInput2.setStyleSheet("")
 
-	if NumberOfForLoops != 0:
-		if not(ResetAlarm):
-			SetResetText += Tabs + "IF " + AlarmName + " THEN"
-			SetResetText += ConfigName
-			SetResetText += Tabs + f"\tMpAlarmXSet({UserData["MpLink"]}, HelpName);"
-			SetResetText += Tabs + "\t" + AlarmName + "\t:= FALSE;"
-		else:
-			SetResetText += Tabs + "IF (" + AlarmName + " <> Flag." + AlarmName + ") THEN"
-			SetResetText += ConfigName
-			SetResetText += Tabs + "\tIF (" + AlarmName + " > Flag." + AlarmName + ") THEN"
-			SetResetText += Tabs + f"\t\tMpAlarmXSet({UserData["MpLink"]}, HelpName);"
-			SetResetText += Tabs + "\tELSE"
-			SetResetText += Tabs + f"\t\tMpAlarmXReset({UserData["MpLink"]}, HelpName);"
-			SetResetText += Tabs + "\tEND_IF"
-	else:
-		if not(ResetAlarm):
-			SetResetText += Tabs + "IF " + AlarmName + " THEN"
-			SetResetText += Tabs + f"\tMpAlarmXSet({UserData["MpLink"]}, '" + AlarmName + "');"
-			SetResetText += Tabs + "\t" + AlarmName + "\t:= FALSE;"
-		else:
-			SetResetText += Tabs + "IF (" + AlarmName + " > Flag." + AlarmName + ") THEN"
-			SetResetText += Tabs + f"\tMpAlarmXSet({UserData["MpLink"]}, '" + AlarmName + "');"
-			SetResetText += Tabs + "ELSIF (" + AlarmName + " < Flag." + AlarmName + ") THEN"
-			SetResetText += Tabs + f"\tMpAlarmXReset({UserData["MpLink"]}, '" + AlarmName + "');"
-	SetResetText += Tabs + "END_IF"
-	if ResetAlarm:
-		SetResetText += Tabs + "Flag." + AlarmName + "\t:= " + AlarmName + ";"
+			if (TextInput1.text() == TextInput2.text()):
+				TextInput1.setStyleSheet("QLineEdit{background:#661111;}")
+				TextInput2.setStyleSheet("QLineEdit{background:#661111;}")
 
-	for Index in range(NumberOfForLoops):
-		Tabs = Tabs[:-1]
-		SetResetText += Tabs + "END_FOR"
-	SetResetText += "\n\t"
-		
-	# Convert ST to C
-	if ProgramLanguage == LANGUAGE_C:
-		# FOR replacement
-		SetResetText = re.sub(r"([\t]*)FOR ([a-zA-Z0-9_]*) := ([0-9]*) TO ([0-9]*) DO", r"\1for (\2 = \3; \2 <= \4; \2++)\n\1{", SetResetText)
-		# IF replacement
-		SetResetText = re.sub(r"([\t]*)ELSIF \(([a-zA-Z0-9_.\[\]]*) ([<>=]*) ([a-zA-Z0-9_.\[\]]*)\) THEN", r"\1}\n\1else if (\2 \3 \4)\n\1{", SetResetText)
-		SetResetText = re.sub(r"([\t]*)ELSIF ([a-zA-Z0-9_.\[\]]*) THEN", r"\1}\n\1else if (\2)\n\1{", SetResetText)
-		SetResetText = re.sub(r"([\t]*)IF \(([a-zA-Z0-9_.\[\]]*) ([<>=]*) ([a-zA-Z0-9_.\[\]]*)\) THEN", r"\1if (\2 \3 \4)\n\1{", SetResetText)
-		SetResetText = re.sub(r"([\t]*)IF ([a-zA-Z0-9_.\[\]]*) THEN", r"\1if (\2)\n\1{", SetResetText)
-		SetResetText = re.sub(r"END_[a-zA-Z0-9_]*;", "}", SetResetText)
-		# END_XXX occurrances
-		SetResetText = re.sub(r"([\t]*)ELSE", r"\1}\n\1else\n\1{", SetResetText)
-		# Other
-		SetResetText = SetResetText.replace("'", "\"")
-		SetResetText = SetResetText.replace(":= ", "= ")
-		SetResetText = SetResetText.replace("<>", "!=")
-		SetResetText = SetResetText.replace(f"({UserData["MpLink"]}", f"(&{UserData["MpLink"]}")
-		SetResetText = SetResetText.replace("ADR", "(UDINT)&")
-		SetResetText = SetResetText.replace("SIZEOF", "sizeof")
-		SetResetText = SetResetText.replace("FALSE", "0")
-
-	return SetResetText, NumberOfForLoops
+	# Run the script from the configuration
+	def Run(Self):
+		Self.GetUserData()
+		Prebuild()
 
-# Prebuild mode function
-def Prebuild():
+	# GUI was accepted by OK button
+	def aGuiAccepted(Self):
+		if (Self.TmxNameLineEdit.text() != "") and (Self.MpConfigNameLineEdit.text() != "") and (Self.ProgramNameLineEdit.text() != "") and (Self.ErrorKeywordLineEdit.text() != "") and (Self.WarningKeywordLineEdit.text() != "") and (Self.InfoKeywordLineEdit.text() != "") and (Self.MpConfigNameLineEdit.text() != Self.ProgramNameLineEdit.text()):
+			Self.GetUserData()
+			
+			with open(UserDataPath, "wb") as CreateAlarmsSettings:
+				pickle.dump(UserData, CreateAlarmsSettings)
+				
+			Self.InfoD.MessageL.setText("The configuration has been set.")
+			ShowAdjusted(Self.InfoD)
 
-	# Ouput window message
-	print("----------------------- Beginning of the script CreateAlarms " + SCRIPT_VERSION + " -----------------------")
-	if UserData["Configuration"] != "":
-		UsedConfiguration = UserData["Configuration"]
-	else:
-		UsedConfiguration = FindFilePath(ConfigPath, UserData["MpConfigName"] + ".mpalarmxcore", True)
-		UsedConfiguration = UsedConfiguration[UsedConfiguration.find("Physical") + 9:]
-		UsedConfiguration = UsedConfiguration[:UsedConfiguration.find("\\")]
-	print("Used configuration: " + UsedConfiguration)
+	# Get data from widgets and fill in the UserData structure
+	def GetUserData(Self):
+		UserData["Configuration"] = Self.ConfigComboBox.currentText()
+		UserData["Enable"] = Self.EnablePushButton.isChecked()
+		UserData["Debug"] = Self.DebugPushButton.isChecked()
+		UserData["UpdateTmx"] = Self.UpdateTmxCheckBox.isChecked()
+		UserData["UpdateMpConfig"] = Self.UpdateMpConfigCheckBox.isChecked()
+		UserData["UpdateProgram"] = Self.UpdateProgramCheckBox.isChecked()
+		UserData["AlarmTable"] = Self.AlarmTableCheckBox.isChecked()
+		UserData["AlarmNames"] = Self.AlarmNamesCheckBox.isChecked()
+		UserData["PackedFlags"] = Self.PackedFlagsCheckBox.isChecked()
+		UserData["ChangeGuard"] = Self.ChangeGuardCheckBox.isChecked()
+		UserData["ShardFiles"] = Self.ShardFilesCheckBox.isChecked()
+		UserData["TimeSlices"] = max(int(Self.TimeSlicesLineEdit.text() or "1"), 1)
+		UserData["ErrorsEveryCycle"] = Self.ErrorsEveryCycleCheckBox.isChecked()
+		UserData["TmxName"] = Self.TmxNameLineEdit.text()
+		UserData["MpConfigName"] = Self.MpConfigNameLineEdit.text()
+		UserData["MpLink"] = Self.MpLinkLineEdit.text()
+		UserData["ProgramName"] = Self.ProgramNameLineEdit.text()
+		UserData["AlarmKeyword"]["Error"] = Self.ErrorKeywordLineEdit.text()
+		UserData["AlarmKeyword"]["Warning"] = Self.WarningKeywordLineEdit.text()
+		UserData["AlarmKeyword"]["Info"] = Self.InfoKeywordLineEdit.text()
+		UserData["SeverityProgram"]["Error"] = Self.ErrorProgramLineEdit.text()
+		UserData["SeverityProgram"]["Warning"] = Self.WarningProgramLineEdit.text()
+		UserData["SeverityProgram"]["Info"] = Self.InfoProgramLineEdit.text()
 
-	# Get alarms from global variables and types
-	global Alarms
-	Alarms = GetAlarms()
+	# State of the window changed
+	def changeEvent(Self, Event: QEvent):
+		if Event.type() == Event.WindowStateChange:
+			Self.TitleBar.windowStateChanged(Self.windowState())
 
-	DebugPrint("User settings", UserData)
+	# Size of the window changed
+	def resizeEvent(Self, Event: QEvent):
+		Self.TitleBar.resize(Self.width(), Self.TitleBar.height())
+		Self.MainGB.setGeometry(0, Self.TitleBar.height(), Self.width(), Self.height() - Self.TitleBar.height())
 
-	# Update Tmx file
-	if UserData["UpdateTmx"]: UpdateTmx()
+# Window title bar
+class TitleBar(QWidget):
+	ClickPosition = None
 
-	# Update mpalarmxcore file
-	if UserData["UpdateMpConfig"]: UpdateMpalarmxcore()
+	# Initialization of the title bar
+	def __init__(Self, Parent, WindowTitle, TitleColor, UseMinButton, UseMaxButton, UseCloseButton):
+		super(TitleBar, Self).__init__(Parent)
 
-	# Update program file
-	if UserData["UpdateProgram"]: UpdateProgram()
+		# Title bar layout
+		Layout = QHBoxLayout(Self)
+		Layout.setContentsMargins(int(8 * gSizeRatio), int(8 * gSizeRatio),int(8 * gSizeRatio),int(8 * gSizeRatio))
+		Layout.addStretch()
 
-	# Ouput window message
-	print("--------------------------------- End of the script CreateAlarms ---------------------------------")
+		# Label title
+		Self.Title = QLabel(WindowTitle, Self, alignment = Qt.AlignCenter)
+		Style = """
+		QLabel {
+			background-color: >>TitleBarColor<<;
+			color: >>ColorTitle<<;
+			font: >>TitleFont<<px ">>StandardFont<<";
+			padding-top: 4px;
+			border-radius: 0px;
+			border-bottom: 2px solid #ff8000;
+		}
+		"""
+		Self.Title.setStyleSheet(FinishStyle(Style.replace(">>TitleBarColor<<", TitleColor)))
+		Self.Title.adjustSize()
 
-# Creates all paths to one alarm with all possible array values
-def CreateNames(Alarm):
-	Names = [""]
-	FirstTime = True
-	for PathMember in Alarm["Path"]:
-		for Index, Name in enumerate(Names):
-			if FirstTime:
-				Names[Index] += PathMember["Name"]
-				FirstTime = False
-			else:
-				Names[Index] += "." + PathMember["Name"]
-		if PathMember["Array"] != "":
-			Names = CreateArrays(Names, PathMember["Array"])
-	for Index, Name in enumerate(Names):
-		Names[Index] += "." + Alarm["Variable"]
-	if Alarm["Array"] != "":
-		Names = CreateArrays(Names, Alarm["Array"])
-	return Names
-
-# Expand paths with arrays
-def CreateArrays(Names, Array):
-	NewNames = []
-	for Name in Names:
-		for IndexArray in range(Array[0] - 1, Array[1]):
-			NewNames.append(Name + "[" + str(IndexArray + 1) + "]")
-	return NewNames
+		# Appearance definition
+		Style = Self.style()
+		Self.ReferenceSize = Self.Title.height() - int(18 * gSizeRatio)
+		Self.ReferenceSize += Style.pixelMetric(Style.PM_ButtonMargin) * 2
+		Self.setMaximumHeight(Self.ReferenceSize + 2)
+		Self.setMinimumHeight(Self.Title.height() + 12)
 
-# Return path to alarm with array ranges
-def PathToAlarm(Alarm) -> str:
-	Path = ""
-	for PathMember in Alarm["Path"]:
-		Path += PathMember["Name"] + str(PathMember["Array"]) + " > "
-	Path += Alarm["Variable"] + str(Alarm["Array"])
-	return Path
+		# Tool buttons (Min, Normal, Max, Close)
+		ButtonVisibility = {"min": UseMinButton, "normal": False, "max": UseMaxButton, "close": UseCloseButton}
+		ButtonSize = QSize(Self.ReferenceSize, Self.ReferenceSize)
+		for Target in ("min", "normal", "max", "close"):
+			Button = QToolButton(Self, focusPolicy=Qt.NoFocus)
+			Layout.addWidget(Button)
+			Button.setFixedSize(ButtonSize)
 
-# Update TMX file
-def UpdateTmx():
-	#####################################################################################################################################################
-	# Update Tmx file
-	#####################################################################################################################################################
+			IconType = getattr(Style.StandardPixmap, "SP_TitleBar{}Button".format(Target.capitalize()))
+			
+			Button.setIcon(Style.standardIcon(IconType))
+			
+			if Target == "close":
+				ColorNormal = "gray"
+				ColorHover = "orangered"
+			else:
+				ColorNormal = "gray"
+				ColorHover = "white"
 
-	# Ouput window message
-	print("Updating " + UserData["TmxName"] + ".tmx file...")
+			Button.setStyleSheet("QToolButton {{background-color: {};border: none; border-radius: 4px;}} QToolButton:hover {{background-color: {}}}".format(ColorNormal, ColorHover))
 
-	# Get alarm names list from TMX file
-	TmxPath = FindFilePath(LogicalPath, UserData["TmxName"] + ".tmx", True)
+			Signal = getattr(Self, Target + "Clicked")
+			Button.clicked.connect(Signal)
 
-	TmxTree = et.parse(TmxPath)
-	TmxRoot = TmxTree.getroot()
+			setattr(Self, Target + "Button", Button)
 
-	TmxAlarms = []
-	for TmxItem in TmxRoot.findall(".//tu"):
-		TmxAlarms.append(TmxItem.attrib["tuid"])
-	DebugPrint("Tmx alarms", TmxAlarms)
+			Button.setVisible(ButtonVisibility[Target])
 
-	# Get alarm names list from Global.typ file
-	TypAlarms = []
-	for Alarm in Alarms:
-		TypAlarms += CreateNames(Alarm)
-	DebugPrint("Typ alarms", TypAlarms)
+	# State of the window changed
+	def windowStateChanged(Self, State):
+		Self.normalButton.setVisible(State == Qt.WindowMaximized)
+		Self.maxButton.setVisible(State != Qt.WindowMaximized)
 
-	# Compare alarm names lists
-	NewAlarms = [x for x in TypAlarms if x not in set(TmxAlarms)]
-	MissingAlarms = [x for x in TmxAlarms if x not in set(TypAlarms)]
-	
-	DebugPrint("New alarms", NewAlarms)
-	DebugPrint("Missing alarms", MissingAlarms)
+	# Mouse pressed event
+	def mousePressEvent(Self, Event: QEvent):
+		if Event.button() == Qt.LeftButton:
+			Self.ClickPosition = Event.pos()
 
-	# Get header of xml
-	TmxHeader = GetXmlHeader(TmxPath)
-
-	# Remove missing alarms
-	Parent = TmxRoot.find(".//body")
-	for TmxAlarm in Parent.findall(".//tu"):
-		if TmxAlarm.get('tuid') in MissingAlarms:
-			Parent.remove(TmxAlarm)
-
-	# Convert xml to text
-	TmxTextCleaned = et.tostring(TmxRoot, encoding="utf-8").decode()
-
-	# Write header and xml text to the .hw file
-	TmxFileCleaned = open(TmxPath,"w", encoding="utf-8")
-	TmxFileCleaned.write(TmxHeader + TmxTextCleaned)
-	TmxFileCleaned.close()
-
-	# Add new alarms
-	TmxFile = open(TmxPath, "r", encoding="utf-8")
-	TmxText = ""
-	for TmxLine in TmxFile:
-		if (TmxLine.find("<body />") != -1): # End found
-			TmxText += TmxLine[:TmxLine.find(" />")] + ">\n"
-			TmxLine = ""
-			for NewAlarm in NewAlarms:
-				TmxText += "\t<tu tuid=\"" + NewAlarm + "\" />\n"
-			TmxText += "</body>\n"
-		elif (TmxLine.find("</body>") != -1): # End found
-			for NewAlarm in NewAlarms:
-				TmxText += "\t<tu tuid=\"" + NewAlarm + "\" />\n"
-		TmxText += TmxLine
-	TmxFile.close()
-	TmxFile = open(TmxPath,"w", encoding = "utf-8")
-	TmxFile.write(TmxText)
-	TmxFile.close()
+	# Mouse moved event
+	def mouseMoveEvent(Self, Event: QEvent):
+		if Self.ClickPosition is not None:
+			Self.window().move(Self.window().pos() + Event.pos() - Self.ClickPosition)
 
-# Update mpalarmxcore file
-def UpdateMpalarmxcore():
-	#####################################################################################################################################################
-	# Update mpalarmxcore
-	#####################################################################################################################################################
+	# Mouse released event
+	def mouseReleaseEvent(Self, MouseEvent: QMouseEvent):
+		Self.ClickPosition = None
 
-	# Ouput window message
-	print("Updating " + UserData["MpConfigName"] + ".mpalarmxcore file...")
+	# Button Close clicked
+	def closeClicked(Self):
+		Self.window().close()
 
-	# Create path to mpalarmxcore
-	MpAlarmPath = FindFilePath(ConfigPath, UserData["MpConfigName"] + ".mpalarmxcore", True)
+	# Button Maximize clicked
+	def maxClicked(Self):
+		Self.window().showMaximized()
 
-	# Load file
-	IsFile(MpAlarmPath)
+	# Button Normal clicked
+	def normalClicked(Self):
+		Self.window().showNormal()
 
-	MpAlarmTree = et.parse(MpAlarmPath)
-	MpAlarmRoot = MpAlarmTree.getroot()
+	# Button Minimize clicked
+	def minClicked(Self):
+		Self.window().showMinimized()
 
-	# Remove old configuration
-	# Parent = MpAlarmRoot.find(".//Group[@ID=\"mapp.AlarmX.Core.Configuration\"]")
-	Parent = MpAlarmRoot.find(".//Element[@Type=\"mpalarmxcore\"]")
-	for Group in Parent.findall(".//Group[@ID=\"mapp.AlarmX.Core.Configuration\"]"):
-		Parent.remove(Group)
+	# Size of the window changed
+	def resizeEvent(Self, Event: QEvent):
+		Self.Title.resize(Self.minButton.x() + Self.ReferenceSize * 3 + int(40 * gSizeRatio), Self.height())
 
-	MpAlarmList = et.Element("Group", {"ID": "mapp.AlarmX.Core.Configuration"})
+# Window bottom button bar
+class BottomBar(QWidget):
+	# Initialization of the title bar
+	def __init__(Self, Parent):
+		super(BottomBar, Self).__init__(Parent)
 
-	Index = 0
-	for Alarm in Alarms:
-		for Name in CreateNames(Alarm):
-			Element = MpAlarmCreateGroup(Index, Name, Alarm["Properties"])
-			Index += 1
-			MpAlarmList.append(Element)
+		# Create bottom button box bar group box
+		Self.BottomBarGB = QGroupBox()
+		Self.BottomBarGB.setMaximumHeight(int(gAdjustedGuiSize["WidgetHeight"]) * 2)
+		Style = """
+		QGroupBox {
+			background-color: transparent;
+			border-top: 2px solid #222222;
+			border-left: none;
+			border-right: none;
+			border-bottom: none;
+			margin-top: 20px;
+		}
+			
+		QToolTip {
+			background-color: #eedd22;
+		}
 
-	Parent.append(MpAlarmList)
+		QLabel {
+			background-color: transparent;
+			font: >>Font<<px ">>StandardFont<<";
+		}
 
-	# Save file
-	MpAlarmTree.write(MpAlarmPath)
+		QPushButton {
+			background-color: #222222;
+			color: >>ColorInput<<;
+			width: >>ButtonWidth<<px;
+			height: >>WidgetHeight<<px;
+			border-style: solid;
+			border-radius: 8px;
+		}
 
-# Update program file
-def UpdateProgram():
-	#####################################################################################################################################################
-	# Update alarms program
-	#####################################################################################################################################################
+		QPushButton:hover {
+			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #373737, stop:0.505682 #373737, stop:1 #282828);
+			color: >>ColorInput<<;
+		}
 
-	# Detect programming language
-	if (FindFilePath(LogicalPath, UserData["ProgramName"] + EXTENSIONS[LANGUAGE_C], False) != ""):
-		ProgramLanguage = LANGUAGE_C
-	else:
-		ProgramLanguage = LANGUAGE_ST
-	
-	# Ouput window message
-	print("Updating " + UserData["ProgramName"] + EXTENSIONS[ProgramLanguage] + " file...")
+		QPushButton:pressed {
+			background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 #2d2d2d, stop:0.505682 #282828, stop:1 #2d2d2d);
+			color: #ffffff;
+		}
+		"""
+		Self.BottomBarGB.setStyleSheet(FinishStyle(Style))
 
-	# Generate cyclic program
-	ProgramPath = FindFilePath(LogicalPath, UserData["ProgramName"] + EXTENSIONS[ProgramLanguage], True)
+		# Add buttons OK and Cancel to bottom bar
+		BottomBarHBL = QHBoxLayout(Self.BottomBarGB)
 
-	# Create whole automatically generated cyclic section and insert it to the file
-	ProgramFile = open(ProgramPath, "r")
-	ProgramText = ""
-	ErrorLastVariableName = ""
-	WarningLastVariableName = ""
-	InfoLastVariableName = ""
-	AutomaticSectionStartFound = False
-	InAutomaticSection = False
+		# Version label
+		VersionL = QLabel("ⓘ " + SCRIPT_VERSION)
+		VersionL.setToolTip("""To get more information about each row, hold the pointer on its label.
+	\nSupport contacts
+	michal.vavrik@br-automation.com
+	adam.sefranek@br-automation.com
+	\nVersion 2.3.0
+	- Enable of prebuild function added
+	- Possibility to run the script from configuration
+	- Editable MpLink name
+	\nVersion 2.2.0
+	- Possibility of choosing keywords for alarms (Error, Warning, Info)
+	- Behavior.Acknowledge replacing bug fixed
+	- GUI style changed
+	\nVersion 2.1.0
+	- PyGuiTemplate implemented
+	- Tmx encoding improved
+	- Sorting alarms by code and variable name
+	- Not resetting of Edge alarms (its automatic)
+	\nVersion 2.0.2
+	- Changes according to B&R Coding guidelines
+	\nVersion 2.0.1
+	- Once nested alarms path bug fixed
+	- Supported properties change
+	- Print of used configuration
+	- Invalid property name bug fixed
+	\nVersion 2.0.0
+	- New system of finding alarm paths
+	- Support of arrays (also defined by constants)
+	\nVersion 1.2.0
+	- Configuration of sections to update
+	- Configuration of TMX, MpConfig and program name
+	- Properties validity
+	- Strings must be in quotation marks
+	\nVersion 1.1.0
+	- Bug with default alarm behavior fixed
+	- Behavior.Monitoring.MonitoredPV bug fixed
+	- Tags are taken from the graphics editor
+	- Monitoring alarm types have no longer Set and Reset in the Alarms program
+	- Path to user data changed to AppData/Roaming/BR/Scripts/CreateAlarms/
+	- Error mode added
+	\nVersion 1.0.0
+	- Script creation
+	- Basic functions implemented""")
+		BottomBarHBL.addWidget(VersionL, 0, Qt.AlignLeft)
 
-	if ProgramLanguage == LANGUAGE_C:
-		ProgramErrorText = "\t/********************************************* Errors *********************************************/"
-		ProgramWarningText = "\n\t\n\t/******************************************** Warnings ********************************************/"
-		ProgramInfoText = "\n\t\n\t/********************************************* Infos **********************************************/"
-	elif ProgramLanguage == LANGUAGE_ST:
-		ProgramErrorText = "\t(********************************************* Errors *********************************************)"
-		ProgramWarningText = "\n\t\n\t(******************************************** Warnings ********************************************)"
-		ProgramInfoText = "\n\t\n\t(********************************************* Infos **********************************************)"
+		Self.RunPB = QPushButton("RUN")
+		BottomBarHBL.addWidget(Self.RunPB, 10, Qt.AlignRight)
+		Self.OkPB = QPushButton("OK")
+		BottomBarHBL.addWidget(Self.OkPB, 10, Qt.AlignRight)
+		Self.CancelPB = QPushButton("Cancel")
+		BottomBarHBL.addSpacing(10)
+		BottomBarHBL.addWidget(Self.CancelPB, 0, Qt.AlignRight)
 
-	MaxNumberOfForLoops = 0
-	for ProgramLine in ProgramFile:
-		if not InAutomaticSection:
-			ProgramText += ProgramLine
-		if (ProgramLine.find("// START OF AUTOMATIC CODE GENERATION //") != -1): # Automatic generation section start
-			AutomaticSectionStartFound = True
-			InAutomaticSection = True
-			for Alarm in Alarms:
-				SetResetNotValid = False
-				ResetAlarm = False
-				for Property in Alarm["Properties"]:
-					if Property["Key"] == "Behavior":
-						if ("Monitoring" in Property["Value"]) or not Property["Valid"]:
-							SetResetNotValid = True
-							break
-						elif (Property["Value"] in (RANGE_BEHAVIOR[1:])):
-							ResetAlarm = True
-							break
-				if not SetResetNotValid:
-					if Alarm["Severity"] == "Error":
-						if not(ErrorLastVariableName == Alarm["Path"][0]["Name"]):
-							ProgramErrorText += "\n\t// Global variable " + Alarm["Path"][0]["Name"]
-						ProgramErrorText, NumberOfForLoops = AlarmSetReset(ProgramErrorText, Alarm, ProgramLanguage, ResetAlarm)
-						ErrorLastVariableName = Alarm["Path"][0]["Name"]
-					elif Alarm["Severity"] == "Warning":
-						if not(WarningLastVariableName == Alarm["Path"][0]["Name"]):
-							ProgramWarningText += "\n\t// Global variable " + Alarm["Path"][0]["Name"]
-						ProgramWarningText, NumberOfForLoops = AlarmSetReset(ProgramWarningText, Alarm, ProgramLanguage, ResetAlarm)
-						WarningLastVariableName = Alarm["Path"][0]["Name"]
-					elif Alarm["Severity"] == "Info":
-						if not(InfoLastVariableName == Alarm["Path"][0]["Name"]):
-							ProgramInfoText += "\n\t// Global variable " + Alarm["Path"][0]["Name"]
-						ProgramInfoText, NumberOfForLoops = AlarmSetReset(ProgramInfoText, Alarm, ProgramLanguage, ResetAlarm)
-						InfoLastVariableName = Alarm["Path"][0]["Name"]
-					
-					if NumberOfForLoops > MaxNumberOfForLoops:
-						MaxNumberOfForLoops = NumberOfForLoops
-
-			ProgramText += ProgramErrorText + ProgramWarningText + ProgramInfoText
+# Dialog for displaying info messages
+class InfoDialog(QDialog):
+	# Initialization of the dialog
+	def __init__(Self):
+		super(InfoDialog, Self).__init__()
 
-		elif (ProgramLine.find("// END OF AUTOMATIC CODE GENERATION //") != -1): # Automatic generation section end
-			InAutomaticSection = False
-			ProgramText += "\n\t\n" + ProgramLine
+		# Create title bar
+		Self.TitleBar = TitleBar(Self, "Info", DEFAULT_GUI_COLOR["WindowBorderStandard"], False, False, False)
+		Self.setContentsMargins(0, Self.TitleBar.height(), 0, 0)
 
-	ProgramFile.close()
-	if not AutomaticSectionStartFound:
-		print("Error: Start of automatically generated section not found. Insert comment // START OF AUTOMATIC CODE GENERATION // to Alarms" + EXTENSIONS[ProgramLanguage] + ".")
-		TerminateScript()
-	elif InAutomaticSection:
-		print("Error: End of automatically generated section not found. Insert comment // END OF AUTOMATIC CODE GENERATION // to Alarms" + EXTENSIONS[ProgramLanguage] + ".")
-		TerminateScript()
-	else:
-		ProgramFile = open(ProgramPath,"w")
-		ProgramFile.write(ProgramText)
-		ProgramFile.close()
-		
-	# Check if necessary variables exist and create them if not
-	AlarmsVarPath = FindFilePath(os.path.dirname(ProgramPath), UserData["ProgramName"] + ".var", True)
-	AlarmsVarFile = open(AlarmsVarPath, "r")
-	AlarmsVarContent = AlarmsVarFile.read()
-	AlarmsVarText = "\nVAR"
-	if not "Flag : FlagType;" in AlarmsVarContent:
-		AlarmsVarText += "\n\tFlag : FlagType; (*Flag structure used for edge detection*)"
-	if (MaxNumberOfForLoops > 0) and (not "HelpName : STRING[255];" in AlarmsVarContent):
-		AlarmsVarText += "\n\tHelpName : STRING[255]; (*Auxiliary string for composing alarms name*)"
-	if (MaxNumberOfForLoops > 0) and (not "String : STRING[255];" in AlarmsVarContent):
-		AlarmsVarText += "\n\tString : STRING[255]; (*Auxiliary string for converting numbers to string*)"
-	for Index in range(MaxNumberOfForLoops):
-		if not ("ArrayIndex" + str(Index + 1) + " : INT;") in AlarmsVarContent:
-			AlarmsVarText += "\n\tArrayIndex" + str(Index + 1) + " : INT; (*Index for iteration in for loops*)"
-		
-	AlarmsVarText += "\nEND_VAR"
-	if AlarmsVarText != "\nVAR\nEND_VAR":
-		AlarmsVarFile.close()
-		AlarmsVarFile = open(AlarmsVarPath, "a")
-		AlarmsVarFile.write(AlarmsVarText)
-	AlarmsVarFile.close()
+		# Set dialog styles
+		Style = """
+			QWidget {
+				background-color: >>Background<<;
+				color: >>ColorInput<<;
+				font: >>Font<<px ">>StandardFont<<";
+			}
 
-	# Generate Flag type
-	AutomaticSectionStartFound = False
-	InAutomaticSection = False
-	AlarmsTypText = ""
-	AlarmsTypPath = FindFilePath(os.path.dirname(ProgramPath), UserData["ProgramName"] + ".typ", True)
-	AlarmsTypFile = open(AlarmsTypPath, "r")
-	for AlarmsTypLine in AlarmsTypFile:
-		if not InAutomaticSection:
-			AlarmsTypText += AlarmsTypLine
-		if (AlarmsTypLine.find("// START OF AUTOMATIC CODE GENERATION //") != -1): # Automatic generation section start
-			AutomaticSectionStartFound = True
-			InAutomaticSection = True
+			QDialog {
+				border: 2px solid >>WindowBorderStandard<<;
+			}
 
-			# Local types generation
-			# Get unique paths
-			UniquePaths = []
-			for Alarm in Alarms:
-				if Alarm["Path"] not in UniquePaths:
-					UniquePaths.append(Alarm["Path"])
+			QLabel {
+				background-color: >>BackgroundOutput<<;
+				color: >>ColorOutput<<;
+				qproperty-alignment: "AlignVCenter | AlignCenter";
+				padding: 5px;
+				border-radius: 8px;
+			}
 
-			LocalTypes = ["\nTYPE\n\tFlagType : STRUCT  (*Flag structure used for edge detection*)"]
-			for UniquePath in UniquePaths:
-				for IndexMember, Member in enumerate(UniquePath):
-					if IndexMember == 0:
-						if not Member["Name"] in LocalTypes[0]:
-							if Member["Array"] != "":
-								TypeFormat = "ARRAY[" + str(Member["Array"][0]) + ".." + str(Member["Array"][1]) + "]OF "
-							else:
-								TypeFormat = ""
-							if (IndexMember + 1) != len(UniquePath):
-								TypeFormat += Member["Type"][:-4] + "FlagType;"
-							else:
-								TypeFormat += Member["Type"] + ";"
-							LocalTypes[0] += "\n\t\t" + Member["Name"] + " : " + TypeFormat
-					else:
-						for IndexType, LocalType in enumerate(LocalTypes):
-							if Member["Array"] != "":
-								TypeFormat = "ARRAY[" + str(Member["Array"][0]) + ".." + str(Member["Array"][1]) + "]OF "
-							else:
-								TypeFormat = ""
-							if (IndexMember + 1) != len(UniquePath):
-								TypeFormat += Member["Type"][:-4] + "FlagType;"
-							else:
-								TypeFormat += Member["Type"] + ";"
-							ParentTypeFormat = Member["ParentType"][:-4] + "FlagType"
-							if ParentTypeFormat + " : STRUCT" in LocalType:
-								if not Member["Name"] + " : " + TypeFormat in LocalTypes[IndexType]:
-									if Member["Array"] != "":
-										LocalTypes[IndexType] += "\n\t\t" + Member["Name"] + " : " + TypeFormat
-									else:
-										LocalTypes[IndexType] += "\n\t\t" + Member["Name"] + " : " + TypeFormat
-								break
-							elif (IndexType + 1) == len(LocalTypes):
-								LocalTypes.append("\n\t" + ParentTypeFormat + " : STRUCT")
-								if Member["Array"] != "":
-									LocalTypes[IndexType + 1] += "\n\t\t" + Member["Name"] + " : " + TypeFormat
-								else:
-									LocalTypes[IndexType + 1] += "\n\t\t" + Member["Name"] + " : " + TypeFormat
-								break
-			if (len(LocalTypes) == 1) and (LocalTypes[0] == "\nTYPE\n\tFlagType : STRUCT"):
-				LocalTypes[0] += "\n\t\tNew_Member : USINT;"
-			for LocalType in LocalTypes:
-				AlarmsTypText += LocalType + "\n\tEND_STRUCT;"
-			AlarmsTypText += "\nEND_TYPE"
+			QPushButton {
+				background-color: #222222;
+				width: >>ButtonWidth<<px;
+				height: >>WidgetHeight<<px;
+				border-style: solid;
+				color: >>ColorInput<<;
+				border-radius: 8px;
+			}
 
-		elif (AlarmsTypLine.find("// END OF AUTOMATIC CODE GENERATION //") != -1): # Automatic generation section end
-			InAutomaticSection = False
-			AlarmsTypText += "\n\n" + AlarmsTypLine
+			QPushButton:hover {
+				color: >>ColorInput<<;
+				background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 rgba(55, 55, 55, 255), stop:0.505682 rgba(55, 55, 55, 255), stop:1 rgba(40, 40, 40, 255));
+			}
 
-	AlarmsTypFile.close()
-	if not AutomaticSectionStartFound:
-		print("Error: Start of automatically generated section not found. Insert comment // START OF AUTOMATIC CODE GENERATION // to Alarms.typ.")
-		TerminateScript()
-	elif InAutomaticSection:
-		print("Error: End of automatically generated section not found. Insert comment // END OF AUTOMATIC CODE GENERATION // to Alarms.typ.")
-		TerminateScript()
-	else:
-		AlarmsTypFile = open(AlarmsTypPath,"w")
-		AlarmsTypFile.write(AlarmsTypText)
-		AlarmsTypFile.close()
+			QPushButton:pressed {
+				background-color: qlineargradient(spread:pad, x1:0.517, y1:0, x2:0.517, y2:1, stop:0 rgba(45, 45, 45, 255), stop:0.505682 rgba(40, 40, 40, 255), stop:1 rgba(45, 45, 45, 255));
+				color: #ffffff;
+			}
+			"""
+		Self.setStyleSheet(FinishStyle(Style))
 
-#####################################################################################################################################################
-# Main
-#####################################################################################################################################################
+		# Set general dialog settings
+		Self.setWindowTitle("Info")
+		Self.setWindowFlag(Qt.FramelessWindowHint)
+		Self.setGeometry(0, 0, 100, 100)
+		Self.setModal(True)
 
-# Get project info
-ProjectName, ProjectPath, LogicalPath = GetProjectInfo()
+		# Create widgets
+		MainVBL = QVBoxLayout(Self)
 
-# Script mode decision
-if LogicalPath == "":
-	# Logical path not found
-	RunMode = MODE_ERROR
+		Self.MessageL = QLabel()
+		MainVBL.addWidget(Self.MessageL)
+		
+		ButtonBoxHBL = QHBoxLayout()
+		Self.OkPB = QPushButton()
+		Self.OkPB.setText("OK")
+		ButtonBoxHBL.addWidget(Self.OkPB)
+		
+		# Show dialog
+		MainVBL.addLayout(ButtonBoxHBL)
 
-elif "-prebuild" in sys.argv:
-	# Argument -prebuild found
-	RunMode = MODE_PREBUILD
+	# Size of the window changed
+	def resizeEvent(Self, Event: QEvent):
+		Self.TitleBar.resize(Self.width(), Self.TitleBar.height())
+		Self.TitleBar.Title.setMinimumWidth(Self.width())
 
-else:
-	# Argument -prebuild not found
-	RunMode = MODE_CONFIGURATION
+# Dialog for displaying error messages
+class ErrorDialog(QDialog):
+	# Initialization of the dialog
+	def __init__(Self, Messages):
+		super(ErrorDialog, Self).__init__()
 
-if not(RunMode == MODE_ERROR):
-	# Get path to user data
-	UserDataPath = os.path.join(os.getenv("APPDATA"), "BR", "Scripts", "CreateAlarms", ProjectName)
-	if not os.path.isdir(os.path.dirname(UserDataPath)):
-		os.makedirs(os.path.dirname(UserDataPath))
+		# Create title bar
+		Self.TitleBar = TitleBar(Self, "Error", "#6e1010", False, False, True)
+		Self.setContentsMargins(0, Self.TitleBar.height(), 0, 0)
 
-	# Load user data
-	try:
-		with open(UserDataPath, "rb") as CreateAlarmsSettings:
-			UserData = pickle.load(CreateAlarmsSettings)
-	except:
-		UserData = {"Configuration":"", "Enable": False, "Debug": False, "UpdateTmx": True, "UpdateMpConfig": True, "UpdateProgram": True, "TmxName": "Alarms", "MpConfigName": "AlarmsCfg", "MpLink": "gAlarmXCore", "ProgramName": "Alarms", "MaxNesting": 15, "AlarmKeyword": {"Error": "Error", "Warning": "Warning", "Info": "Info"}}
+		# Set dialog styles
+		Style = """
+			QWidget {
+				background-color: >>Background<<;
+				color: >>ColorInput<<;
+				font: >>Font<<px ">>StandardFont<<";
+			}
 
-	if (len(UserData) != 12):
-		UserData = {"Configuration":"", "Enable": False, "Debug": False, "UpdateTmx": True, "UpdateMpConfig": True, "UpdateProgram": True, "TmxName": "Alarms", "MpConfigName": "AlarmsCfg", "MpLink": "gAlarmXCore", "ProgramName": "Alarms", "MaxNesting": 15, "AlarmKeyword": {"Error": "Error", "Warning": "Warning", "Info": "Info"}}
+			QDialog {
+				border: 2px solid >>WindowBorderError<<;
+			}
 
-	# Get selected config path
-	ConfigPath = os.path.join(ProjectPath, "Physical", UserData["Configuration"])
+			QLabel {
+				background-color: >>BackgroundOutput<<;
+				color: >>ColorOutput<<;
+				padding: 5px;
+				border-radius: 8px;
+			}
+			"""
+		Self.setStyleSheet(FinishStyle(Style))
+
+		# Set general dialog settings
+		Self.setWindowTitle("Error")
+		Self.setWindowFlag(Qt.FramelessWindowHint)
+		Self.setGeometry(0, 0, 100, 100)
+
+		# Create widgets
+		DialogVBL = QVBoxLayout(Self)
+
+		for Message in Messages:
+			ErrorL = QLabel(Message)
+			ErrorL.setOpenExternalLinks(True)
+			DialogVBL.addWidget(ErrorL)
+	
+		# Show dialog
+		ShowAdjusted(Self)
 
-# Run respective script mode
-if (RunMode == MODE_PREBUILD) and UserData["Enable"]:
-	Prebuild()
+	# Size of the window changed
+	def resizeEvent(Self, Event: QEvent):
+		Self.TitleBar.resize(Self.width(), Self.TitleBar.height())
+		Self.TitleBar.Title.setMinimumWidth(Self.width())
 
-elif not(RunMode == MODE_PREBUILD):
-	# Make application
-	Application = QApplication(sys.argv)
+# Show widget with adjusted size
+def ShowAdjusted(Widget: QWidget):
+	# Adjust window size and position (must be twice to really adjust the size)
+	Widget.adjustSize()
+	Widget.adjustSize()
+	Rectangle = Widget.frameGeometry()
+	CenterPoint = QDesktopWidget().availableGeometry().center()
+	Rectangle.moveCenter(CenterPoint)
+	Widget.move(Rectangle.topLeft())
+	Widget.show()
 
-	# Get size ratio (get the width of the screen and divide it by 1920, because that's the size for which this GUI was designed)
-	gSizeRatio = Application.primaryScreen().availableGeometry().width() / 1920
-	# Calculate adjusted sizes
+# Finish style with defined constants
+def FinishStyle(Style: str):
+	Style = Style.replace(">>StandardFont<<", DEFAULT_GUI_FONT)
 	for DefaultSizeElement in DEFAULT_GUI_SIZE:
-		gAdjustedGuiSize[DefaultSizeElement] = str(DEFAULT_GUI_SIZE[DefaultSizeElement] * gSizeRatio)[:str(DEFAULT_GUI_SIZE[DefaultSizeElement] * gSizeRatio).find(".")]
-
-	if RunMode == MODE_CONFIGURATION:
-		# Load configurations name
-		ConfigName = []
-		ConfigPath = os.path.dirname(os.path.abspath(__file__))
-		if (ConfigPath.find("Logical") != -1):
-			ConfigPath = ConfigPath[:ConfigPath.find("Logical")]
-			for Physical in os.listdir(ConfigPath):
-				if (Physical.find("Physical") != -1):
-					ConfigPath += "Physical"
-					for Config in os.listdir(ConfigPath):
-						if not(Config.endswith(".pkg")):
-							ConfigName.append(Config)
-					break
-		
-		Window = MainWindow()
+		Style = Style.replace(">>" + DefaultSizeElement + "<<", gAdjustedGuiSize[DefaultSizeElement])
+	for DefaultColorElement in DEFAULT_GUI_COLOR:
+		Style = Style.replace(">>" + DefaultColorElement + "<<", DEFAULT_GUI_COLOR[DefaultColorElement])
+	return Style
 
-	elif RunMode == MODE_ERROR:
-		Window = ErrorDialog(["Directory Logical not found. Please copy this script to the LogicalView of your project."])
-		
-	sys.exit(Application.exec())
+#####################################################################################################################################################
+# Main GUI
+#####################################################################################################################################################
+# Make application
+Application = QApplication(sys.argv)
+
+# Get size ratio (get the width of the screen and divide it by 1920, because that's the size for which this GUI was designed)
+gSizeRatio = Application.primaryScreen().availableGeometry().width() / 1920
+# Calculate adjusted sizes
+for DefaultSizeElement in DEFAULT_GUI_SIZE:
+	gAdjustedGuiSize[DefaultSizeElement] = str(DEFAULT_GUI_SIZE[DefaultSizeElement] * gSizeRatio)[:str(DEFAULT_GUI_SIZE[DefaultSizeElement] * gSizeRatio).find(".")]
+
+if RunMode == MODE_CONFIGURATION:
+	# Load configurations name
+	ConfigName = []
+	ConfigPath = os.path.dirname(os.path.abspath(__file__))
+	if (ConfigPath.find("Logical") != -1):
+		ConfigPath = ConfigPath[:ConfigPath.find("Logical")]
+		for Physical in os.listdir(ConfigPath):
+			if (Physical.find("Physical") != -1):
+				ConfigPath += "Physical"
+				for Config in os.listdir(ConfigPath):
+					if not(Config.endswith(".pkg")):
+						ConfigName.append(Config)
+				break
+	
+	Window = MainWindow()
+
+elif RunMode == MODE_ERROR:
+	Window = ErrorDialog(["Directory Logical not found. Please copy this script to the LogicalView of your project."])
+	
+sys.exit(Application.exec())
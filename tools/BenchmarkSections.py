@@ -0,0 +1,36 @@
+#####################################################################################################################################################
+# Benchmark of the generation of the automatic section of the Alarms program
+#
+#   Usage:      python BenchmarkSections.py [path to CreateAlarms.py]
+#
+#   Generates Errors, Warnings and Infos sections with 12500, 25000 and 50000 alarms in ST and C and prints the time of the generation.
+#   The time has to grow linearly with the number of alarms (doubling the alarms doubles the time).
+#####################################################################################################################################################
+
+import os, sys, time, copy
+
+# Functions of the script are loaded without its main part and the GUI
+ScriptPath = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "CreateAlarms.py")
+with open(ScriptPath, "r", encoding = "utf-8") as ScriptFile:
+	ScriptLines = ScriptFile.read().splitlines()
+MainLine = next(Index for Index, Line in enumerate(ScriptLines) if Line.strip() == "# Main")
+Script = {}
+exec(compile("\n".join(ScriptLines[:MainLine - 1]), ScriptPath, "exec"), Script)
+Script["UserData"] = copy.deepcopy(Script["DEFAULT_USER_DATA"])
+
+# Alarms of all kinds: simple, in arrays, persistent and edge
+ALARMS = [({"Path": [{"Name": "gMachine", "Array": ""}, {"Name": "Error", "Array": ""}], "Variable": "EmergencyStop", "Array": ""}, True),
+		  ({"Path": [{"Name": "gMachine", "Array": ""}, {"Name": "Error", "Array": ""}], "Variable": "DoorOpen", "Array": [0, 2]}, False),
+		  ({"Path": [{"Name": "gLine", "Array": [0, 9]}, {"Name": "Error", "Array": ""}], "Variable": "Overload", "Array": ""}, True),
+		  ({"Path": [{"Name": "gLine", "Array": [0, 9]}, {"Name": "Error", "Array": ""}], "Variable": "Sensor", "Array": [1, 4]}, False)]
+
+for NumberOfAlarms in (12500, 25000, 50000):
+	for ProgramLanguage in (Script["LANGUAGE_ST"], Script["LANGUAGE_C"]):
+		AlarmGroups = {"Error": {}, "Warning": {}, "Info": {}}
+		for Index in range(NumberOfAlarms):
+			AlarmGroups[("Error", "Warning", "Info")[Index % 3]][Index] = [ALARMS[Index % len(ALARMS)]]
+		NameTable = {"Alarms": [], "Size": 0, "Length": 1}
+		StartTime = time.perf_counter()
+		SectionText, MaxNumberOfForLoops = Script["CreateSections"](AlarmGroups, ("Error", "Warning", "Info"), ProgramLanguage, NameTable, "\t")
+		Text = "".join(SectionText)
+		print(str(NumberOfAlarms) + " alarms, " + ("C" if ProgramLanguage == Script["LANGUAGE_C"] else "ST") + ": " + str(round(time.perf_counter() - StartTime, 2)) + " s, " + str(len(Text)) + " characters")
@@ -0,0 +1,38 @@
+#####################################################################################################################################################
+# Benchmark of the update of the TMX file
+#
+#   Usage:      python BenchmarkTmx.py [path to CreateAlarms.py]
+#
+#   Updates TMX files with 125000, 250000, 500000 and 1000000 tuids, half of them are alarms of the project and half of them are obsolete alarms
+#   which are removed, and prints the time of the update.
+#   The time has to grow linearly with the number of tuids (doubling the tuids doubles the time).
+#####################################################################################################################################################
+
+import os, sys, time, copy, tempfile, contextlib
+
+# Functions of the script are loaded without its main part and the GUI
+ScriptPath = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "CreateAlarms.py")
+with open(ScriptPath, "r", encoding = "utf-8") as ScriptFile:
+	ScriptLines = ScriptFile.read().splitlines()
+MainLine = next(Index for Index, Line in enumerate(ScriptLines) if Line.strip() == "# Main")
+Script = {}
+exec(compile("\n".join(ScriptLines[:MainLine - 1]), ScriptPath, "exec"), Script)
+Script["UserData"] = copy.deepcopy(Script["DEFAULT_USER_DATA"])
+
+with tempfile.TemporaryDirectory() as LogicalPath:
+	Script["LogicalPath"] = LogicalPath
+	TmxPath = os.path.join(LogicalPath, Script["UserData"]["TmxName"] + ".tmx")
+	for NumberOfTuids in (125000, 250000, 500000, 1000000):
+		# Alarms of the project are one array, existing and obsolete tuids alternate in the file
+		Script["Alarms"] = [{"Path": [{"Name": "gAlarms", "Array": ""}], "Variable": "Alarm", "Array": [0, NumberOfTuids // 2 - 1]}]
+		with open(TmxPath, "w", encoding = "utf-8") as TmxFile:
+			TmxFile.write("<?xml version=\"1.0\" encoding=\"utf-8\"?>\n<tmx version=\"1.4\">\n  <header creationtool=\"B&amp;R Automation Studio\" creationtoolversion=\"4.2\" datatype=\"unknown\" segtype=\"sentence\" adminlang=\"en\" srclang=\"en\" o-tmf=\"TMX\" />\n  <body>\n")
+			for Index in range(NumberOfTuids // 2):
+				for Variable in ("gAlarms", "gObsolete"):
+					TmxFile.write("    <tu tuid=\"" + Variable + ".Alarm[" + str(Index) + "]\">\n      <tuv xml:lang=\"en\">\n        <seg>Alarm " + str(Index) + "</seg>\n      </tuv>\n    </tu>\n")
+			TmxFile.write("  </body>\n</tmx>\n")
+		Size = os.path.getsize(TmxPath)
+		StartTime = time.perf_counter()
+		with open(os.devnull, "w") as NullFile, contextlib.redirect_stdout(NullFile):
+			Script["UpdateTmx"]()
+		print(str(NumberOfTuids) + " tuids, " + str(round(Size / 1000000, 1)) + " MB: " + str(round(time.perf_counter() - StartTime, 2)) + " s, " + str(os.path.getsize(TmxPath)) + " bytes left")